@@ -2,8 +2,15 @@ from abc import ABC, abstractmethod
 
 import pandas as pd
 
+from analysis.core.formats import Filters
+
 
 class DataLoader(ABC):
     @abstractmethod
-    def load(self, input_path: str) -> pd.DataFrame:
+    def load(
+        self,
+        input_path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
         pass
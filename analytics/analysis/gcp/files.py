@@ -1,6 +1,13 @@
 import gcsfs
 import pandas as pd
 
+from analysis.core.formats import (
+    Filters,
+    artifact_blob,
+    read_csv,
+    read_parquet,
+    to_parquet,
+)
 from analysis.core.settings import SETTINGS
 
 
@@ -36,9 +43,34 @@ class GCS:
             ls = [blob.split("/")[-1] for blob in self.fs.ls(bucket)]
         return ls
 
-    def read_csv(self, path: str) -> pd.DataFrame:
-        load = f"gs://{path}"
-        return pd.read_csv(load, storage_options=self.storage_options)
+    def exists(self, path: str) -> bool:
+        return self.fs.exists(path)
+
+    def read_csv(
+        self,
+        path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        with self.fs.open(path, "rb") as f:
+            return read_csv(f, columns=columns, filters=filters)
+
+    def read_parquet(
+        self,
+        path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        with self.fs.open(artifact_blob(path, "parquet"), "rb") as f:
+            return read_parquet(f, columns=columns, filters=filters)
+
+    def write_csv(self, df: pd.DataFrame, path: str) -> None:
+        with self.fs.open(artifact_blob(path, "csv"), "w") as f:
+            df.to_csv(f, index=False)
+
+    def write_parquet(self, df: pd.DataFrame, path: str) -> None:
+        with self.fs.open(artifact_blob(path, "parquet"), "wb") as f:
+            f.write(to_parquet(df))
 
 
 gcs = GCS()
@@ -1,9 +1,29 @@
 import pandas as pd
 
 from analysis.base.data_loader import DataLoader
+from analysis.core.formats import Filters, artifact_blob
 from analysis.gcp.files import gcs
 
 
 class CSVLoader(DataLoader):
-    def load(self, input_path: str) -> pd.DataFrame:
-        return gcs.read_csv(input_path)
+    def load(
+        self,
+        input_path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        return gcs.read_csv(input_path, columns=columns, filters=filters)
+
+
+class ParquetLoader(DataLoader):
+    """Loads the parquet copy of an artifact, or its csv when none was written."""
+
+    def load(
+        self,
+        input_path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        if gcs.exists(artifact_blob(input_path, "parquet")):
+            return gcs.read_parquet(input_path, columns=columns, filters=filters)
+        return gcs.read_csv(input_path, columns=columns, filters=filters)
@@ -5,7 +5,17 @@ import joblib
 import pandas as pd
 from google.cloud import storage
 
+from analysis.core.formats import (
+    ARTIFACT_FORMAT,
+    PARQUET_CONTENT_TYPE,
+    Filters,
+    artifact_blob,
+    read_csv,
+    read_parquet,
+    to_parquet,
+)
 from analysis.core.settings import SETTINGS
+from analysis.gcp.backends import StorageBackend, get_backend
 from analysis.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,20 +29,19 @@ class GCP:
     bucket_project: str = SETTINGS["GOOGLE_CLOUD_PROJECT"]
     json_creds_path: str = SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"]
 
+    @property
+    def backend(self) -> StorageBackend:
+        """Process-wide storage backend, shared by every GCP instance."""
+        return get_backend()
+
     def get_gcp_bucket(self, bucket_name: str) -> storage.Bucket:
-        """Get the GCP bucket object.
+        """Get the GCP bucket object, cached per thread by the backend.
 
         Returns:
             storage.Bucket: GCP bucket object
         """
         try:
-            logger.info("Getting GCP bucket")
-            storage_client = storage.Client.from_service_account_json(
-                json_credentials_path=self.json_creds_path, project=self.bucket_project
-            )
-            bucket = storage_client.get_bucket(bucket_name)
-            logger.info("GCP bucket retrieved")
-            return bucket
+            return self.backend.bucket(bucket_name)
         except Exception as e:
             logger.error(f"Error getting GCP bucket: {e}")
 
@@ -45,12 +54,8 @@ class GCP:
             blob_name (str): name of blob in bucket
             model (dict[str, Any]): dictionary of model information
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
         logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        with blob.open("wb") as f:
+        with self.backend.open(bucket_name, blob_name, "wb") as f:
             joblib.dump(model, f)
         # logger.info(f"{model['model']} has been saved to {blob_name}")
         #
@@ -66,72 +71,80 @@ class GCP:
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
+        if not self.backend.exists(bucket_name, blob_name):
             return None
 
-        with blob.open("rb") as f:
+        with self.backend.open(bucket_name, blob_name, "rb") as f:
             return joblib.load(f)
 
     def read_df_from_bucket(
-        self, bucket_name: str, blob_name: str
+        self,
+        bucket_name: str,
+        blob_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ) -> pd.DataFrame | None:
-        """Reads a file from the bucket.
+        """Reads a dataframe artifact from the bucket, preferring its parquet copy.
+
+        Writing an artifact removes its copy in the other format, so an older
+        twin never shadows the latest write.
 
         Args:
             blob_name (str): name of blob in bucket
+            columns (list[str] | None, optional): columns to load. Defaults to None.
+            filters (Filters | None, optional): predicates rows must satisfy,
+                pushed down to parquet row groups. Defaults to None.
 
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
-            return None
-
-        with blob.open("rb") as f:
-            return pd.read_csv(f)
+        readers = {"parquet": read_parquet, "csv": read_csv}
+        for fmt, reader in readers.items():
+            blob = artifact_blob(blob_name, fmt)
+            if self.backend.exists(bucket_name, blob):
+                with self.backend.open(bucket_name, blob, "rb") as f:
+                    return reader(f, columns=columns, filters=filters)
+        return None
 
     def write_df_to_bucket(
-        self, data: pd.DataFrame, bucket_name: str, blob_name: str
+        self,
+        data: pd.DataFrame,
+        bucket_name: str,
+        blob_name: str,
+        fmt: str = ARTIFACT_FORMAT,
     ) -> None:
-        """Writes a file to the bucket.
+        """Writes a dataframe artifact to the bucket.
 
         Args:
-            bucket_name (str): name of bucket
-            blob_name (str): name of new blob
             data (pd.DataFrame): dataframe to write to blob
+            bucket_name (str): name of bucket
+            blob_name (str): name of new blob, its suffix is replaced by `fmt`
+            fmt (str, optional): "parquet" or "csv". Defaults to ARTIFACT_FORMAT.
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
-        logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
+        blob_name = artifact_blob(blob_name, fmt)
+        logger.info(f"Uploading dataframe to {blob_name}")
+        if fmt == "parquet":
+            self.backend.upload(
+                bucket_name, blob_name, to_parquet(data), PARQUET_CONTENT_TYPE
+            )
+        else:
+            self.backend.upload(
+                bucket_name, blob_name, data.to_csv(index=False), "text/csv"
+            )
+        # a stale copy in the other format would shadow or outlive this one
+        stale = artifact_blob(blob_name, "csv" if fmt == "parquet" else "parquet")
+        self.backend.delete(bucket_name, stale)
 
-        logger.info(f"Uploading dataframe to {blob_name} as a .csv file")
-        blob.upload_from_string(data.to_csv(index=False), "text/csv")
-        
     def write_df_to_bucket_parquet(
         self, data: pd.DataFrame, bucket_name: str, blob_name: str
     ) -> None:
-        """Writes a file to the bucket.
+        """Writes a dataframe to the bucket as parquet.
 
         Args:
             bucket_name (str): name of bucket
             blob_name (str): name of new blob
             data (pd.DataFrame): dataframe to write to blob
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
-        logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        logger.info(f"Uploading dataframe to {blob_name} as a .parquet file")
-        # blob.upload_from_string(data.to_parquet(index=False), "application/octet-stream")
-        with blob.open("wb") as f:
-            data.to_parquet(f)
-
+        self.write_df_to_bucket(data, bucket_name, blob_name, fmt="parquet")
 
 gcp = GCP()
@@ -2,7 +2,7 @@ from typing import Callable
 
 from sklearn.model_selection import KFold
 
-from analysis.gcp.loader import CSVLoader
+from analysis.gcp.loader import ParquetLoader
 from analysis.src_forwards.cross_validate import CrossValidate
 from analysis.src_forwards.models import forwards_pipeline, regressors
 from analysis.src_forwards.preprocessing.pipeline import forwards_preprocessor
@@ -10,7 +10,7 @@ from analysis.src_forwards.preprocessing.pipeline import forwards_preprocessor
 
 class ForwardsTrain:
     INPUT = "wage_vals_stats/forwards.csv"
-    LOADER = CSVLoader()
+    LOADER = ParquetLoader()
     CV = CrossValidate(
         metric="neg_mean_absolute_error",
         method=KFold(n_splits=5, shuffle=True, random_state=42),
@@ -1,6 +1,6 @@
 from rich import print
 
-from analysis.gcp.loader import CSVLoader
+from analysis.gcp.loader import ParquetLoader
 from analysis.gcp.saver import ParquetSaver
 from analysis.src_forwards.models import forwards_pipeline, regressors
 from analysis.src_forwards.preprocessing.pipeline import forwards_preprocessor
@@ -13,7 +13,7 @@ def main() -> None:
         sklearn_pipeline=forwards_pipeline,
         models=regressors.models,
         tester=Predict(),
-        loader=CSVLoader(),
+        loader=ParquetLoader(),
         saver=ParquetSaver(),
     )
 
@@ -6,6 +6,7 @@ import pandas as pd
 from google.cloud import storage
 
 from app.core.settings import SETTINGS
+from app.gcp.backends import StorageBackend, get_backend
 from app.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,20 +20,19 @@ class GCP:
     bucket_project: str = SETTINGS["APP_BACKEND_GCP_PROJECT"]
     json_creds_path: str = SETTINGS["APP_BACKEND_GCP_SERVICE_ACCOUNT_JSON_PATH"]
 
+    @property
+    def backend(self) -> StorageBackend:
+        """Process-wide storage backend, shared by every GCP instance."""
+        return get_backend()
+
     def get_gcp_bucket(self, bucket_name: str) -> storage.Bucket:
-        """Get the GCP bucket object.
+        """Get the GCP bucket object, cached per thread by the backend.
 
         Returns:
             storage.Bucket: GCP bucket object
         """
         try:
-            logger.info("Getting GCP bucket")
-            storage_client = storage.Client.from_service_account_json(
-                json_credentials_path=self.json_creds_path, project=self.bucket_project
-            )
-            bucket = storage_client.get_bucket(bucket_name)
-            logger.info("GCP bucket retrieved")
-            return bucket
+            return self.backend.bucket(bucket_name)
         except Exception as e:
             logger.error(f"Error getting GCP bucket: {e}")
 
@@ -45,12 +45,8 @@ class GCP:
             blob_name (str): name of blob in bucket
             model (dict[str, Any]): dictionary of model information
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
         logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        with blob.open("wb") as f:
+        with self.backend.open(bucket_name, blob_name, "wb") as f:
             joblib.dump(model, f)
         logger.info(f"{model['model']} has been saved to {blob_name}")
 
@@ -65,13 +61,10 @@ class GCP:
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
+        if not self.backend.exists(bucket_name, blob_name):
             return None
 
-        with blob.open("rb") as f:
+        with self.backend.open(bucket_name, blob_name, "rb") as f:
             return joblib.load(f)
 
     def read_df_from_bucket(
@@ -85,13 +78,10 @@ class GCP:
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
+        if not self.backend.exists(bucket_name, blob_name):
             return None
 
-        with blob.open("rb") as f:
+        with self.backend.open(bucket_name, blob_name, "rb") as f:
             return pd.read_csv(f)
 
     def read_df_from_bucket_parquet(
@@ -105,13 +95,10 @@ class GCP:
         Returns:
             pd.DataFrame: dataframe of blob contents
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
+        if not self.backend.exists(bucket_name, blob_name):
             return None
 
-        with blob.open("rb") as f:
+        with self.backend.open(bucket_name, blob_name, "rb") as f:
             return pd.read_parquet(f)
 
     def write_df_to_bucket(
@@ -124,13 +111,10 @@ class GCP:
             blob_name (str): name of new blob
             data (pd.DataFrame): dataframe to write to blob
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
-        logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
         logger.info(f"Uploading dataframe to {blob_name} as a .csv file")
-        blob.upload_from_string(data.to_csv(index=False), "text/csv")
+        self.backend.upload(
+            bucket_name, blob_name, data.to_csv(index=False), "text/csv"
+        )
 
 
 gcp = GCP()
@@ -1,3 +1,4 @@
+import re
 import pandas as pd
 from io import StringIO
 from feature_pipeline.utilities.utils import get_logger
@@ -46,6 +47,12 @@ seasons: list[str] = [
 
 comp_ids: list[int] = [9, 11, 12, 20, 13]
 
+# repeated header rows that fbref inserts into the table body every 25 players
+THEAD_ROW = re.compile(r"<tr[^>]*\bclass=\"[^\"]*\bthead\b[^>]*>.*?</tr>", re.S)
+THEAD_CLASS = re.compile(r"\bclass=\"[^\"]*\bthead\b")
+ROW_TAG = re.compile(r"<tr\b[^>]*>")
+CELL_TAG = re.compile(r"<t[hd]\b")
+
 comp_names: list[str] = [
     "Premier-League",
     "Serie-A",
@@ -88,6 +95,67 @@ class Urls:
         return f"https://fbref.com/en/comps/{comp_id}/{season}/wages/{season}-{comp_name}-Wages#player_wages"
 
 
+def find_table(html: str, table_id: str) -> str:
+    """Find the html of a single table by id. Tables that fbref hides inside
+    html comments are found as well, since the raw text is searched.
+
+    Args:
+        html (str): page html
+        table_id (str): table id, e.g. stats_standard or player_wages
+
+    Raises:
+        ValueError: if the table is not in the page
+
+    Returns:
+        str: html of the table
+    """
+    match = re.search(rf'<table\b[^>]*\bid="{re.escape(table_id)}"', html)
+    if match is None:
+        raise ValueError(f"Table {table_id} not found in page")
+    end = html.find("</table>", match.start())
+    if end == -1:
+        raise ValueError(f"Table {table_id} is not closed")
+    return html[match.start() : end + len("</table>")]
+
+
+def extract_table(html: str, table_id: str, stats: bool = True) -> pd.DataFrame:
+    """Parse a single fbref table into a dataframe.
+
+    Only the requested table is parsed. For stats tables the over header is
+    skipped and the header rows repeated in the body are dropped before parsing,
+    keeping each player row's original position as its index.
+
+    Args:
+        html (str): page html
+        table_id (str): table id, e.g. stats_standard or player_wages
+        stats (bool, optional): parse as a player stats table. Defaults to True.
+
+    Returns:
+        pd.DataFrame: pandas dataframe of the table
+    """
+    table = find_table(html, table_id)
+    if not stats:
+        return pd.read_html(StringIO(table))[0]
+
+    head, sep, body = table.partition("<tbody>")
+    if not sep:
+        return pd.read_html(StringIO(table), skiprows=1, header=0)[0]
+
+    rows = ROW_TAG.findall(body)
+    positions = [i for i, row in enumerate(rows) if not THEAD_CLASS.search(row)]
+    body = THEAD_ROW.sub("", body)
+
+    # keep cells as text, as they were when header rows were parsed with the data
+    first_row = body.split("</tr>", 1)[0]
+    converters = {i: str for i in range(len(CELL_TAG.findall(first_row)))}
+    df = pd.read_html(
+        StringIO(head + sep + body), skiprows=1, header=0, converters=converters
+    )[0]
+    if len(positions) == len(df):
+        df.index = positions
+    return df
+
+
 def get_data(url: str) -> pd.DataFrame:
     """Scraper for fbref.com data
 
@@ -99,12 +167,11 @@ def get_data(url: str) -> pd.DataFrame:
     """
     resp = get_url_data(url=url)
 
-    html = StringIO(resp.text)
-
     if "wages" in url:
-        return pd.read_html(html)[1]
+        return extract_table(resp.text, "player_wages", stats=False)
     else:
-        return pd.read_html(html, skiprows=1, header=0)[0]
+        table = url.rsplit("#", 1)[-1]
+        return extract_table(resp.text, table)
 
 
 url_handler = Urls()
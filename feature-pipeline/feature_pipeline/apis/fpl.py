@@ -1,13 +1,27 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+from typing import Any
 import httpx
 import pandas as pd
 from rich import print
 from httpx import Response
-from feature_pipeline.etl.fpl.src.validation import PlayerInfo
+from feature_pipeline.core.settings import SETTINGS, SOURCE
+from feature_pipeline.etl.fpl.src.validation import PlayerInfo, validate_frame
+from feature_pipeline.scraper.session import get_client
+from feature_pipeline.utilities.rate_limit import TokenBucket
 from feature_pipeline.utilities.utils import get_logger
 
 BASE = "https://fantasy.premierleague.com/api"
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 TEAMS = "https://fantasy.premierleague.com/api/bootstrap-static/"
 FIXTURES = "https://fantasy.premierleague.com/api/fixtures/"
+BOOTSTRAP_CACHE = SOURCE / "data" / "fpl" / "bootstrap_static.json"
+BOOTSTRAP_TTL = float(SETTINGS.get("FPL_BOOTSTRAP_TTL", 6 * 60 * 60))
 
 logger = get_logger(__name__)
 
@@ -19,14 +33,116 @@ def api_handler(endpoint: str) -> Response:
         endpoint (str): endpoint to fantasy premier league API.
 
     Returns:
-        Response: Response object.
+        Response: Response object, or None if the request failed or returned an
+            error status.
     """
     try:
-        r = httpx.get(f"{BASE}/{endpoint}/")
+        r = get_client("fpl").get(f"{BASE}/{endpoint}/")
         r.raise_for_status()
         return r.json()
-    except httpx.RequestError as req_err:
-        logger.error(f"HTTP Request Error: {req_err}")
+    except httpx.HTTPError as http_err:
+        logger.error(f"HTTP Error: {http_err}")
+
+
+@dataclass
+class BootstrapSnapshot:
+    """Snapshot of the `bootstrap-static` payload shared by every helper in a run."""
+
+    data: dict[str, Any]
+    fetched_at: float
+
+    @property
+    def elements(self) -> list[dict[str, Any]]:
+        return self.data["elements"]
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        return self.data.get("events", [])
+
+    @cached_property
+    def teams(self) -> pd.DataFrame:
+        return pd.DataFrame(self.data["teams"])
+
+    def is_stale(self, ttl: float = BOOTSTRAP_TTL) -> bool:
+        """Check whether the snapshot is older than `ttl` seconds or the next
+        gameweek deadline has passed since it was fetched.
+
+        Args:
+            ttl (float, optional): time to live in seconds. Defaults to BOOTSTRAP_TTL.
+
+        Returns:
+            bool: True if the snapshot should be fetched again.
+        """
+        if time.time() - self.fetched_at > ttl:
+            return True
+        next_event = next((e for e in self.events if e.get("is_next")), None)
+        if next_event is None or not next_event.get("deadline_time"):
+            return False
+        deadline = datetime.fromisoformat(next_event["deadline_time"])
+        return datetime.now(timezone.utc) >= deadline
+
+    def save(self, path: Path = BOOTSTRAP_CACHE) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"fetched_at": self.fetched_at, "data": self.data}, f)
+
+    @classmethod
+    def load(cls, path: Path = BOOTSTRAP_CACHE) -> "BootstrapSnapshot | None":
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            return cls(data=cached["data"], fetched_at=cached["fetched_at"])
+        except (json.JSONDecodeError, KeyError) as err:
+            logger.warning(f"Ignoring unreadable bootstrap cache {path}: {err}")
+            return None
+
+
+_snapshot: BootstrapSnapshot | None = None
+
+
+def get_bootstrap(
+    refresh: bool = False, ttl: float = BOOTSTRAP_TTL, path: Path = BOOTSTRAP_CACHE
+) -> BootstrapSnapshot:
+    """Get the `bootstrap-static` snapshot, fetching it at most once per run.
+
+    The snapshot is memoized in memory and persisted to `path`, so reruns within
+    `ttl` seconds on the same gameweek do not touch the network.
+
+    Args:
+        refresh (bool, optional): force a new download. Defaults to False.
+        ttl (float, optional): time to live in seconds. Defaults to BOOTSTRAP_TTL.
+        path (Path, optional): on-disk cache location. Defaults to BOOTSTRAP_CACHE.
+
+    Returns:
+        BootstrapSnapshot: bootstrap-static snapshot.
+    """
+    global _snapshot
+
+    if not refresh:
+        if _snapshot is not None and not _snapshot.is_stale(ttl):
+            return _snapshot
+
+        cached = BootstrapSnapshot.load(path)
+        if cached is not None and not cached.is_stale(ttl):
+            logger.info(f"Using cached bootstrap-static snapshot from {path}")
+            _snapshot = cached
+            return _snapshot
+
+    logger.info("Fetching bootstrap-static snapshot from the API")
+    data = api_handler("bootstrap-static")
+    if data is None:
+        stale = _snapshot or BootstrapSnapshot.load(path)
+        if stale is None:
+            raise RuntimeError("Unable to fetch bootstrap-static from the FPL API")
+        logger.warning("Falling back to stale bootstrap-static snapshot")
+        _snapshot = stale
+        return _snapshot
+
+    _snapshot = BootstrapSnapshot(data=data, fetched_at=time.time())
+    _snapshot.save(path)
+    return _snapshot
 
 
 def get_player_ids() -> list[dict[str, int | str]] | None:
@@ -35,30 +151,85 @@ def get_player_ids() -> list[dict[str, int | str]] | None:
     Returns:
         list[dict[str, int | str]] | None: List of player ids.
     """
-    try:
-        endpoint = "bootstrap-static"
-        data = api_handler(endpoint)["elements"]
-        return [PlayerInfo(**stat).model_dump() for stat in data]
-    except httpx.RequestError as req_err:
-        logger.error(f"HTTP Request Error: {req_err}")
+    data = pd.DataFrame(get_bootstrap().elements)
+    return validate_frame(data, PlayerInfo).to_dict("records")
+
 
+def get_player_minutes() -> dict[int, int]:
+    """Get season minutes played per player from the bootstrap-static snapshot.
 
-def players_api(player_id: str) -> Response | None:
+    Returns:
+        dict[int, int]: dictionary with player id as key and minutes as value.
+    """
+    return {player["id"]: player["minutes"] for player in get_bootstrap().elements}
+
+
+def players_api(player_id: str, base: str = BASE) -> Response | None:
     """Get player data from the API.
 
     Args:
         player_id (str): player id.
+        base (str, optional): base url of the API. Defaults to BASE.
 
     Returns:
         Response | None: Response object.
     """
     try:
         endpoint = "element-summary"
-        r = httpx.get(f"{BASE}/{endpoint}/{player_id}/")
+        r = get_client("fpl").get(f"{base}/{endpoint}/{player_id}/")
         r.raise_for_status()
         return r.json()["history"]
-    except httpx.RequestError as req_err:
-        logger.error(f"HTTP Request Error: {req_err}")
+    except httpx.HTTPError as http_err:
+        logger.error(f"HTTP Error: {http_err}")
+
+
+async def async_players_api(
+    client: httpx.AsyncClient,
+    player_id: str,
+    limiter: TokenBucket | None = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+    base: str = BASE,
+) -> list[dict] | None:
+    """Get player data from the API asynchronously, retrying transient failures
+    with exponential backoff.
+
+    Args:
+        client (httpx.AsyncClient): async client used to make the request.
+        player_id (str): player id.
+        limiter (TokenBucket | None, optional): rate limiter shared across requests.
+        retries (int, optional): number of retries after the first attempt. Defaults to 3.
+        backoff (float, optional): initial backoff in seconds. Defaults to 1.0.
+        base (str, optional): base url of the API. Defaults to BASE.
+
+    Returns:
+        list[dict] | None: player history or None if every attempt failed.
+    """
+    endpoint = "element-summary"
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            r = await client.get(f"{base}/{endpoint}/{player_id}/")
+            r.raise_for_status()
+            return r.json()["history"]
+        except httpx.HTTPStatusError as status_err:
+            if status_err.response.status_code not in RETRY_STATUS_CODES:
+                logger.error(f"HTTP Status Error for player {player_id}: {status_err}")
+                return None
+            err = status_err
+        except httpx.RequestError as req_err:
+            err = req_err
+
+        if attempt < retries:
+            delay = backoff * 2**attempt
+            logger.warning(
+                f"Request for player {player_id} failed ({err}), retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+
+    logger.error(f"HTTP Request Error for player {player_id} after {retries} retries")
+    return None
 
 
 def get_fixtures_data(endpoint: str = "fixtures") -> pd.DataFrame:
@@ -71,17 +242,13 @@ def get_fixtures_data(endpoint: str = "fixtures") -> pd.DataFrame:
     return pd.DataFrame(fixtures)
 
 
-def get_teams_data(url: str = "bootstrap-static") -> pd.DataFrame:
-    """Get teams data from the API.
-
-    Args:
-        url (str, optional): api url. Defaults to TEAMS.
+def get_teams_data() -> pd.DataFrame:
+    """Get teams data from the bootstrap-static snapshot.
 
     Returns:
         pd.DataFrame: Dataframe with teams data.
     """
-    teams = api_handler(url)
-    return pd.DataFrame(teams["teams"])
+    return get_bootstrap().teams.copy()
 
 
 def map_team_stats(col: str) -> dict[int, str]:
@@ -93,7 +260,7 @@ def map_team_stats(col: str) -> dict[int, str]:
     Returns:
         dict[int, str]: dictionary with team id as key and team stat as value.
     """
-    teams = get_teams_data()
+    teams = get_bootstrap().teams
     # return {k["id"]: k[col] for k in teams}
     return dict(zip(teams["id"], teams[col]))
 
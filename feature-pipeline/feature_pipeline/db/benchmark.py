@@ -0,0 +1,110 @@
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+from sqlalchemy import text
+
+from feature_pipeline.db.database import create_database_connection
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Query:
+    """A typical downstream query against the loaded tables."""
+
+    name: str
+    database: str
+    sql: str
+    params: dict
+
+
+QUERIES = [
+    Query(
+        "fbref stats join for a season",
+        "fbref",
+        "SELECT * FROM standard s JOIN shooting sh USING (player, season, squad) "
+        "WHERE season = :season",
+        {"season": "2022-2023"},
+    ),
+    Query(
+        "fbref squad lookup",
+        "fbref",
+        "SELECT * FROM standard WHERE squad = :squad AND season = :season",
+        {"squad": "Arsenal", "season": "2022-2023"},
+    ),
+    Query(
+        "fpl player history",
+        "fantasy_premier_league",
+        "SELECT * FROM player_stats WHERE player_id = :player_id",
+        {"player_id": 1},
+    ),
+    Query(
+        "fpl gameweek",
+        "fantasy_premier_league",
+        "SELECT * FROM player_stats WHERE season = :season AND gameweek = :gameweek",
+        {"season": "2023-24", "gameweek": 1},
+    ),
+    Query(
+        "transfermarkt valuations with team info",
+        "transfermarkt",
+        "SELECT * FROM premier_league_player_valuations v "
+        "JOIN premier_league_league_data l "
+        "ON l.other_names = v.team AND l.season = v.season "
+        "WHERE v.season = :season",
+        {"season": "2022"},
+    ),
+]
+
+
+def _plan(conn, query: Query) -> dict:
+    explain = text(f"EXPLAIN (ANALYZE, FORMAT JSON) {query.sql}")
+    return conn.execute(explain, query.params).scalar()[0]
+
+
+def _scans(node: dict) -> set[str]:
+    scans = {node["Node Type"]} if "Scan" in node["Node Type"] else set()
+    for child in node.get("Plans", []):
+        scans |= _scans(child)
+    return scans
+
+
+def benchmark_queries(queries: list[Query] = QUERIES, repeat: int = 5) -> pd.DataFrame:
+    """Time the typical join and lookup queries and report the scans they use.
+
+    Run before and after loading into the partitioned, indexed schema to
+    compare full table scans against partition pruning and index scans.
+
+    Args:
+        queries (list[Query], optional): queries to run. Defaults to QUERIES.
+        repeat (int, optional): runs per query. Defaults to 5.
+
+    Returns:
+        pd.DataFrame: mean client-side and server-side time per query in
+        milliseconds, and the scan types in its plan
+    """
+    results = []
+    for query in queries:
+        conn = create_database_connection(query.database)
+        try:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(text(query.sql), query.params).fetchall()
+            elapsed = (time.perf_counter() - start) / repeat
+
+            plan = _plan(conn, query)
+            results.append(
+                {
+                    "query": query.name,
+                    "mean_ms": round(elapsed * 1000, 2),
+                    "execution_ms": plan["Execution Time"],
+                    "scans": ", ".join(sorted(_scans(plan["Plan"]))),
+                }
+            )
+        finally:
+            conn.close()
+
+    report = pd.DataFrame(results)
+    logger.info(f"\n{report.to_string(index=False)}")
+    return report
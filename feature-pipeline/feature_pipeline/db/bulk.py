@@ -0,0 +1,126 @@
+import io
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+from feature_pipeline.db.database import create_database_connection
+from feature_pipeline.db.schema import TableSpec, ensure_table, identifier, quote
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+# marker for missing values in the COPY stream, distinct from empty strings
+NULL = r"\N"
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a bulk load into a single table."""
+
+    table: str
+    rows: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def log_summary(self) -> None:
+        logger.info(
+            f"Upserted {self.rows:,} rows into {self.table} in {self.elapsed:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def _copy(
+    conn: Connection, data: pd.DataFrame, table_name: str, chunksize: int
+) -> None:
+    """Stream a frame into `table_name` with COPY FROM STDIN in CSV format."""
+    cols = ", ".join(quote(col) for col in data.columns)
+    sql = (
+        f"COPY {quote(table_name)} ({cols}) FROM STDIN "
+        f"WITH (FORMAT csv, NULL '{NULL}')"
+    )
+    cursor = conn.connection.cursor()
+    try:
+        for start in range(0, len(data), chunksize):
+            buffer = io.StringIO()
+            data.iloc[start : start + chunksize].to_csv(
+                buffer, index=False, header=False, na_rep=NULL
+            )
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
+    finally:
+        cursor.close()
+
+
+def copy_upsert(
+    data: pd.DataFrame,
+    table_name: str,
+    database: str,
+    spec: TableSpec,
+    chunksize: int = 100_000,
+) -> LoadReport:
+    """Bulk upsert a frame into Postgres on its natural key.
+
+    The target table and any missing partitions are created from `spec` first.
+    Rows are then streamed with COPY into a temporary staging table and merged
+    into the target with INSERT ... ON CONFLICT in a single transaction, so
+    existing rows are updated in place instead of the table being rebuilt.
+
+    Args:
+        data (pd.DataFrame): frame to load
+        table_name (str): target table
+        database (str): database name
+        spec (TableSpec): table layout, including the key the merge conflicts on
+        chunksize (int, optional): rows per COPY chunk. Defaults to 100_000.
+
+    Returns:
+        LoadReport: rows loaded and throughput
+    """
+    start = time.perf_counter()
+    keys = spec.primary_key
+
+    deduped = data.drop_duplicates(subset=keys, keep="last")
+    if len(deduped) < len(data):
+        logger.warning(
+            f"Dropped {len(data) - len(deduped)} rows with duplicate {keys} "
+            f"before loading {table_name}"
+        )
+
+    stage = identifier(f"_stage_{table_name}")
+    cols = ", ".join(quote(col) for col in deduped.columns)
+    conflict = ", ".join(quote(key) for key in keys)
+    updates = ", ".join(
+        f"{quote(col)} = EXCLUDED.{quote(col)}"
+        for col in deduped.columns
+        if col not in keys
+    )
+    action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    merge = (
+        f"INSERT INTO {quote(table_name)} ({cols}) "
+        f"SELECT {cols} FROM {quote(stage)} "
+        f"ON CONFLICT ({conflict}) {action}"
+    )
+
+    conn = create_database_connection(database)
+    try:
+        ensure_table(conn, deduped, table_name, spec)
+        conn.exec_driver_sql(
+            f"CREATE TEMP TABLE {quote(stage)} "
+            f"(LIKE {quote(table_name)} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        _copy(conn, deduped, stage, chunksize)
+        conn.exec_driver_sql(merge)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    report = LoadReport(table_name, len(deduped), time.perf_counter() - start)
+    report.log_summary()
+    return report
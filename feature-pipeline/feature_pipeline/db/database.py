@@ -1,5 +1,9 @@
+import atexit
+import threading
+from dataclasses import dataclass
+
 import psycopg2
-from sqlalchemy.engine import Connection, create_engine
+from sqlalchemy.engine import Connection, Engine, create_engine
 from sqlalchemy_utils.functions import database_exists
 from feature_pipeline.utilities.utils import get_logger
 from feature_pipeline.core.settings import SETTINGS
@@ -8,6 +12,21 @@ from feature_pipeline.core.settings import SETTINGS
 logger = get_logger(__name__)
 
 
+@dataclass
+class EngineConfig:
+    """Connection pool configuration for a shared database engine."""
+
+    pool_size: int = int(SETTINGS.get("DB_POOL_SIZE", 5))
+    max_overflow: int = int(SETTINGS.get("DB_MAX_OVERFLOW", 10))
+    pool_timeout: float = float(SETTINGS.get("DB_POOL_TIMEOUT", 30))
+    pool_recycle: int = int(SETTINGS.get("DB_POOL_RECYCLE", 1800))
+    pool_pre_ping: bool = True
+
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
 def create_db(database_name: str) -> None:
     """Create a database in PostgreSQL.
 
@@ -40,19 +59,62 @@ def create_db(database_name: str) -> None:
         logger.info("---- Connection closed ----")
 
 
+def get_engine(database: str, config: EngineConfig | None = None) -> Engine:
+    """Get the shared, pooled engine for `database`, creating it on first use.
+
+    The database itself is created the first time its engine is requested if
+    it does not exist yet. The config is only used when the engine is created.
+
+    Args:
+        database (str): database name
+        config (EngineConfig | None, optional): pool configuration.
+
+    Returns:
+        Engine: engine shared by every caller using `database`
+    """
+    with _engines_lock:
+        engine = _engines.get(database)
+        if engine is None:
+            config = config or EngineConfig()
+            db = f'{SETTINGS["SQLALCHEMY_DATABASE_URI"]}/{database}'
+            if not database_exists(db):
+                create_db(database)
+
+            logger.info(
+                f"Creating shared engine: {database} (pool_size={config.pool_size}, "
+                f"max_overflow={config.max_overflow})"
+            )
+            engine = create_engine(
+                db,
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+                pool_timeout=config.pool_timeout,
+                pool_recycle=config.pool_recycle,
+                pool_pre_ping=config.pool_pre_ping,
+            )
+            _engines[database] = engine
+        return engine
+
+
 def create_database_connection(database: str) -> Connection:
-    """Create connection to SQL database.
+    """Create connection to SQL database from its shared connection pool.
 
     Returns:
         Connection: Connection to SQL database.
     """
-    db = f'{SETTINGS["SQLALCHEMY_DATABASE_URI"]}/{database}'
-    if database_exists(db):
-        engine = create_engine(db)
-    else:
-        create_db(database)
-        engine = create_engine(db)
-    return engine.connect()
+    return get_engine(database).connect()
+
+
+def dispose_engines() -> None:
+    """Dispose every shared engine and close its pooled connections."""
+    with _engines_lock:
+        for database, engine in _engines.items():
+            engine.dispose()
+            logger.info(f"Disposed shared engine: {database}")
+        _engines.clear()
+
+
+atexit.register(dispose_engines)
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,183 @@
+import hashlib
+import re
+from dataclasses import dataclass
+
+import pandas as pd
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+# postgres truncates identifiers longer than this
+MAX_IDENTIFIER = 63
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Declared layout of a loaded table.
+
+    Args:
+        keys (tuple[str, ...]): natural key the loader merges on
+        indexes (tuple[tuple[str, ...], ...]): extra composite indexes for the
+            columns downstream queries join or filter on
+        partition_key (str | None): column the table is list-partitioned by,
+            or None for a plain table
+    """
+
+    keys: tuple[str, ...]
+    indexes: tuple[tuple[str, ...], ...] = ()
+    partition_key: str | None = "season"
+
+    @property
+    def primary_key(self) -> list[str]:
+        """Natural key, including the partition key as postgres requires."""
+        keys = list(self.keys)
+        if self.partition_key and self.partition_key not in keys:
+            keys.insert(0, self.partition_key)
+        return keys
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def identifier(name: str) -> str:
+    """Shorten a generated identifier to the postgres limit, keeping it unique."""
+    if len(name) <= MAX_IDENTIFIER:
+        return name
+    digest = hashlib.md5(name.encode()).hexdigest()[:8]
+    return f"{name[: MAX_IDENTIFIER - 9]}_{digest}"
+
+
+def partition_name(table_name: str, value: str) -> str:
+    return identifier(f"{table_name}_{re.sub(r'[^0-9A-Za-z]+', '_', str(value))}")
+
+
+def is_partitioned(conn: Connection, table_name: str) -> bool:
+    return conn.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = :name)"
+        ),
+        {"name": table_name},
+    ).scalar()
+
+
+def create_table(
+    conn: Connection, data: pd.DataFrame, table_name: str, spec: TableSpec
+) -> None:
+    """Create the table from the frame's columns with its primary key, declared
+    as partitioned by list on the spec's partition key.
+
+    Args:
+        conn (Connection): database connection
+        data (pd.DataFrame): frame whose columns define the table
+        table_name (str): table to create
+        spec (TableSpec): table layout
+    """
+    ddl = pd.io.sql.get_schema(
+        data.head(0), table_name, keys=spec.primary_key, con=conn
+    ).strip()
+    if spec.partition_key:
+        ddl += f" PARTITION BY LIST ({quote(spec.partition_key)})"
+    logger.info(f"Creating table {table_name} partitioned by {spec.partition_key}")
+    conn.exec_driver_sql(ddl)
+
+
+def attach_partitions(
+    conn: Connection, table_name: str, spec: TableSpec, values: list[str]
+) -> None:
+    """Create the partition for every partition key value that has none yet.
+
+    Args:
+        conn (Connection): database connection
+        table_name (str): partitioned table
+        spec (TableSpec): table layout
+        values (list[str]): partition key values, e.g. seasons
+    """
+    for value in values:
+        literal = "'" + str(value).replace("'", "''") + "'"
+        conn.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {quote(partition_name(table_name, value))} "
+            f"PARTITION OF {quote(table_name)} FOR VALUES IN ({literal})"
+        )
+
+
+def create_indexes(conn: Connection, table_name: str, spec: TableSpec) -> None:
+    """Create the spec's indexes on the table, cascading to every partition."""
+    for columns in spec.indexes:
+        name = identifier(f"ix_{table_name}_{'_'.join(columns)}")
+        cols = ", ".join(quote(col) for col in columns)
+        conn.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table_name)} ({cols})"
+        )
+
+
+def migrate_legacy_table(
+    conn: Connection, data: pd.DataFrame, table_name: str, spec: TableSpec
+) -> None:
+    """Move an unpartitioned table written by earlier runs into the declared layout.
+
+    Rows of the legacy table are copied into their season partitions and the
+    legacy table is dropped. Legacy tables without the partition key column are
+    kept under a `_legacy` suffix.
+
+    Args:
+        conn (Connection): database connection
+        data (pd.DataFrame): frame whose columns define the new table
+        table_name (str): table to migrate
+        spec (TableSpec): table layout
+    """
+    legacy = identifier(f"{table_name}_legacy")
+    logger.info(f"Migrating unpartitioned table {table_name} to partitions")
+    conn.exec_driver_sql(f"ALTER TABLE {quote(table_name)} RENAME TO {quote(legacy)}")
+    create_table(conn, data, table_name, spec)
+
+    legacy_cols = {col["name"] for col in inspect(conn).get_columns(legacy)}
+    if spec.partition_key not in legacy_cols:
+        logger.warning(f"{legacy} has no {spec.partition_key} column, keeping it as is")
+        return
+
+    key = quote(spec.partition_key)
+    values = conn.exec_driver_sql(
+        f"SELECT DISTINCT {key} FROM {quote(legacy)} WHERE {key} IS NOT NULL"
+    ).scalars()
+    attach_partitions(conn, table_name, spec, list(values))
+
+    cols = ", ".join(quote(col) for col in data.columns if col in legacy_cols)
+    conn.exec_driver_sql(
+        f"INSERT INTO {quote(table_name)} ({cols}) SELECT {cols} FROM {quote(legacy)} "
+        f"WHERE {key} IS NOT NULL ON CONFLICT DO NOTHING"
+    )
+    conn.exec_driver_sql(f"DROP TABLE {quote(legacy)}")
+
+
+def ensure_table(
+    conn: Connection, data: pd.DataFrame, table_name: str, spec: TableSpec
+) -> None:
+    """Make sure the table exists in its declared layout and has a partition for
+    every partition key value in `data`, so loading a new season only attaches
+    a partition.
+
+    Args:
+        conn (Connection): database connection
+        data (pd.DataFrame): frame about to be loaded
+        table_name (str): target table
+        spec (TableSpec): table layout
+    """
+    if not inspect(conn).has_table(table_name):
+        create_table(conn, data, table_name, spec)
+    elif spec.partition_key and not is_partitioned(conn, table_name):
+        migrate_legacy_table(conn, data, table_name, spec)
+    elif not inspect(conn).get_pk_constraint(table_name)["constrained_columns"]:
+        cols = ", ".join(quote(key) for key in spec.primary_key)
+        conn.exec_driver_sql(
+            f"ALTER TABLE {quote(table_name)} ADD PRIMARY KEY ({cols})"
+        )
+
+    if spec.partition_key:
+        values = data[spec.partition_key].dropna().astype(str).unique()
+        attach_partitions(conn, table_name, spec, list(values))
+    create_indexes(conn, table_name, spec)
@@ -1,3 +1,4 @@
+import pandas as pd
 from icecream import ic
 from feature_pipeline.etl.fbref.src import extract, transform, load
 from feature_pipeline.apis.fbref import tables, stats, comp_ids, comp_names
@@ -7,29 +8,48 @@ from feature_pipeline.utilities.storage import gcp
 logger = get_logger(__name__)
 
 
-def run_stats_etl() -> None:
-    """Run etl pipeline for fbref player stats"""
+def load_stats(df: pd.DataFrame, stat: str, table: str) -> None:
+    """Transform and load extracted fbref player stats for a single table"""
 
-    logger.info("Beginning fbref player stats etl pipeline")
+    logger.info(f"Transforming data for stat: {stat} and table: {table}")
+    df = transform.player_stats(df=df, table=table)
 
-    for stat, table in zip(stats, tables):
-        logger.info(f"Extracting data for stat: {stat} and table: {table}")
-        df = extract.player_stats(stat=stat, table=table)
+    logger.info(f"Saving data for stat: {stat} and table: {table}")
+    load.to_sql_database(data=df, table_name=table, database="fbref")
 
-        logger.info(f"Transforming data for stat: {stat} and table: {table}")
-        df = transform.player_stats(df=df, table=table)
+    logger.info(
+        f"Data loaded to local Postgres database for stat: {stat} and table: {table}"
+    )
 
-        logger.info(f"Saving data for stat: {stat} and table: {table}")
-        load.to_sql_database(data=df, table_name=table, database="fbref")
+    logger.info(f"Saving data for stat: {stat} and table: {table} to GCP bucket")
+    gcp.write_blob_to_bucket(
+        bucket_name="fbref_db", blob_name=f"{table}.csv", data=df
+    )
 
-        logger.info(
-            f"Data loaded to local Postgres database for stat: {stat} and table: {table}"
-        )
 
-        logger.info(f"Saving data for stat: {stat} and table: {table} to GCP bucket")
-        gcp.write_blob_to_bucket(
-            bucket_name="fbref_db", blob_name=f"{table}.csv", data=df
-        )
+def run_stats_etl(parallel: bool = False) -> None:
+    """Run etl pipeline for fbref player stats
+
+    Args:
+        parallel (bool, optional): scrape all stat pages and seasons in parallel.
+            Tables with failed pages are reported and skipped. Defaults to False.
+    """
+
+    logger.info("Beginning fbref player stats etl pipeline")
+
+    if parallel:
+        frames, report = extract.player_stats_parallel(grid=list(zip(stats, tables)))
+        for stat, table in zip(stats, tables):
+            if (stat, table) not in frames:
+                logger.warning(f"Skipping stat: {stat} and table: {table}")
+                continue
+            load_stats(frames[(stat, table)], stat=stat, table=table)
+        report.log_summary()
+    else:
+        for stat, table in zip(stats, tables):
+            logger.info(f"Extracting data for stat: {stat} and table: {table}")
+            df = extract.player_stats(stat=stat, table=table)
+            load_stats(df, stat=stat, table=table)
 
     logger.info(
         "All fbref stats data loaded to local Postgres database and stored in GCP bucket"
@@ -50,7 +70,12 @@ def run_wages_etl() -> None:
         ic(df)
 
         logger.info(f"Saving wage data for competition: {comp_name}")
-        load.to_sql_database(data=df, table_name=f"{comp_name}-wages", database="fbref")
+        load.to_sql_database(
+            data=df,
+            table_name=f"{comp_name}-wages",
+            database="fbref",
+            spec=load.WAGES_TABLE,
+        )
 
         logger.info(f"Wage data loaded to local Postgres database for {comp_name}")
 
@@ -0,0 +1,107 @@
+import time
+import tracemalloc
+from io import StringIO
+from typing import Callable
+
+import pandas as pd
+
+from feature_pipeline.apis.fbref import extract_table
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+COLUMNS = ["Rk", "Player", "Nation", "Pos", "Squad", "Age", "Born", "MP", "+/-"]
+
+
+def _stats_table(table_id: str, players: int) -> str:
+    header = "<tr>" + "".join(f"<th>{col}</th>" for col in COLUMNS) + "</tr>"
+    repeated = header.replace("<tr>", '<tr class="thead">')
+    rows = []
+    for i in range(1, players + 1):
+        cells = [i, f"Player {i}", "eng ENG", "FW", f"Team {i % 20}", 25, 1999, 30]
+        cells.append(f"+{i % 5}" if i % 2 else f"-{i % 5}")
+        rows.append("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>")
+        if i % 25 == 0 and i < players:
+            rows.append(repeated)
+
+    over = '<tr class="over_header"><th colspan="9">Playing Time</th></tr>'
+    return (
+        f'<table id="{table_id}"><thead>{over}{header}</thead>'
+        f"<tbody>{''.join(rows)}</tbody></table>"
+    )
+
+
+def synthetic_page(players: int = 500, table: str = "standard") -> str:
+    """Stats page shaped like fbref's: the player table, with an over header and
+    a header row repeated every 25 players, followed by visible squad tables and
+    further tables inside html comments.
+
+    Args:
+        players (int, optional): player rows. Defaults to 500.
+        table (str, optional): stats table name. Defaults to "standard".
+
+    Returns:
+        str: page html
+    """
+    stats = _stats_table(f"stats_{table}", players)
+    squads = _stats_table(f"stats_squads_{table}_for", 20)
+    opponents = _stats_table(f"stats_squads_{table}_against", 20)
+    hidden = f"<!-- {_stats_table('stats_keeper', players)} -->"
+    return f"<html><body>{stats}{squads}{opponents}{hidden * 3}</body></html>"
+
+
+def _all_tables(html: str) -> pd.DataFrame:
+    # the original path: parse every visible table, keep the first and drop the
+    # header row fbref repeats after every 25 players by its position
+    df = pd.read_html(StringIO(html), skiprows=1, header=0)[0]
+    return df[(df.index - 25) % 26 != 0]
+
+
+def _measure(
+    parse: Callable[[], pd.DataFrame], repeat: int
+) -> tuple[pd.DataFrame, dict[str, float]]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(repeat):
+        df = parse()
+    wall = (time.perf_counter() - wall) / repeat
+    cpu = (time.process_time() - cpu) / repeat
+
+    # traced separately, since tracing slows parsing down
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, {"wall": wall, "cpu": cpu, "peak_mb": peak / 2**20}
+
+
+def compare_parsers(
+    html: str, table_id: str = "stats_standard", repeat: int = 5
+) -> dict[str, dict[str, float]]:
+    """Check `extract_table` matches the original parser, which parses every
+    visible table on the page and drops every 26th row, and time both.
+
+    Args:
+        html (str): stats page html, e.g. from `synthetic_page` or the raw
+            response cache
+        table_id (str, optional): table id, which must be the first visible
+            table on the page. Defaults to "stats_standard".
+        repeat (int, optional): parses per approach. Defaults to 5.
+
+    Raises:
+        AssertionError: if the approaches produce different dataframes
+
+    Returns:
+        dict[str, dict[str, float]]: mean wall and cpu seconds per page and peak
+            traced memory in MiB for each approach
+    """
+    full, results = _measure(lambda: _all_tables(html), repeat)
+    single, single_results = _measure(lambda: extract_table(html, table_id), repeat)
+    results = {"all_tables": results, "target_table": single_results}
+
+    pd.testing.assert_frame_equal(full, single)
+    for name, result in results.items():
+        logger.info(
+            f"{name}: {result['wall'] * 1000:.1f}ms wall, "
+            f"{result['cpu'] * 1000:.1f}ms cpu, {result['peak_mb']:.1f}MiB peak"
+        )
+    return results
@@ -1,6 +1,7 @@
 import pandas as pd
 from pathlib import Path
 from feature_pipeline.apis.fbref import url_handler, get_data, seasons
+from feature_pipeline.scraper.pool import PoolReport, scrape_all
 from feature_pipeline.utilities.utils import get_logger
 
 
@@ -128,6 +129,81 @@ def player_wages(comp_id: int, comp_name: str) -> pd.DataFrame:
     return df
 
 
+def player_stats_parallel(
+    grid: list[tuple[str, str]],
+    max_workers: int = 8,
+    per_host: int = 2,
+    delay: float = 1.0,
+) -> tuple[dict[tuple[str, str], pd.DataFrame], PoolReport]:
+    """Extract stats for every (stat, table) pair by scraping all
+    (stat, table, season) pages in parallel.
+
+    Each scraped page is pickled as soon as it is parsed, so a rerun after a
+    partial failure only requests the missing pages. A (stat, table) dataframe is
+    only assembled, in season order, once all of its seasons are available.
+
+    Args:
+        grid (list[tuple[str, str]]): (stat, table) pairs to extract
+        max_workers (int, optional): worker threads. Defaults to 8.
+        per_host (int, optional): in-flight requests per host. Defaults to 2.
+        delay (float, optional): politeness delay per host in seconds. Defaults to 1.0.
+
+    Returns:
+        tuple[dict[tuple[str, str], pd.DataFrame], PoolReport]: dataframes for
+        complete (stat, table) pairs and the scrape report
+    """
+    file_dir = Path.cwd() / "feature_pipeline" / "data" / "fbref" / "stats"
+    page_dir = file_dir / "pages"
+    page_dir.mkdir(parents=True, exist_ok=True)
+
+    frames = {}
+    pages = {}
+    tasks = {}
+    for stat, table in grid:
+        path = file_dir / f"{stat}_{table}.pkl"
+        if path.exists():
+            logger.info(f"{path} exists. Reading data from {path}")
+            frames[(stat, table)] = pd.read_pickle(path)
+            continue
+
+        for season in seasons:
+            page = page_dir / f"{stat}_{table}_{season}.pkl"
+            if page.exists():
+                pages[(stat, table, season)] = pd.read_pickle(page)
+            else:
+                url = url_handler.stats(season=season, stat=stat, table=table)
+                tasks[(stat, table, season)] = url
+
+    def save_page(key: tuple[str, str, str], df: pd.DataFrame) -> None:
+        stat, table, season = key
+        df["season"] = season
+        df.to_pickle(page_dir / f"{stat}_{table}_{season}.pkl")
+        pages[key] = df
+
+    logger.info(f"Scraping {len(tasks)} fbref pages in parallel")
+    report = scrape_all(
+        tasks,
+        get_data,
+        max_workers=max_workers,
+        per_host=per_host,
+        delay=delay,
+        on_result=save_page,
+    )
+    report.log_summary()
+
+    for stat, table in grid:
+        if (stat, table) in frames:
+            continue
+        if any((stat, table, season) not in pages for season in seasons):
+            logger.warning(f"Incomplete seasons for {stat} and {table}, skipping")
+            continue
+        df = pd.concat([pages[(stat, table, season)] for season in seasons])
+        df.to_pickle(file_dir / f"{stat}_{table}.pkl")
+        frames[(stat, table)] = df
+
+    return frames, report
+
+
 # if __name__ == "__main__":
 #     wages = 'https://fbref.com/en/comps/20/2022-2023/wages/2022-2023-Bundesliga-Wages#player_wages'
 #     df = pd.read_html(wages)[1]
@@ -1,13 +1,14 @@
 import pandas as pd
-import numpy as np
 import re
+from feature_pipeline.utilities.dtypes import Column, convert
 
 
 # ------------------------ general cleaning functions ------------------------ #
 
 
 def remove_row_headers(df: pd.DataFrame) -> pd.DataFrame:
-    """Removes row headers from dataframe
+    """Removes header rows repeated in the table body from dataframe. Frames
+    parsed with `apis.fbref.extract_table` have none, but older cached extracts do.
 
     Args:
         df (pd.DataFrame): fbref dataframe
@@ -15,7 +16,7 @@ def remove_row_headers(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: fbref dataframe without row headers
     """
-    return df[(df.index - 25) % 26 != 0]
+    return df[df.iloc[:, 0].astype(str) != str(df.columns[0])]
 
 
 def clean_col_names(df: pd.DataFrame) -> pd.DataFrame:
@@ -96,8 +97,7 @@ def float_dtypes(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: fbref dataframe with converted columns
     """
-    df[columns] = df[columns].astype("float16")
-    return df
+    return convert(df, {col: Column("numeric", "float16") for col in columns})
 
 
 def int_types(df: pd.DataFrame, columns: str) -> pd.DataFrame:
@@ -110,12 +110,7 @@ def int_types(df: pd.DataFrame, columns: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: fbref dataframe with converted columns
     """
-    for col in columns:
-        try:
-            df[col] = np.floor(pd.to_numeric(df[col], errors="coerce")).astype("Int32")
-        except ValueError as e:
-            print(e)
-    return df
+    return convert(df, {col: Column("numeric", "Int32") for col in columns})
 
 
 def categorical_dtypes(df: pd.DataFrame) -> pd.DataFrame:
@@ -1,15 +1,27 @@
 import pandas as pd
-from feature_pipeline.db.database import create_database_connection
+from feature_pipeline.db.bulk import LoadReport, copy_upsert
+from feature_pipeline.db.schema import TableSpec
 
+# stats tables are joined on (player, season, squad), which the key indexes
+STATS_TABLE = TableSpec(
+    keys=("player", "season", "squad"), indexes=(("squad", "season"),)
+)
+# wage tables list some players twice in a season, so rank disambiguates them
+WAGES_TABLE = TableSpec(keys=("player", "season", "squad", "rk"))
 
-def to_sql_database(data: pd.DataFrame, table_name: str, database: str) -> None:
-    """Load data into SQL database.
+
+def to_sql_database(
+    data: pd.DataFrame, table_name: str, database: str, spec: TableSpec = STATS_TABLE
+) -> LoadReport:
+    """Bulk upsert data into SQL database on its natural key.
 
     Args:
         data (pd.DataFrame): players data.
         table_name (str): name of table to load data into.
+        database (str): database name.
+        spec (TableSpec, optional): table layout. Defaults to STATS_TABLE.
+
+    Returns:
+        LoadReport: rows loaded and throughput.
     """
-    conn = create_database_connection(database)
-    data.to_sql(table_name, conn, if_exists="replace")
-    
-    
+    return copy_upsert(data, table_name, database=database, spec=spec)
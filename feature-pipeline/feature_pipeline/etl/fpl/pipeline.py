@@ -1,4 +1,6 @@
 from feature_pipeline.etl.fpl.src import extract, transform, load
+from feature_pipeline.etl.fpl.src.watermark import Watermarks
+from feature_pipeline.core.metadata import column_descriptions
 from feature_pipeline.utilities import utils
 from feature_pipeline.utilities.storage import gcp
 
@@ -26,5 +28,42 @@ def run_etl() -> None:
     logger.info("ETL pipeline complete")
 
 
+def run_incremental_etl(featuregroup_version: int = 1) -> None:
+    """Incremental ETL pipeline that only pulls and loads fixtures played since
+    the last run, upserting them on (season, player_id, fixture_id)."""
+    watermarks = Watermarks.load()
+
+    logger.info("Extracting new player data from API")
+    raw, metadata_, minutes = extract.from_api_incremental(watermarks)
+
+    if raw.empty:
+        logger.info("No new fixtures since last run")
+        watermarks.update(raw, minutes)
+        watermarks.save()
+        return
+
+    logger.info(f"Transforming {len(raw)} new rows")
+    data = transform.transform(raw.copy())
+    logger.info("Data transformed")
+
+    logger.info("Upserting data into PostgreSQL database")
+    load.upsert_sql_database(data, "player_stats")
+    logger.info("Data upserted into PostgreSQL database")
+
+    logger.info("Inserting new rows into feature store")
+    load.to_feature_store(data, column_descriptions, featuregroup_version)
+
+    logger.info(metadata_)
+
+    gameweek = int(data["gameweek"].max())
+    logger.info(f"Saving gameweek {gameweek} FPL data to GCP bucket")
+    gcp.write_blob_to_bucket("fpl_db", f"player_stats_gw{gameweek}.csv", data)
+
+    watermarks.update(raw, minutes)
+    watermarks.save()
+
+    logger.info("Incremental ETL pipeline complete")
+
+
 # if __name__ == "__main__":
 #     run_etl()
@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pandas as pd
+from pydantic import BaseModel
+
+from feature_pipeline.apis.fpl import players_api
+from feature_pipeline.utilities.utils import get_logger
+from .extract import from_api_async
+from .validation import PlayerHistory, validate_frame
+
+logger = get_logger(__name__)
+
+
+def synthetic_history(player_id: int, rows: int = 38) -> list[dict]:
+    """Element-summary history rows shaped like the FPL API's.
+
+    Args:
+        player_id (int): player id
+        rows (int, optional): fixtures per player. Defaults to 38.
+
+    Returns:
+        list[dict]: raw player history records
+    """
+    records = []
+    for fixture in range(1, rows + 1):
+        record = {name: fixture % 7 for name in PlayerHistory.model_fields}
+        record.update(
+            element=player_id,
+            fixture=fixture,
+            round=fixture,
+            was_home=fixture % 2 == 0,
+            kickoff_time=f"2023-08-{fixture % 28 + 1:02d}T14:00:00Z",
+        )
+        for name in ("influence", "creativity", "threat", "ict_index"):
+            record[name] = f"{player_id % 10}.{fixture % 10}"
+        for name in (
+            "expected_goals",
+            "expected_assists",
+            "expected_goal_involvements",
+            "expected_goals_conceded",
+        ):
+            record[name] = f"0.{fixture % 100:02d}"
+        records.append(record)
+    return records
+
+
+@contextmanager
+def stub_server(latency: float = 0.05, rows: int = 38) -> Iterator[str]:
+    """Serve synthetic element-summary responses on localhost.
+
+    Args:
+        latency (float, optional): seconds each response is delayed, standing in
+            for the round trip to the FPL API. Defaults to 0.05.
+        rows (int, optional): fixtures per player. Defaults to 38.
+
+    Yields:
+        str: base url to pass as `base` to the extractors
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            player_id = int(self.path.strip("/").split("/")[-1])
+            body = json.dumps({"history": synthetic_history(player_id, rows)})
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def compare_extractors(
+    players: int = 100, latency: float = 0.05, **kwargs
+) -> dict[str, float]:
+    """Check the async extractor returns the serial extractor's data and time both
+    against a stub server.
+
+    The serial timing is `from_api`'s request loop without its one second pause
+    between players.
+
+    Args:
+        players (int, optional): players to pull. Defaults to 100.
+        latency (float, optional): stub response delay in seconds. Defaults to 0.05.
+        **kwargs: concurrency and rate limit options passed to `from_api_async`
+
+    Raises:
+        AssertionError: if the extractors return different dataframes
+
+    Returns:
+        dict[str, float]: seconds taken by each extractor
+    """
+    player_ids = list(range(1, players + 1))
+    timings = {}
+    with stub_server(latency) as base:
+        start = time.perf_counter()
+        records = [
+            record for id in player_ids for record in players_api(str(id), base=base)
+        ]
+        serial = validate_frame(pd.DataFrame(records), PlayerHistory)
+        timings["serial"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent, _ = from_api_async(player_ids=player_ids, base=base, **kwargs)
+        timings["async"] = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(serial, concurrent)
+    logger.info(
+        f"{players} players: serial {timings['serial']:.2f}s, "
+        f"async {timings['async']:.2f}s "
+        f"({timings['serial'] / timings['async']:.1f}x speedup)"
+    )
+    return timings
+
+
+def compare_validation(
+    records: list[dict] | None = None, model: type[BaseModel] = PlayerHistory
+) -> dict[str, float]:
+    """Check `validate_frame` matches per-row pydantic validation and time both.
+
+    Args:
+        records (list[dict] | None, optional): raw records. Defaults to 200,000
+            synthetic player history rows.
+        model (type[BaseModel], optional): schema. Defaults to PlayerHistory.
+
+    Raises:
+        AssertionError: if the validated dataframes differ
+
+    Returns:
+        dict[str, float]: seconds taken by each approach, including building the
+            dataframe
+    """
+    if records is None:
+        records = [
+            record for id in range(1, 5_001) for record in synthetic_history(id, 40)
+        ]
+
+    start = time.perf_counter()
+    per_row = pd.DataFrame([model(**record).model_dump() for record in records])
+    per_row_time = time.perf_counter() - start
+    # pydantic's own UTC tzinfo compares unequal to pandas' UTC
+    for column in per_row.select_dtypes("datetimetz"):
+        per_row[column] = per_row[column].dt.tz_convert("UTC")
+
+    start = time.perf_counter()
+    columnar = validate_frame(pd.DataFrame(records), model)
+    columnar_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(per_row, columnar)
+    logger.info(
+        f"{len(records):,} rows: per-row {per_row_time:.2f}s, "
+        f"columnar {columnar_time:.2f}s ({per_row_time / columnar_time:.1f}x speedup)"
+    )
+    return {"per_row": per_row_time, "columnar": columnar_time}
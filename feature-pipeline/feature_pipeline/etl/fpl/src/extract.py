@@ -1,28 +1,58 @@
+import asyncio
 import time
 
+import httpx
 import pandas as pd
 
 from feature_pipeline.core.settings import SOURCE
+from feature_pipeline.scraper.session import ClientConfig, create_async_client
+from feature_pipeline.utilities.rate_limit import TokenBucket
 from feature_pipeline.utilities.utils import get_logger
-from .validation import PlayerHistory
-from feature_pipeline.apis.fpl import players_api, get_player_ids, BASE
+from .validation import PlayerHistory, validate_frame
+from feature_pipeline.apis.fpl import (
+    players_api,
+    async_players_api,
+    get_player_ids,
+    get_player_minutes,
+    BASE,
+)
+from .watermark import Watermarks
 
 logger = get_logger(__name__)
 
 
-def unpack_stats(player_id: str) -> list[PlayerHistory]:
-    """Unpack player stats from API response.
+def player_metadata(**extra: str) -> dict[str, str]:
+    """Metadata stored alongside the player history data.
+
+    Args:
+        **extra: additional entries, e.g. the source file path
+
+    Returns:
+        dict[str, str]: metadata
+    """
+    return {
+        "description": "Individual player data for each game of the 2023/24 season",
+        "url": f"{BASE}/element-summary/<PLAYER_ID>/",
+        **extra,
+        "datetime_format": "%Y-%m-%dT%H:%M:%SZ",
+    }
+
+
+def unpack_stats(player_id: str) -> list[dict]:
+    """Unpack player stats from API response. Rows are validated against
+    PlayerHistory in bulk once all players have been pulled.
 
     Args:
         player_id (str): player id
 
     Returns:
-        list[PlayerHistory]: list of PlayerHistory objects
+        list[dict]: list of raw player history records
     """
     resp = players_api(player_id)
     if not resp:
         logger.info("No player stats found in JSON response.")
-    return [PlayerHistory(**stat).model_dump() for stat in resp]
+        return []
+    return resp
 
 
 def from_api() -> tuple[pd.DataFrame, dict[str, str]]:
@@ -41,15 +71,155 @@ def from_api() -> tuple[pd.DataFrame, dict[str, str]]:
         player_data.extend(data)
         time.sleep(1)
 
-    df = pd.DataFrame(player_data)
-    logger.info("Data has been loaded in a dataframe")
+    df = validate_frame(pd.DataFrame(player_data), PlayerHistory)
+    logger.info("Data has been validated and loaded in a dataframe")
 
-    metadata = {
-        "description": "Individual player data for each game of the 2023/24 season",
-        "url": f"{BASE}/element-summary/<PLAYER_ID>/",
-        "datetime_format": "%Y-%m-%dT%H:%M:%SZ",
-    }
-    return df, metadata
+    return df, player_metadata()
+
+
+async def unpack_stats_async(
+    client: httpx.AsyncClient,
+    player_id: str,
+    semaphore: asyncio.Semaphore,
+    limiter: TokenBucket,
+    retries: int,
+    backoff: float,
+    base: str,
+) -> list[dict]:
+    """Unpack player stats from an asynchronous API response.
+
+    Args:
+        client (httpx.AsyncClient): async client used to make the request
+        player_id (str): player id
+        semaphore (asyncio.Semaphore): bounds the number of in-flight requests
+        limiter (TokenBucket): rate limiter shared across requests
+        retries (int): number of retries per player
+        backoff (float): initial backoff in seconds
+        base (str): base url of the API
+
+    Returns:
+        list[dict]: list of raw player history records
+    """
+    async with semaphore:
+        resp = await async_players_api(
+            client,
+            player_id,
+            limiter=limiter,
+            retries=retries,
+            backoff=backoff,
+            base=base,
+        )
+    if not resp:
+        logger.info(f"No player stats found in JSON response for player {player_id}.")
+        return []
+    logger.info(f"Data for player id {player_id} pulled from API")
+    return resp
+
+
+async def _gather_player_stats(
+    ids: list[int],
+    max_concurrency: int,
+    rate: float,
+    burst: int,
+    retries: int,
+    backoff: float,
+    base: str,
+) -> list[list[dict]]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = TokenBucket(rate=rate, capacity=burst)
+    config = ClientConfig(
+        max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+    )
+    async with create_async_client(config) as client:
+        tasks = [
+            unpack_stats_async(
+                client, str(id), semaphore, limiter, retries, backoff, base
+            )
+            for id in ids
+        ]
+        return await asyncio.gather(*tasks)
+
+
+def from_api_async(
+    player_ids: list[int] | None = None,
+    max_concurrency: int = 10,
+    rate: float = 5.0,
+    burst: int = 5,
+    retries: int = 3,
+    backoff: float = 1.0,
+    base: str = BASE,
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Load player data from API with bounded concurrency and rate limiting.
+
+    Returns the same dataframe and metadata as `from_api`, with rows ordered by
+    player id.
+
+    Args:
+        player_ids (list[int] | None, optional): players to pull. Defaults to all players.
+        max_concurrency (int, optional): maximum in-flight requests. Defaults to 10.
+        rate (float, optional): steady-state requests per second. Defaults to 5.0.
+        burst (int, optional): maximum burst of requests. Defaults to 5.
+        retries (int, optional): retries per player on transient errors. Defaults to 3.
+        backoff (float, optional): initial backoff in seconds. Defaults to 1.0.
+        base (str, optional): base url of the API. Defaults to BASE.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, str]]: player dataframe and metadata
+    """
+    if player_ids is None:
+        player_ids = [player["id"] for player in get_player_ids()]
+    ids = sorted(player_ids)
+
+    start = time.perf_counter()
+    results = asyncio.run(
+        _gather_player_stats(
+            ids, max_concurrency, rate, burst, retries, backoff, base
+        )
+    )
+    logger.info(
+        f"Pulled {len(ids)} players from API in {time.perf_counter() - start:.1f}s"
+    )
+
+    player_data = [stat for stats in results for stat in stats]
+    df = validate_frame(pd.DataFrame(player_data), PlayerHistory)
+    logger.info("Data has been validated and loaded in a dataframe")
+
+    return df, player_metadata()
+
+
+def from_api_incremental(
+    watermarks: Watermarks, **kwargs
+) -> tuple[pd.DataFrame, dict[str, str], dict[int, int]]:
+    """Load only player data that is new since the last run.
+
+    Players whose season minutes in bootstrap-static are unchanged are skipped
+    and the remaining histories are cut at each player's watermark.
+
+    Args:
+        watermarks (Watermarks): per-player watermarks from the previous run
+        **kwargs: concurrency and rate limit options passed to `from_api_async`
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, str], dict[int, int]]: new player rows,
+        metadata and season minutes of the players whose history was returned
+    """
+    minutes = get_player_minutes()
+    ids = watermarks.players_to_update(minutes)
+    logger.info(f"{len(ids)} of {len(minutes)} players have new minutes")
+
+    if not ids:
+        return pd.DataFrame(), player_metadata(), {}
+
+    df, metadata = from_api_async(player_ids=ids, **kwargs)
+    # players whose request failed or came back empty are retried next run
+    pulled = set(df["element"]) if not df.empty else set()
+    missing = len(ids) - len(pulled)
+    if missing:
+        logger.warning(f"No history returned for {missing} players, retrying next run")
+    df = watermarks.filter_new(df)
+    logger.info(f"{len(df)} new fixture rows pulled from API")
+
+    return df, metadata, {id: minutes[id] for id in ids if id in pulled}
 
 
 def from_file() -> tuple[pd.DataFrame, dict[str, str]]:
@@ -62,10 +232,4 @@ def from_file() -> tuple[pd.DataFrame, dict[str, str]]:
 
     df = pd.read_pickle(path)
 
-    metadata = {
-        "description": "Individual player data for each game of the 2023/24 season",
-        "url": f"{BASE}/element-summary/<PLAYER_ID>/",
-        "file_path": path,
-        "datetime_format": "%Y-%m-%dT%H:%M:%SZ",
-    }
-    return df, metadata
+    return df, player_metadata(file_path=path)
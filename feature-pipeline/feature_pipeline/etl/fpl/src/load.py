@@ -1,11 +1,18 @@
 import pandas as pd
 import hopsworks
-from feature_pipeline.db.database import create_database_connection
+from feature_pipeline.db.bulk import LoadReport, copy_upsert
+from feature_pipeline.db.schema import TableSpec
 # from great_expectations.core import ExpectationSuite
 from hsfs.feature_group import FeatureGroup
 from hsfs.feature_store import FeatureStore
 from feature_pipeline.core.settings import SETTINGS
 
+# fixture ids restart every season, so season is part of the key and partitions
+PLAYER_STATS = TableSpec(
+    keys=("season", "player_id", "fixture_id"),
+    indexes=(("player_id", "season"), ("gameweek",)),
+)
+
 
 def connect_to_feature_store() -> FeatureStore:
     """Connect to feature store.
@@ -95,11 +102,29 @@ def to_feature_store(
 
 
 def to_sql_database(data: pd.DataFrame, table_name: str) -> None:
-    """Load data into SQL database.
+    """Load data into SQL database, upserting on the season, player and fixture key.
 
     Args:
         data (pd.DataFrame): players data.
         table_name (str): name of table to load data into.
     """
-    conn = create_database_connection(database="fantasy_premier_league")
-    data.to_sql(table_name, conn, if_exists="replace")
+    upsert_sql_database(data, table_name)
+
+
+def upsert_sql_database(
+    data: pd.DataFrame, table_name: str, spec: TableSpec = PLAYER_STATS
+) -> LoadReport:
+    """Bulk upsert data into SQL database on the season, player and fixture key.
+
+    Creates the season-partitioned table on first use and a partition for
+    every new season, so existing tables can be refreshed incrementally.
+
+    Args:
+        data (pd.DataFrame): players data.
+        table_name (str): name of table to load data into.
+        spec (TableSpec, optional): table layout. Defaults to PLAYER_STATS.
+
+    Returns:
+        LoadReport: rows loaded and throughput.
+    """
+    return copy_upsert(data, table_name, database="fantasy_premier_league", spec=spec)
@@ -4,10 +4,50 @@ import numpy as np
 from functools import reduce
 from typing import Callable
 from feature_pipeline.apis.fpl import get_player_ids, map_team_stats
-
-
-def string_to_int(players_df: pd.DataFrame) -> pd.DataFrame:
-    """Convert string columns to int.
+from feature_pipeline.utilities.dtypes import Column, Schema, convert
+
+
+PLAYER_SCHEMA: Schema = {
+    "element": Column("numeric", "Int16"),
+    "fixture": Column("numeric", "Int16"),
+    "opponent_team": Column("numeric", "Int8"),
+    "total_points": Column("numeric", "Int16"),
+    "kickoff_time": Column("datetime"),
+    "team_h_score": Column("numeric", "Int8"),
+    "team_a_score": Column("numeric", "Int8"),
+    "round": Column("numeric", "Int8"),
+    "minutes": Column("numeric", "Int16"),
+    "goals_scored": Column("numeric", "Int8"),
+    "assists": Column("numeric", "Int8"),
+    "clean_sheets": Column("numeric", "Int8"),
+    "goals_conceded": Column("numeric", "Int8"),
+    "own_goals": Column("numeric", "Int8"),
+    "penalties_saved": Column("numeric", "Int8"),
+    "penalties_missed": Column("numeric", "Int8"),
+    "yellow_cards": Column("numeric", "Int8"),
+    "red_cards": Column("numeric", "Int8"),
+    "saves": Column("numeric", "Int8"),
+    "bonus": Column("numeric", "Int8"),
+    "bps": Column("numeric", "Int16"),
+    "influence": Column("numeric", "float32"),
+    "creativity": Column("numeric", "float32"),
+    "threat": Column("numeric", "float32"),
+    "ict_index": Column("numeric", "float32"),
+    "starts": Column("numeric", "Int8"),
+    "expected_goals": Column("numeric", "float32"),
+    "expected_assists": Column("numeric", "float32"),
+    "expected_goal_involvements": Column("numeric", "float32"),
+    "expected_goals_conceded": Column("numeric", "float32"),
+    "value": Column("numeric", "Int16"),
+    "transfers_balance": Column("numeric", "Int32"),
+    "selected": Column("numeric", "Int32"),
+    "transfers_in": Column("numeric", "Int32"),
+    "transfers_out": Column("numeric", "Int32"),
+}
+
+
+def convert_dtypes(players_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert player columns to the compact dtypes declared in PLAYER_SCHEMA.
 
     Args:
         players_df (pd.DataFrame): Dataframe with players data.
@@ -15,13 +55,7 @@ def string_to_int(players_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Dataframe with converted columns.
     """
-    string_cols = [
-        col for col in players_df.columns if players_df[col].dtype == "object"
-    ]
-    players_df[string_cols] = pd.to_numeric(
-        players_df[string_cols].stack(), errors="coerce"
-    ).unstack()
-    return players_df
+    return convert(players_df, PLAYER_SCHEMA)
 
 
 def filter_fixtures(fixtures: pd.DataFrame) -> pd.DataFrame:
@@ -331,7 +365,7 @@ def transform(players_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Dataframe with transformed players data.
     """
-    players_df = string_to_int(players_df)
+    players_df = convert_dtypes(players_df)
     players_df = add_player_names(players_df)
     players_df = add_opponent_team_name(players_df)
     players_df = append_opponent_team_stats(players_df)
@@ -1,7 +1,26 @@
 from datetime import datetime
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
 
+import pandas as pd
 from pydantic import BaseModel
 
+# string values pydantic accepts for bool fields in lax mode
+BOOL_VALUES = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "t": True,
+    "y": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+    "f": False,
+    "n": False,
+}
+
 
 class PlayerInfo(BaseModel):
     id: int
@@ -50,3 +69,110 @@ class PlayerHistory(BaseModel):
     selected: int
     transfers_in: int
     transfers_out: int
+
+
+class FrameValidationError(ValueError):
+    """Raised when rows of a dataframe do not match a pydantic model.
+
+    Attributes:
+        failures (pd.DataFrame): one row per failing value with the row index,
+            column, offending value and reason.
+    """
+
+    def __init__(self, model: type[BaseModel], failures: pd.DataFrame) -> None:
+        self.failures = failures
+        super().__init__(
+            f"{failures['row'].nunique()} rows failed {model.__name__} validation:\n"
+            f"{failures.head(20).to_string(index=False)}"
+        )
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _coerce(series: pd.Series, annotation: Any) -> tuple[pd.Series, pd.Series, str]:
+    """Coerce a column to a field type, returning values, invalid mask and reason."""
+    if annotation is bool:
+        values = series.astype(str).str.lower().map(BOOL_VALUES)
+        return values, values.isna(), "not a valid boolean"
+    if annotation is int:
+        values = pd.to_numeric(series, errors="coerce")
+        return values, values.isna() | (values % 1 != 0), "not a valid integer"
+    if annotation is float:
+        values = pd.to_numeric(series, errors="coerce")
+        return values, values.isna(), "not a valid number"
+    if annotation is datetime:
+        values = pd.to_datetime(series, utc=True, errors="coerce")
+        return values, values.isna(), "not a valid datetime"
+    if annotation is str:
+        if pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return series, series.isna(), "not a valid string"
+        return series, ~series.map(lambda v: isinstance(v, str)), "not a valid string"
+    raise TypeError(f"Unsupported field type for frame validation: {annotation}")
+
+
+def validate_frame(df: pd.DataFrame, model: type[BaseModel]) -> pd.DataFrame:
+    """Validate and coerce a dataframe column by column against a pydantic model.
+
+    Equivalent to building `model(**row).model_dump()` for every row, but each
+    column is type-checked and coerced in a single vectorized pass. Extra columns
+    are dropped and all failing rows are reported together.
+
+    Args:
+        df (pd.DataFrame): raw data, one row per record.
+        model (type[BaseModel]): pydantic model used as the schema.
+
+    Raises:
+        FrameValidationError: if any value does not match its field type.
+
+    Returns:
+        pd.DataFrame: validated dataframe with the model's columns in field order.
+    """
+    fields = model.model_fields
+    if df.empty:
+        return pd.DataFrame(columns=list(fields))
+
+    columns = {}
+    failures = []
+    for name, field in fields.items():
+        if name not in df.columns:
+            failures.append(
+                pd.DataFrame(
+                    {"row": df.index, "column": name, "value": None, "reason": "missing"}
+                )
+            )
+            continue
+
+        annotation, optional = _unwrap_optional(field.annotation)
+        raw = df[name]
+        values, invalid, reason = _coerce(raw, annotation)
+        if optional:
+            invalid = invalid & raw.notna()
+        if invalid.any():
+            failures.append(
+                pd.DataFrame(
+                    {
+                        "row": df.index[invalid],
+                        "column": name,
+                        "value": raw[invalid].to_numpy(),
+                        "reason": reason,
+                    }
+                )
+            )
+            continue
+
+        if annotation is int:
+            values = values.astype("Int64" if optional else "int64")
+        elif annotation is bool and not optional:
+            values = values.astype(bool)
+        columns[name] = values
+
+    if failures:
+        raise FrameValidationError(model, pd.concat(failures, ignore_index=True))
+
+    return pd.DataFrame(columns, index=df.index)
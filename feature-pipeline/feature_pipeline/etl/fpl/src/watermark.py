@@ -0,0 +1,117 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from feature_pipeline.core.settings import SOURCE
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+WATERMARK_PATH = SOURCE / "data" / "fpl" / "watermarks.json"
+
+
+@dataclass
+class Watermark:
+    """High-water mark of the fixtures already ingested for a single player."""
+
+    gameweek: int = 0
+    kickoff_time: str | None = None
+    minutes: int = 0
+
+
+@dataclass
+class Watermarks:
+    """Per-player high-water marks used for incremental FPL ingestion."""
+
+    players: dict[int, Watermark] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path = WATERMARK_PATH) -> "Watermarks":
+        """Load watermarks from file, starting empty on the first run.
+
+        Args:
+            path (Path, optional): watermark file. Defaults to WATERMARK_PATH.
+
+        Returns:
+            Watermarks: per-player watermarks
+        """
+        if not path.exists():
+            logger.info(f"No watermarks found at {path}, running a full load")
+            return cls()
+
+        with open(path) as f:
+            data = json.load(f)
+        return cls({int(k): Watermark(**v) for k, v in data.items()})
+
+    def save(self, path: Path = WATERMARK_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({k: vars(v) for k, v in self.players.items()}, f)
+        logger.info(f"Watermarks for {len(self.players)} players saved to {path}")
+
+    def players_to_update(self, minutes: dict[int, int]) -> list[int]:
+        """Select players whose season minutes changed since the last run.
+
+        Players that have not played since the last run are skipped, so their
+        zero-minute fixtures are not backfilled until they next play.
+
+        Args:
+            minutes (dict[int, int]): season minutes per player from bootstrap-static
+
+        Returns:
+            list[int]: sorted player ids that need their history pulled
+        """
+        return sorted(
+            player_id
+            for player_id, total in minutes.items()
+            if player_id not in self.players or self.players[player_id].minutes != total
+        )
+
+    def filter_new(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep raw fixture rows at or after each player's watermark.
+
+        The most recent fixture is kept so late bonus point changes are picked
+        up by the upsert.
+
+        Args:
+            df (pd.DataFrame): raw player history with `element` and `kickoff_time`
+
+        Returns:
+            pd.DataFrame: rows not yet ingested
+        """
+        if df.empty or not self.players:
+            return df
+
+        kickoff = pd.to_datetime(df["kickoff_time"], utc=True)
+        marks = pd.to_datetime(
+            df["element"].map(
+                {k: v.kickoff_time for k, v in self.players.items()}
+            ),
+            utc=True,
+        )
+        return df.loc[marks.isna() | (kickoff >= marks)].reset_index(drop=True)
+
+    def update(self, df: pd.DataFrame, minutes: dict[int, int]) -> None:
+        """Advance watermarks with newly ingested raw fixture rows.
+
+        Args:
+            df (pd.DataFrame): raw player history that has been loaded
+            minutes (dict[int, int]): season minutes of the players that were pulled
+        """
+        if not df.empty:
+            latest = (
+                df.assign(kickoff_time=pd.to_datetime(df["kickoff_time"], utc=True))
+                .groupby("element")
+                .agg(gameweek=("round", "max"), kickoff_time=("kickoff_time", "max"))
+            )
+            for player_id, row in latest.iterrows():
+                mark = self.players.setdefault(int(player_id), Watermark())
+                kickoff = row["kickoff_time"].isoformat()
+                mark.gameweek = max(mark.gameweek, int(row["gameweek"]))
+                if mark.kickoff_time is None or kickoff > mark.kickoff_time:
+                    mark.kickoff_time = kickoff
+
+        for player_id, total in minutes.items():
+            self.players.setdefault(int(player_id), Watermark()).minutes = total
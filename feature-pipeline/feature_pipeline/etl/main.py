@@ -1,9 +1,11 @@
+from feature_pipeline.db.database import dispose_engines
 from feature_pipeline.etl.fbref.pipeline import run_stats_etl, run_wages_etl
 from feature_pipeline.etl.fpl.pipeline import run_etl as run_fpl_etl
 from feature_pipeline.etl.transfermarkt.pipeline import (
     run_leagues_etl,
     run_player_vals_etl,
 )
+from feature_pipeline.scraper.session import close_clients, metrics
 from feature_pipeline.utilities.utils import get_logger
 
 logger = get_logger(__name__)
@@ -14,18 +16,24 @@ def main() -> None:
 
     logger.info("Starting all ETL pipelines")
 
-    logger.info("Running FPL ETL pipeline")
-    run_fpl_etl()
+    try:
+        logger.info("Running FPL ETL pipeline")
+        run_fpl_etl()
 
-    logger.info("Running Transfermarkt ETL pipelines")
-    run_leagues_etl()
-    run_player_vals_etl()
+        logger.info("Running Transfermarkt ETL pipelines")
+        run_leagues_etl()
+        run_player_vals_etl()
 
-    logger.info("Running FBref ETL pipelines")
-    run_stats_etl()
-    run_wages_etl()
+        logger.info("Running FBref ETL pipelines")
+        run_stats_etl()
+        run_wages_etl()
 
-    logger.info("All ETL pipelines complete")
+        logger.info("All ETL pipelines complete")
+    finally:
+        logger.info("HTTP connection reuse per host")
+        metrics.log_summary()
+        close_clients()
+        dispose_engines()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
+import pandas as pd
 from icecream import ic
 from feature_pipeline.etl.transfermarkt.src import extract, transform, load
 from feature_pipeline.apis.transfermarkt import competition_ids, competition_names
+from feature_pipeline.scraper.client import ScrapeError
 from feature_pipeline.utilities.utils import get_logger
 from feature_pipeline.utilities.storage import gcp
 
@@ -8,67 +10,119 @@ from feature_pipeline.utilities.storage import gcp
 logger = get_logger(__name__)
 
 
-def run_leagues_etl() -> None:
-    """Extracts, transforms and loads league data from Transfermarkt"""
+def load_league(df: pd.DataFrame, comp_id: str, comp_name: str) -> None:
+    """Transform and load league data for a single competition"""
+
+    logger.info(f"Transforming league data for competition: {comp_id}")
+    df = transform.league_data(df)
+    ic(df)
+
+    logger.info(f"Saving league data for competition: {comp_id}")
+    # load to google cloud sql or s3 bucket
+    load.to_sql_database(
+        data=df,
+        table_name=f"{comp_name}_league_data",
+        database="transfermarkt",
+        spec=load.LEAGUE_TABLE,
+    )
+
+    logger.info(f"Saving league data for {comp_id} to GCP bucket")
+    gcp.write_blob_to_bucket(
+        bucket_name="transfermarkt_db",
+        blob_name=f"{comp_name}_team_data.csv",
+        data=df,
+    )
+
+
+def run_leagues_etl(parallel: bool = False) -> None:
+    """Extracts, transforms and loads league data from Transfermarkt
+
+    Args:
+        parallel (bool, optional): scrape all competitions and seasons in parallel,
+            resuming from checkpoints. Competitions with failed pages are
+            reported and skipped. Defaults to False.
+    """
 
     logger.info("Beginning transfermarkt leagues etl pipeline")
 
-    for comp_id, comp_name in zip(competition_ids, competition_names):
-        logger.info(f"Extracting league data for competition: {comp_id}")
-        df = extract.leagues_data(comp_id=comp_id, comp_name=comp_name)
-        ic(df)
-        logger.info(f"Extraction for {comp_id} complete")
-
-        logger.info(f"Transforming league data for competition: {comp_id}")
-        df = transform.league_data(df)
-        ic(df)
-
-        logger.info(f"Saving league data for competition: {comp_id}")
-        # load to google cloud sql or s3 bucket
-        load.to_sql_database(
-            data=df, table_name=f"{comp_name}_league_data", database="transfermarkt"
-        )
-
-        logger.info(f"Saving league data for {comp_id} to GCP bucket")
-        gcp.write_blob_to_bucket(
-            bucket_name="transfermarkt_db",
-            blob_name=f"{comp_name}_team_data.csv",
-            data=df,
-        )
+    comps = list(zip(competition_ids, competition_names))
+    if parallel:
+        frames, report = extract.league_info_parallel(comps=comps)
+        for comp_id, comp_name in comps:
+            if comp_name not in frames:
+                logger.warning(f"Skipping competition: {comp_id}")
+                continue
+            load_league(frames[comp_name], comp_id=comp_id, comp_name=comp_name)
+        report.log_summary()
+    else:
+        for comp_id, comp_name in comps:
+            logger.info(f"Extracting league data for competition: {comp_id}")
+            df = extract.leagues_data(comp_id=comp_id, comp_name=comp_name)
+            ic(df)
+            logger.info(f"Extraction for {comp_id} complete")
+            load_league(df, comp_id=comp_id, comp_name=comp_name)
 
     logger.info("Finished Transfermarkt leagues etl pipeline")
 
 
-def run_player_vals_etl() -> None:
-    """Extracts, transforms and loads player valuations data from Transfermarkt"""
+def load_player_vals(df: pd.DataFrame, league: str) -> None:
+    """Transform and load player valuations data for a single league"""
+
+    # check all teams are present for each season
+    check = df.groupby("season")["team"].nunique()
+    logger.info(f"Number of teams per season: {check}")
+
+    # transform data
+    logger.info("Transforming player valuations data")
+    df = transform.market_data(df)
+    ic(df)
+
+    logger.info("Saving player valuations data")
+    # load to postgres database
+    load.to_sql_database(
+        data=df,
+        table_name=f"{league}_player_valuations",
+        database="transfermarkt",
+        spec=load.VALUATIONS_TABLE,
+    )
+
+    logger.info(f"Saving player valuations data for {league} to GCP bucket")
+    gcp.write_blob_to_bucket(
+        bucket_name="transfermarkt_db",
+        blob_name=f"{league}_player_valuations.csv",
+        data=df,
+    )
+
+
+def run_player_vals_etl(parallel: bool = False) -> None:
+    """Extracts, transforms and loads player valuations data from Transfermarkt
+
+    Args:
+        parallel (bool, optional): scrape all squad pages in parallel, resuming
+            from checkpoints. Defaults to False. Either way, leagues with failed
+            pages are reported and skipped.
+    """
 
     logger.info("Beginning transfermarkt player valuations etl pipeline")
 
-    for league in competition_names:
-        logger.info(f"Extracting player valuations data for league: {league}")
-        df = extract.player_valuations(league=league)
-
-        # check all teams are present for each season
-        check = df.groupby("season")["team"].nunique()
-        logger.info(f"Number of teams per season: {check}")
-
-        # transform data
-        logger.info("Transforming player valuations data")
-        df = transform.market_data(df)
-        ic(df)
-
-        logger.info("Saving player valuations data")
-        # load to postgres database
-        load.to_sql_database(
-            data=df, table_name=f"{league}_player_valuations", database="transfermarkt"
-        )
-
-        logger.info(f"Saving player valuations data for {league} to GCP bucket")
-        gcp.write_blob_to_bucket(
-            bucket_name="transfermarkt_db",
-            blob_name=f"{league}_player_valuations.csv",
-            data=df,
-        )
+    if parallel:
+        frames, report = extract.player_valuations_parallel(leagues=competition_names)
+        for league in competition_names:
+            if league not in frames:
+                logger.warning(f"Skipping league: {league}")
+                continue
+            load_player_vals(frames[league], league=league)
+        report.log_summary()
+    else:
+        for league in competition_names:
+            logger.info(f"Extracting player valuations data for league: {league}")
+            try:
+                df = extract.player_valuations(league=league)
+            except ScrapeError as e:
+                logger.error(e)
+                logger.warning(f"Skipping league: {league}")
+                continue
+            load_player_vals(df, league=league)
 
     logger.info("Finished Trnasfermarkt player valuations etl pipeline")
 
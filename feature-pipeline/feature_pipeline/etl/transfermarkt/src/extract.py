@@ -1,6 +1,11 @@
+import time
 import pandas as pd
 from pathlib import Path
 from icecream import ic
+from feature_pipeline.scraper.cache import response_cache
+from feature_pipeline.scraper.checkpoint import CheckpointStore
+from feature_pipeline.scraper.client import ScrapeError, backoff_delay
+from feature_pipeline.scraper.pool import PoolReport, scrape_all
 from feature_pipeline.utilities.utils import get_logger
 from feature_pipeline.apis.transfermarkt import (
     transfermarkt_urls,
@@ -12,6 +17,11 @@ from feature_pipeline.etl.transfermarkt.src import parser
 
 logger = get_logger(__name__)
 
+# transfermarkt occasionally serves a page without the squad table
+MAX_PAGE_ATTEMPTS = 3
+
+DATA_DIR = Path.cwd() / "feature_pipeline" / "data" / "transfermarkt"
+
 
 def league_info_from_website(comp_id: str) -> pd.DataFrame:
     """Extract league information from transfermarkt.com for a particular competition.
@@ -33,6 +43,40 @@ def league_info_from_website(comp_id: str) -> pd.DataFrame:
     return pd.concat(dfs)
 
 
+def team_market_values(url: str, season: str, league: str, team: str) -> pd.DataFrame:
+    """Scrape the player market values of a single team, retrying with backoff
+    when transfermarkt serves a page without the squad table.
+
+    Args:
+        url (str): team url
+        season (str): football season
+        league (str): league name
+        team (str): team name
+
+    Raises:
+        ScrapeError: if the page is still empty after MAX_PAGE_ATTEMPTS
+
+    Returns:
+        pd.DataFrame: pandas dataframe of scraped player market values
+    """
+    for attempt in range(MAX_PAGE_ATTEMPTS):
+        df = parser.player_market_values(url, season=season, league=league, team=team)
+        ic(df)
+
+        if not df.empty:
+            return df
+
+        # don't serve the same empty page from the cache on the next attempt
+        response_cache.evict(url)
+        delay = backoff_delay(attempt)
+        logger.info(f"Retrying {team} player market values in {delay:.1f}s")
+        time.sleep(delay)
+
+    raise ScrapeError(
+        f"No player market values for {team} after {MAX_PAGE_ATTEMPTS} attempts"
+    )
+
+
 def players_vals_from_website(league: str, season: str) -> pd.DataFrame:
     """Extract player market values from transfermarkt.com for a particular league and season.
 
@@ -40,6 +84,10 @@ def players_vals_from_website(league: str, season: str) -> pd.DataFrame:
         league (str): league name
         season (str): football season
 
+    Raises:
+        ScrapeError: if a team's squad page is still empty after retrying, so an
+            incomplete league is never cached
+
     Returns:
         pd.DataFrame: pandas dataframe of extracted player market values
     """
@@ -49,19 +97,10 @@ def players_vals_from_website(league: str, season: str) -> pd.DataFrame:
     for team, team_id in teams:
         logger.info(f"Scraping {team} player market values")
 
-        while True:
-            url = transfermarkt_urls.player_values(
-                team_name=team, team_id=team_id, season=season
-            )
-            df = parser.player_market_values(
-                url, season=season, league=league, team=team
-            )
-            ic(df)
-
-            if not df.empty:
-                break
-            else:
-                logger.info(f"Retrying {team} player market values")
+        url = transfermarkt_urls.player_values(
+            team_name=team, team_id=team_id, season=season
+        )
+        df = team_market_values(url, season=season, league=league, team=team)
 
         logger.info(f"Finished scraping {team} player market values")
         dfs.append(df)
@@ -90,6 +129,161 @@ def player_valuations_total(league: str) -> pd.DataFrame:
     return pd.concat(dfs)
 
 
+def league_info_parallel(
+    comps: list[tuple[str, str]],
+    max_workers: int = 8,
+    per_host: int = 2,
+    delay: float = 1.0,
+) -> tuple[dict[str, pd.DataFrame], PoolReport]:
+    """Extract league information for every (comp_id, comp_name) pair by scraping
+    all (competition, season) pages in parallel.
+
+    Each page is checkpointed as it completes, so a rerun after a crash or partial
+    failure only requests the missing pages. A competition's dataframe is only
+    assembled, in season order, once all of its seasons are available.
+
+    Args:
+        comps (list[tuple[str, str]]): (comp_id, comp_name) pairs to extract
+        max_workers (int, optional): worker threads. Defaults to 8.
+        per_host (int, optional): in-flight requests per host. Defaults to 2.
+        delay (float, optional): politeness delay per host in seconds. Defaults to 1.0.
+
+    Returns:
+        tuple[dict[str, pd.DataFrame], PoolReport]: dataframes for complete
+        competitions keyed by comp_name and the scrape report
+    """
+    file_dir = DATA_DIR / "leagues"
+    store = CheckpointStore(file_dir / "pages")
+
+    frames = {}
+    keys = []
+    for comp_id, comp_name in comps:
+        path = file_dir / f"{comp_name}_info.pkl"
+        if path.exists():
+            logger.info(f"{path} exists. Reading data from {path}")
+            frames[comp_name] = pd.read_pickle(path)
+        else:
+            keys += [(comp_id, season) for season in seasons]
+
+    pages = store.load(keys)
+    tasks = {
+        key: transfermarkt_urls.team_info(competition_id=key[0], season=key[1])
+        for key in keys
+        if key not in pages
+    }
+    comp_seasons = {url: key for key, url in tasks.items()}
+
+    def scrape(url: str) -> pd.DataFrame:
+        comp_id, season = comp_seasons[url]
+        return parser.team_information(url, season=season, comp_id=comp_id)
+
+    def save_page(key: tuple[str, str], df: pd.DataFrame) -> None:
+        store.save(key, df)
+        pages[key] = df
+
+    logger.info(f"Scraping {len(tasks)} transfermarkt league pages in parallel")
+    report = scrape_all(
+        tasks,
+        scrape,
+        max_workers=max_workers,
+        per_host=per_host,
+        delay=delay,
+        on_result=save_page,
+    )
+    report.log_summary()
+
+    for comp_id, comp_name in comps:
+        if comp_name in frames:
+            continue
+        if any((comp_id, season) not in pages for season in seasons):
+            logger.warning(f"Incomplete seasons for {comp_name}, skipping")
+            continue
+        df = pd.concat([pages[(comp_id, season)] for season in seasons])
+        df.to_pickle(file_dir / f"{comp_name}_info.pkl")
+        frames[comp_name] = df
+
+    return frames, report
+
+
+def player_valuations_parallel(
+    leagues: list[str],
+    max_workers: int = 8,
+    per_host: int = 2,
+    delay: float = 1.0,
+) -> tuple[dict[str, pd.DataFrame], PoolReport]:
+    """Extract player market values for every league by scraping all
+    (league, season, team) squad pages in parallel.
+
+    Each squad page is checkpointed as it completes, so a rerun after a crash or
+    partial failure resumes from the checkpoints and only requests the missing
+    pages. A league's dataframe is only assembled once all of its teams are
+    available. League information must already be extracted.
+
+    Args:
+        leagues (list[str]): league names to extract
+        max_workers (int, optional): worker threads. Defaults to 8.
+        per_host (int, optional): in-flight requests per host. Defaults to 2.
+        delay (float, optional): politeness delay per host in seconds. Defaults to 1.0.
+
+    Returns:
+        tuple[dict[str, pd.DataFrame], PoolReport]: dataframes for complete
+        leagues and the scrape report
+    """
+    file_dir = DATA_DIR / "valuations"
+    store = CheckpointStore(file_dir / "pages")
+
+    frames = {}
+    urls = {}
+    for league in leagues:
+        path = file_dir / f"{league}_player_vals.pkl"
+        if path.exists():
+            logger.info(f"{path} exists. Reading data from {path}")
+            frames[league] = pd.read_pickle(path)
+            continue
+
+        for season in seasons:
+            for team, team_id in get_team_name_ids(season=season, league=league):
+                urls[(league, season, team)] = transfermarkt_urls.player_values(
+                    team_name=team, team_id=team_id, season=season
+                )
+
+    pages = store.load(list(urls))
+    tasks = {key: url for key, url in urls.items() if key not in pages}
+    squads = {url: key for key, url in tasks.items()}
+
+    def scrape(url: str) -> pd.DataFrame:
+        league, season, team = squads[url]
+        return team_market_values(url, season=season, league=league, team=team)
+
+    def save_page(key: tuple[str, str, str], df: pd.DataFrame) -> None:
+        store.save(key, df)
+        pages[key] = df
+
+    logger.info(f"Scraping {len(tasks)} transfermarkt squad pages in parallel")
+    report = scrape_all(
+        tasks,
+        scrape,
+        max_workers=max_workers,
+        per_host=per_host,
+        delay=delay,
+        on_result=save_page,
+    )
+    report.log_summary()
+
+    for league in leagues:
+        if league in frames:
+            continue
+        keys = [key for key in urls if key[0] == league]
+        if any(key not in pages for key in keys):
+            logger.warning(f"Incomplete squad pages for {league}, skipping")
+            continue
+        df = pd.concat([pages[key] for key in keys])
+        df.to_pickle(file_dir / f"{league}_player_vals.pkl")
+        frames[league] = df
+
+    return frames, report
+
+
 # -- Main extract functions for league information and player market values -- #
 
 
@@ -133,6 +327,10 @@ def player_valuations(league: str) -> pd.DataFrame:
     Args:
         league (str): league name
 
+    Raises:
+        ScrapeError: if any team's squad page could not be scraped, in which case
+            nothing is written to file
+
     Returns:
         pd.DataFrame: pandas dataframe of extracted player market values
     """
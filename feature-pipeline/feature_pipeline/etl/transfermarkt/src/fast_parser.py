@@ -0,0 +1,177 @@
+from html import escape
+
+import lxml.html
+import pandas as pd
+from lxml.html import HtmlElement
+
+# squad pages list players in `table.items`; nested tables hold name and position
+SQUAD_ROWS = "//table[contains(concat(' ', @class, ' '), ' items ')]/tbody/tr"
+PLAYER_IMAGE_CLASS = "bilderrahmen-fixed lazy lazy"
+
+# transfermarkt serves utf-8; without this lxml falls back to latin-1 for
+# pages lacking a charset declaration
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _classes(el: HtmlElement) -> list[str]:
+    return el.get("class", "").split()
+
+
+def _first(el: HtmlElement, tag: str) -> HtmlElement | None:
+    return next(el.iterdescendants(tag), None)
+
+
+def _title(el: HtmlElement, tag: str) -> str | None:
+    child = _first(el, tag)
+    return child.get("title") if child is not None else None
+
+
+def _href_part(td: HtmlElement | None, index: int) -> str | None:
+    link = _first(td, "a") if td is not None else None
+    if link is None or link.get("href") is None:
+        return None
+    return link.get("href").split("/")[index]
+
+
+def _player_row(tr: HtmlElement) -> dict | None:
+    """Extract every column group of a squad table row in a single pass over
+    its cells, or None if the row is not a player row."""
+    stats, posrela, value, name = [], None, None, None
+    for td in tr.iterchildren("td"):
+        classes = _classes(td)
+        if "zentriert" in classes:
+            stats.append(td)
+        elif "posrela" in classes:
+            posrela = td
+        elif td.get("class") == "rechts hauptlink":
+            value = td
+
+    if posrela is None:
+        return None
+
+    link = next(
+        (td for td in posrela.iterdescendants("td") if "hauptlink" in _classes(td)),
+        None,
+    )
+    for img in posrela.iterdescendants("img"):
+        if img.get("class") == PLAYER_IMAGE_CLASS:
+            # match the escaping BeautifulSoup applies when serialising the tag
+            name = escape(img.get("alt", ""), quote=False)
+            break
+
+    return {
+        "stats": stats,
+        "name": name,
+        "position": "".join(posrela.text_content().strip().split(" ")[-2:]),
+        "market_value": (
+            value.text_content().split("/")[0].strip() if value is not None else None
+        ),
+        "tm_id": _href_part(link, 4),
+        "tm_name": _href_part(link, 1),
+    }
+
+
+def _age(text: str) -> str:
+    return text.split("(", 1)[1].split(")", 1)[0]
+
+
+def _signed_from(td: HtmlElement, index: int, default: str) -> str:
+    title = _title(td, "a")
+    return title.split(": ")[index] if title is not None else default
+
+
+def player_values_df(content: bytes, season: str, league: str, team: str) -> pd.DataFrame:
+    """Create the player market values dataframe from a squad page using lxml.
+
+    Only the rows of the squad table are visited, once each. The output matches
+    `parser.create_player_values_df`.
+
+    Args:
+        content (bytes): squad page html
+        season (str): football season
+        league (str): league name
+        team (str): team name
+
+    Returns:
+        pd.DataFrame: pandas dataframe of scraped player valuation data
+    """
+    root = lxml.html.fromstring(content, parser=HTML_PARSER)
+    rows = [row for tr in root.xpath(SQUAD_ROWS) if (row := _player_row(tr))]
+
+    if season == "2023":
+        height, foot, signed, signed_from, expiry = 3, 4, 5, 6, 7
+    else:
+        height, foot, signed, signed_from, expiry = 4, 5, 6, 7, 8
+
+    stats = [row["stats"] for row in rows]
+    if season == "2023":
+        contract_expiry = [s[expiry].text_content() for s in stats]
+        current_club = team
+    else:
+        contract_expiry = "NA"
+        current_club = [_title(s[3], "img") for s in stats]
+
+    return pd.DataFrame(
+        {
+            "tm_id": [row["tm_id"] for row in rows],
+            "tm_name": [row["tm_name"] for row in rows],
+            "player": [row["name"] for row in rows],
+            "squad_num": [s[0].text_content() for s in stats],
+            "position": [row["position"] for row in rows],
+            "age": [_age(s[1].text_content()) for s in stats],
+            "country": [_title(s[2], "img") for s in stats],
+            "current_club": current_club,
+            "height": [s[height].text_content() for s in stats],
+            "foot": [s[foot].text_content() for s in stats],
+            "signed_date": [s[signed].text_content() for s in stats],
+            "signed_from": [_signed_from(s[signed_from], 0, "NA") for s in stats],
+            "signing_fee": [_signed_from(s[signed_from], 1, "0") for s in stats],
+            "contract_expiry": contract_expiry,
+            "market_value": [row["market_value"] for row in rows],
+            "season": season,
+            "league": league,
+            "team": team,
+        }
+    )
+
+
+def team_info_df(content: bytes, season: str, index: int) -> pd.DataFrame:
+    """Create the team information dataframe from a league page using lxml.
+
+    The three cell groups are collected in a single pass over the page's cells.
+    The output matches `parser.create_team_info_df`.
+
+    Args:
+        content (bytes): league page html
+        season (str): football season
+        index (int): limit length of scraped data
+
+    Returns:
+        pd.DataFrame: pandas dataframe of scraped team information data
+    """
+    root = lxml.html.fromstring(content, parser=HTML_PARSER)
+    names, stats, values = [], [], []
+    for td in root.iter("td"):
+        classes = _classes(td)
+        if td.get("class") == "hauptlink no-border-links":
+            names.append(td)
+        if "zentriert" in classes:
+            stats.append(td.text_content())
+        if "rechts" in classes:
+            values.append(td.text_content())
+
+    links = [_first(td, "a") for td in names][:index]
+
+    return pd.DataFrame(
+        {
+            "team_id": [a.get("href").split("/")[4] for a in links],
+            "team": [a.get("title") for a in links],
+            "other_names": [a.get("href").split("/")[1] for a in links],
+            "squad_size": stats[4::4][:index],
+            "squad_avg_age": stats[5::4][:index],
+            "squad_foreigners": stats[6::4][:index],
+            "average_value": values[2::2][:index],
+            "total_value": values[3::2][:index],
+            "season": season,
+        }
+    )
@@ -1,13 +1,30 @@
 import pandas as pd
-from feature_pipeline.db.database import create_database_connection
+from feature_pipeline.db.bulk import LoadReport, copy_upsert
+from feature_pipeline.db.schema import TableSpec
 
+# valuations refer to teams by their url name, stored as other_names
+LEAGUE_TABLE = TableSpec(
+    keys=("team_id", "season"), indexes=(("other_names", "season"),)
+)
+# valuations are joined to fbref stats on player, season and team. Rows without
+# a tm_id are dropped by transform.market_data, as they can't be keyed
+VALUATIONS_TABLE = TableSpec(
+    keys=("tm_id", "season", "team"), indexes=(("player", "season", "team"),)
+)
 
-def to_sql_database(data: pd.DataFrame, table_name: str, database: str) -> None:
-    """Load data into SQL database.
+
+def to_sql_database(
+    data: pd.DataFrame, table_name: str, database: str, spec: TableSpec
+) -> LoadReport:
+    """Bulk upsert data into SQL database on its natural key.
 
     Args:
         data (pd.DataFrame): players data.
         table_name (str): name of table to load data into.
+        database (str): database name.
+        spec (TableSpec): table layout.
+
+    Returns:
+        LoadReport: rows loaded and throughput.
     """
-    conn = create_database_connection(database)
-    data.to_sql(table_name, conn, if_exists="replace")
+    return copy_upsert(data, table_name, database=database, spec=spec)
@@ -0,0 +1,76 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+# signing fees are prefixed with "Ablöse " (transfer fee)
+FEE_PREFIX = r"^Ablöse\s*"
+
+# "€1.50m", "€500k" or "€1.2bn"
+MONEY_PATTERN = r"^€?\s*(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>bn|m|k)?$"
+
+# multiplier to euro-millions per unit suffix
+UNIT_SCALE = {"bn": 1000.0, "m": 1.0, "k": 0.001}
+
+# fees that involve no money changing hands
+ZERO_FEES = ["free transfer", "draft"]
+
+
+def parse_money(values: pd.Series, zero: list[str] | None = None) -> pd.Series:
+    """Convert a column of transfermarkt money strings to euro-millions.
+
+    Each distinct string is parsed once and the result is broadcast back over
+    the column, so the cost scales with the number of unique values rather
+    than the number of rows. Strings that are not money, such as "-" or "?",
+    become NaN.
+
+    Args:
+        values (pd.Series): money strings, e.g. "€1.50m", "€500k" or "€1.2bn"
+        zero (list[str] | None, optional): strings that mean a value of zero,
+            e.g. ZERO_FEES. Defaults to None.
+
+    Returns:
+        pd.Series: float32 values in euro-millions
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype="string")
+    uniques = uniques.str.replace(FEE_PREFIX, "", regex=True).str.strip()
+
+    parts = uniques.str.extract(MONEY_PATTERN)
+    amount = pd.to_numeric(parts["amount"], errors="coerce")
+    scale = parts["unit"].map(UNIT_SCALE).astype("float64").fillna(1.0)
+    parsed = (amount * scale).to_numpy(dtype="float32", na_value=np.nan)
+
+    if zero:
+        parsed[uniques.str.lower().isin(zero).to_numpy(dtype=bool, na_value=False)] = 0
+
+    # append NaN so missing values (code -1) pick it up
+    parsed = np.append(parsed, np.float32(np.nan))
+    return pd.Series(parsed[codes], index=values.index, name=values.name)
+
+
+def benchmark(rows: int = 1_000_000) -> float:
+    """Time `parse_money` on a synthetic column of signing fees.
+
+    Args:
+        rows (int, optional): column length. Defaults to 1_000_000.
+
+    Returns:
+        float: seconds taken to parse the column
+    """
+    rng = np.random.default_rng(0)
+    amounts = rng.integers(1, 2000, size=rows) / 20
+    units = rng.choice(["m", "k", "bn"], size=rows, p=[0.8, 0.15, 0.05])
+    fees = pd.Series([f"Ablöse €{a:.2f}{u}" for a, u in zip(amounts, units)])
+    fees[rng.random(rows) < 0.1] = "free transfer"
+    fees[rng.random(rows) < 0.05] = "-"
+
+    start = time.perf_counter()
+    parse_money(fees, zero=ZERO_FEES)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Parsed {rows:,} money strings in {elapsed:.2f}s")
+    return elapsed
@@ -1,11 +1,18 @@
+import time
 import pandas as pd
 from bs4 import BeautifulSoup
 from bs4.element import ResultSet
+from feature_pipeline.core.settings import SETTINGS
+from feature_pipeline.etl.transfermarkt.src import fast_parser
 from feature_pipeline.scraper.response import alt_get_url_data as get_url_data
 from feature_pipeline.utilities.utils import get_logger
 
 logger = get_logger(__name__)
 
+# "lxml" parses with the C-accelerated fast_parser, "bs4" with the original
+# BeautifulSoup html.parser implementation
+PARSER_BACKEND = SETTINGS.get("TRANSFERMARKT_PARSER", "lxml")
+
 
 def player_name(names: list[str], index: int) -> str:
     """Parse player name from html.
@@ -248,6 +255,80 @@ def create_team_info_df(soup: BeautifulSoup, season: str, index: int) -> pd.Data
     )
 
 
+def parse_player_values(
+    content: bytes, season: str, league: str, team: str, backend: str = PARSER_BACKEND
+) -> pd.DataFrame:
+    """Parse a squad page into the player market values dataframe.
+
+    Args:
+        content (bytes): squad page html
+        season (str): football season
+        league (str): league name
+        team (str): team name
+        backend (str, optional): "lxml" or "bs4". Defaults to PARSER_BACKEND.
+
+    Returns:
+        pd.DataFrame: pandas dataframe of scraped player market values
+    """
+    if backend == "lxml":
+        return fast_parser.player_values_df(content, season, league, team)
+    return create_player_values_df(
+        BeautifulSoup(content, "html.parser"), season, league, team
+    )
+
+
+def parse_team_info(
+    content: bytes, season: str, index: int, backend: str = PARSER_BACKEND
+) -> pd.DataFrame:
+    """Parse a league page into the team information dataframe.
+
+    Args:
+        content (bytes): league page html
+        season (str): football season
+        index (int): limit length of scraped data
+        backend (str, optional): "lxml" or "bs4". Defaults to PARSER_BACKEND.
+
+    Returns:
+        pd.DataFrame: pandas dataframe of scraped team information
+    """
+    if backend == "lxml":
+        return fast_parser.team_info_df(content, season, index)
+    return create_team_info_df(BeautifulSoup(content, "html.parser"), season, index)
+
+
+def compare_backends(
+    content: bytes, season: str, league: str, team: str, repeat: int = 5
+) -> dict[str, float]:
+    """Check both backends parse a squad page identically and time them.
+
+    Args:
+        content (bytes): squad page html, e.g. from the raw response cache
+        season (str): football season
+        league (str): league name
+        team (str): team name
+        repeat (int, optional): parses per backend. Defaults to 5.
+
+    Raises:
+        AssertionError: if the backends produce different dataframes
+
+    Returns:
+        dict[str, float]: mean seconds per page for each backend
+    """
+    timings, frames = {}, {}
+    for backend in ("bs4", "lxml"):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            frames[backend] = parse_player_values(content, season, league, team, backend)
+        timings[backend] = (time.perf_counter() - start) / repeat
+
+    pd.testing.assert_frame_equal(frames["bs4"], frames["lxml"])
+    logger.info(
+        f"bs4: {timings['bs4'] * 1000:.1f}ms, lxml: {timings['lxml'] * 1000:.1f}ms "
+        f"per page ({timings['bs4'] / timings['lxml']:.1f}x speedup)"
+    )
+    return timings
+
+
 # ------------------------------ Main Parsing functions ------------------------------ #
 
 
@@ -267,11 +348,8 @@ def player_market_values(url: str, season: str, league: str, team: str) -> pd.Da
     logger.info(f"Scraping season {season} player market values for {url}")
     resp = get_url_data(url)
 
-    logger.info("Parsing html")
-    page_soup = BeautifulSoup(resp.content, "html.parser")
-
     logger.info("Creating market valuations dataframe")
-    return create_player_values_df(page_soup, season, league, team)
+    return parse_player_values(resp.content, season, league, team)
 
 
 def team_information(url: str, season: str, comp_id: str) -> pd.DataFrame:
@@ -288,9 +366,6 @@ def team_information(url: str, season: str, comp_id: str) -> pd.DataFrame:
     logger.info(f"Scraping season {season} league information for {url}")
     resp = get_url_data(url)
 
-    logger.info("Parsing html")
-    soup = BeautifulSoup(resp.content, "html.parser")
-
     if comp_id == "L1":
         index = 18
     if comp_id == "FR1" and season == "2023":
@@ -299,4 +374,4 @@ def team_information(url: str, season: str, comp_id: str) -> pd.DataFrame:
         index = 20
 
     logger.info("Creating team information dataframe")
-    return create_team_info_df(soup, season, index)
+    return parse_team_info(resp.content, season, index)
@@ -3,7 +3,10 @@ import numpy as np
 import re
 from functools import reduce
 from typing import Callable
+from feature_pipeline.etl.transfermarkt.src.money import ZERO_FEES, parse_money
+from feature_pipeline.utilities.utils import get_logger
 
+logger = get_logger(__name__)
 
 Preprocessor = Callable[[pd.DataFrame], pd.DataFrame]
 
@@ -15,18 +18,6 @@ def compose(*functions: Preprocessor) -> Preprocessor:
 # ------------------------- column cleaning functions ------------------------ #
 
 
-def clean_value(value: str) -> str:
-    value = re.sub("€", "", value)
-    if value.endswith("k"):
-        new_val = "0." + re.sub("k", "", value)
-    elif value.endswith("bn"):
-        new_val = re.sub("bn", "", value)
-        new_val = float(new_val) * 1000
-    else:
-        new_val = re.sub("m", "", value)
-    return str(new_val)
-
-
 def change_position(position: str) -> str:
     return re.sub(r"([a-z])([A-Z])", r"\1-\2", position)
 
@@ -34,8 +25,17 @@ def change_position(position: str) -> str:
 # ------------------------------ Main functions ------------------------------ #
 
 
+def drop_missing_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop players without a transfermarkt id, which valuations are keyed on."""
+    missing = df["tm_id"].isna()
+    if missing.any():
+        players = df.loc[missing, ["player", "team", "season"]].to_dict("records")
+        logger.warning(f"Dropping {missing.sum()} players without a tm_id: {players}")
+    return df.loc[~missing].reset_index(drop=True)
+
+
 def clean_market_values(df: pd.DataFrame) -> pd.DataFrame:
-    df["market_value"] = df["market_value"].apply(clean_value).replace("-", np.nan)
+    df["market_value"] = parse_money(df["market_value"])
     df = df.rename(columns={"market_value": "market_value_euro_mill"})
     return df
 
@@ -46,14 +46,7 @@ def clean_squad_numbers(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_signing_fee(df: pd.DataFrame) -> pd.DataFrame:
-    df["signing_fee"] = (
-        df["signing_fee"]
-        .replace("Ablöse ", "", regex=True)
-        .apply(clean_value)
-        .replace("-|\?", np.nan, regex=True)
-        .replace("free transfer|draft", "0", regex=True)
-        .replace("", np.nan)
-    )
+    df["signing_fee"] = parse_money(df["signing_fee"], zero=ZERO_FEES)
     df = df.rename(columns={"signing_fee": "signing_fee_euro_mill"})
     return df
 
@@ -77,8 +70,8 @@ def clean_position(df: pd.DataFrame) -> pd.DataFrame:
 
 def handle_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     dtypes = {
-        "market_value_euro_mill": float,
-        "signing_fee_euro_mill": float,
+        "market_value_euro_mill": "float32",
+        "signing_fee_euro_mill": "float32",
         "contract_expiry": "category",
         "height": float,
         "squad_num": int,
@@ -98,8 +91,8 @@ def handle_dtypes(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_squad_values(df: pd.DataFrame) -> pd.DataFrame:
-    df["average_value"] = df["average_value"].apply(clean_value)
-    df["total_value"] = df["total_value"].apply(clean_value)
+    df["average_value"] = parse_money(df["average_value"])
+    df["total_value"] = parse_money(df["total_value"])
 
     rename_cols = {
         "average_value": "average_value_euro_mill",
@@ -111,8 +104,8 @@ def clean_squad_values(df: pd.DataFrame) -> pd.DataFrame:
 
 def handle_league_dtypes(df: pd.DataFrame) -> pd.DataFrame:
     dtypes = {
-        "average_value_euro_mill": float,
-        "total_value_euro_mill": float,
+        "average_value_euro_mill": "float32",
+        "total_value_euro_mill": "float32",
         "squad_size": int,
         "squad_avg_age": float,
         "squad_foreigners": int,
@@ -138,6 +131,7 @@ def market_data(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: transformed dataframe.
     """
     preprocessor = compose(
+        drop_missing_ids,
         clean_squad_numbers,
         clean_market_values,
         clean_signing_fee,
@@ -0,0 +1,150 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import httpx
+
+from feature_pipeline.core.settings import SETTINGS, SOURCE
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR = SOURCE / "data" / "raw_cache"
+CACHE_TTL = float(SETTINGS.get("SCRAPER_CACHE_TTL", 7 * 24 * 60 * 60))
+
+# fbref urls carry "2017-2018", transfermarkt urls carry "saison_id=2017"
+SEASON_PATTERNS = [re.compile(r"(\d{4})-\d{4}"), re.compile(r"saison_id=(\d{4})")]
+
+
+def current_season(today: date | None = None) -> int:
+    """Start year of the current football season, which begins in July.
+
+    Args:
+        today (date | None, optional): reference date. Defaults to today.
+
+    Returns:
+        int: start year of the current season
+    """
+    today = today or date.today()
+    return today.year if today.month >= 7 else today.year - 1
+
+
+def url_season(url: str) -> int | None:
+    """Start year of the season a url refers to, if any.
+
+    Args:
+        url (str): scraped url
+
+    Returns:
+        int | None: season start year or None if the url is not season specific
+    """
+    for pattern in SEASON_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+@dataclass
+class ResponseCache:
+    """Content-addressed cache of raw scraped responses.
+
+    Each url is stored under the sha256 of the url as a gzipped body and a json
+    sidecar with the status code, content type and fetch timestamp. Pages from
+    past seasons never expire; everything else expires after `ttl` seconds.
+    """
+
+    directory: Path = CACHE_DIR
+    ttl: float = CACHE_TTL
+    enabled: bool = SETTINGS.get("SCRAPER_CACHE", "true").lower() != "false"
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = self.key(url)
+        folder = self.directory / key[:2]
+        return folder / f"{key}.gz", folder / f"{key}.json"
+
+    def is_fresh(self, meta: dict) -> bool:
+        season = url_season(meta["url"])
+        if season is not None and season < current_season():
+            return True
+        return time.time() - meta["fetched_at"] < self.ttl
+
+    def get(self, url: str) -> httpx.Response | None:
+        """Serve a cached response for `url` without touching the network.
+
+        Args:
+            url (str): scraped url
+
+        Returns:
+            httpx.Response | None: cached response or None on a miss or expiry
+        """
+        if not self.enabled:
+            return None
+
+        body_path, meta_path = self._paths(url)
+        if not (body_path.exists() and meta_path.exists()):
+            return None
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["url"] != url or not self.is_fresh(meta):
+            return None
+
+        with open(body_path, "rb") as f:
+            content = gzip.decompress(f.read())
+
+        logger.info(f"Serving {url} from raw response cache")
+        return httpx.Response(
+            status_code=meta["status_code"],
+            headers={"content-type": meta["content_type"]},
+            content=content,
+            request=httpx.Request("GET", url),
+        )
+
+    def evict(self, url: str) -> None:
+        """Drop the cached response for `url`, e.g. when it failed to parse."""
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+    def put(self, url: str, response: httpx.Response) -> None:
+        """Store a successful response for `url`.
+
+        Args:
+            url (str): scraped url
+            response (httpx.Response): response from the scraping provider
+        """
+        if not self.enabled or not response.is_success:
+            return
+
+        body_path, meta_path = self._paths(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "content_type": response.headers.get("content-type", "text/html"),
+            "fetched_at": time.time(),
+        }
+
+        # write to temporary files first so readers never see partial entries
+        tmp_body = body_path.with_suffix(f".gz.{os.getpid()}.tmp")
+        with open(tmp_body, "wb") as f:
+            f.write(gzip.compress(response.content))
+        os.replace(tmp_body, body_path)
+
+        tmp_meta = meta_path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_meta, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+
+response_cache = ResponseCache()
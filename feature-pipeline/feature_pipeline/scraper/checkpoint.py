@@ -0,0 +1,56 @@
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable
+
+import pandas as pd
+
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CheckpointStore:
+    """Pickled dataframe per scraped task key, used to resume interrupted runs.
+
+    Args:
+        directory (Path): folder holding one pickle per task key
+    """
+
+    directory: Path
+
+    def path(self, key: Hashable) -> Path:
+        parts = key if isinstance(key, tuple) else (key,)
+        name = "_".join(re.sub(r"[^\w.-]", "-", str(part)) for part in parts)
+        return self.directory / f"{name}.pkl"
+
+    def load(self, keys: list[Hashable]) -> dict[Hashable, pd.DataFrame]:
+        """Load the checkpoints that exist for `keys`.
+
+        Args:
+            keys (list[Hashable]): task keys
+
+        Returns:
+            dict[Hashable, pd.DataFrame]: checkpointed dataframes by task key
+        """
+        done = {
+            key: pd.read_pickle(self.path(key))
+            for key in keys
+            if self.path(key).exists()
+        }
+        if done:
+            logger.info(
+                f"Resuming from {len(done)}/{len(keys)} checkpoints in {self.directory}"
+            )
+        return done
+
+    def save(self, key: Hashable, df: pd.DataFrame) -> None:
+        """Checkpoint a task result, writing to a temporary file first so an
+        interrupted write never leaves a truncated checkpoint behind."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".pkl.{os.getpid()}.tmp")
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
@@ -0,0 +1,224 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import httpx
+
+from feature_pipeline.core.settings import SETTINGS
+from feature_pipeline.scraper.cache import ResponseCache, response_cache
+from feature_pipeline.scraper.session import ClientConfig, get_client
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+# scraping providers render pages through proxies, so allow for slow responses
+SCRAPER_CONFIG = ClientConfig(timeout=float(SETTINGS.get("SCRAPER_TIMEOUT", 70)))
+
+# the target page does not exist, so no provider or retry will help
+FATAL_STATUS_CODES = {404, 410}
+
+
+class ScrapeError(Exception):
+    """Raised when a url could not be scraped by any provider."""
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Exponential backoff with full jitter.
+
+    Args:
+        attempt (int): zero-based retry attempt
+        base (float, optional): delay of the first retry in seconds. Defaults to 1.0.
+        cap (float, optional): maximum delay in seconds. Defaults to 60.0.
+
+    Returns:
+        float: seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+@dataclass
+class RetryBudget:
+    """Thread-safe cap on the number of retries spent during a run."""
+
+    total: int = int(SETTINGS.get("SCRAPER_RETRY_BUDGET", 200))
+    spent: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def spend(self) -> bool:
+        """Take one retry from the budget, returning False once it is exhausted."""
+        with self._lock:
+            if self.spent >= self.total:
+                return False
+            self.spent += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.spent, 0)
+
+
+@dataclass
+class CircuitBreaker:
+    """Stops sending requests to a provider after repeated failures.
+
+    The breaker opens after `threshold` consecutive failures and lets a
+    single trial request through once `cooldown` seconds have passed.
+    """
+
+    threshold: int = 5
+    cooldown: float = 60.0
+    failures: int = 0
+    opened_at: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # half-open: let one trial request through and restart the cooldown
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+@dataclass
+class Provider:
+    """A scraping provider that fetches a target url through its proxy.
+
+    Args:
+        name (str): provider name
+        request (Callable[[str], dict]): builds the httpx request kwargs
+            (url, params, headers) for a target url
+        breaker (CircuitBreaker): circuit breaker for the provider
+    """
+
+    name: str
+    request: Callable[[str], dict]
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+    def get(self, url: str) -> httpx.Response:
+        return get_client("scraper", SCRAPER_CONFIG).get(**self.request(url))
+
+
+def scraperapi_request(url: str) -> dict:
+    return {
+        "url": SETTINGS["WEB_SCRAPING_API"],
+        "params": {"api_key": SETTINGS["WEB_SCRAPING_API_KEY"], "url": url},
+    }
+
+
+def zenscraper_request(url: str) -> dict:
+    return {
+        "url": SETTINGS["ZENSCRAPER_API"],
+        "params": {"url": url},
+        "headers": {"apikey": SETTINGS["ZENSCRAPER_API_KEY"]},
+    }
+
+
+@dataclass
+class ScraperClient:
+    """Scraping client with backoff, a retry budget and provider failover.
+
+    Each attempt tries the providers in order of preference, skipping any
+    whose circuit breaker is open. When every provider fails the client
+    backs off with jitter and spends one retry from the run's budget.
+
+    Args:
+        providers (list[Provider]): providers in default order of preference
+        max_attempts (int): attempts per url across all providers
+        backoff (float): base backoff delay in seconds
+        max_backoff (float): maximum backoff delay in seconds
+        budget (RetryBudget): retries shared by every url in the run
+        cache (ResponseCache): raw response cache
+    """
+
+    providers: list[Provider]
+    max_attempts: int = 4
+    backoff: float = 2.0
+    max_backoff: float = 60.0
+    budget: RetryBudget = field(default_factory=RetryBudget)
+    cache: ResponseCache = field(default_factory=lambda: response_cache)
+
+    def _ordered(self, prefer: str | None) -> list[Provider]:
+        return sorted(self.providers, key=lambda p: p.name != prefer)
+
+    def _try(self, provider: Provider, url: str) -> httpx.Response | None:
+        try:
+            resp = provider.get(url)
+        except (httpx.HTTPError, KeyError) as e:
+            provider.breaker.record_failure()
+            logger.warning(f"{provider.name} failed for {url}: {e!r}")
+            return None
+
+        if resp.is_success:
+            provider.breaker.record_success()
+            return resp
+        if resp.status_code in FATAL_STATUS_CODES:
+            raise ScrapeError(f"{url} returned {resp.status_code}")
+
+        provider.breaker.record_failure()
+        logger.warning(f"{provider.name} returned {resp.status_code} for {url}")
+        return None
+
+    def fetch(self, url: str, prefer: str | None = None) -> httpx.Response:
+        """Fetch a url, serving it from the raw response cache if possible.
+
+        Args:
+            url (str): url to scrape
+            prefer (str | None, optional): name of the provider to try first.
+
+        Raises:
+            ScrapeError: if the page does not exist, every attempt failed or
+                the retry budget is exhausted
+
+        Returns:
+            httpx.Response: successful response
+        """
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.max_attempts):
+            for provider in self._ordered(prefer):
+                if not provider.breaker.allow():
+                    continue
+                resp = self._try(provider, url)
+                if resp is not None:
+                    self.cache.put(url, resp)
+                    return resp
+
+            if attempt == self.max_attempts - 1:
+                break
+            if not self.budget.spend():
+                raise ScrapeError(f"Retry budget exhausted while scraping {url}")
+
+            delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+            logger.info(
+                f"All providers failed for {url}, retrying in {delay:.1f}s "
+                f"({self.budget.remaining} retries left in budget)"
+            )
+            time.sleep(delay)
+
+        raise ScrapeError(f"Failed to scrape {url} after {self.max_attempts} attempts")
+
+
+scraper_client = ScraperClient(
+    providers=[
+        Provider("scraperapi", scraperapi_request),
+        Provider("zenscraper", zenscraper_request),
+    ]
+)
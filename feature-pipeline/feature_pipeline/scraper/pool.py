@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+from urllib.parse import urlsplit
+
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HostThrottle:
+    """Caps concurrent requests per host and spaces out request starts.
+
+    Args:
+        per_host (int): maximum in-flight requests to a single host
+        delay (float): minimum seconds between request starts to a single host
+    """
+
+    per_host: int = 2
+    delay: float = 1.0
+    _semaphores: dict[str, threading.Semaphore] = field(default_factory=dict, repr=False)
+    _next_start: dict[str, float] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _semaphore(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            return self._semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.per_host)
+            )
+
+    def _wait_turn(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+    def run(self, url: str, fn: Callable[[str], Any]) -> Any:
+        """Call `fn(url)` once the host has a free slot and its delay has passed."""
+        host = urlsplit(url).netloc
+        with self._semaphore(host):
+            self._wait_turn(host)
+            return fn(url)
+
+
+@dataclass
+class PoolReport:
+    """Outcome of a pool run: results and failures keyed by task key."""
+
+    results: dict[Hashable, Any] = field(default_factory=dict)
+    failures: dict[Hashable, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    total: int = 0
+
+    @property
+    def completed(self) -> int:
+        return len(self.results) + len(self.failures)
+
+    @property
+    def throughput(self) -> float:
+        """Pages scraped per minute."""
+        return 60 * len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def log_progress(self) -> None:
+        logger.info(
+            f"Progress: {self.completed}/{self.total} pages, "
+            f"{len(self.failures)} failed, {self.throughput:.1f} pages/min"
+        )
+
+    def log_summary(self) -> None:
+        logger.info(
+            f"{len(self.results)}/{self.completed} pages scraped in {self.elapsed:.1f}s "
+            f"({self.throughput:.1f} pages/min), {len(self.failures)} failed"
+        )
+        for key, error in self.failures.items():
+            logger.error(f"Failed {key}: {error}")
+
+
+def scrape_all(
+    tasks: dict[Hashable, str],
+    fn: Callable[[str], Any],
+    max_workers: int = 8,
+    per_host: int = 2,
+    delay: float = 1.0,
+    on_result: Callable[[Hashable, Any], None] | None = None,
+) -> PoolReport:
+    """Scrape every url in `tasks` on a bounded worker pool.
+
+    A failing task is recorded in the report instead of aborting the run.
+
+    Args:
+        tasks (dict[Hashable, str]): url per task key
+        fn (Callable[[str], Any]): function that scrapes and parses a url
+        max_workers (int, optional): worker threads. Defaults to 8.
+        per_host (int, optional): in-flight requests per host. Defaults to 2.
+        delay (float, optional): politeness delay per host in seconds. Defaults to 1.0.
+        on_result (Callable[[Hashable, Any], None] | None, optional): called with
+            each task key and result as soon as the task completes.
+
+    Returns:
+        PoolReport: results and failures keyed by task key
+    """
+    throttle = HostThrottle(per_host=per_host, delay=delay)
+    report = PoolReport(total=len(tasks))
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape") as pool:
+        futures = {pool.submit(throttle.run, url, fn): key for key, url in tasks.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                report.results[key] = future.result()
+                logger.info(f"Scraped {key}")
+                if on_result is not None:
+                    on_result(key, report.results[key])
+            except Exception as e:
+                report.failures[key] = f"{type(e).__name__}: {e}"
+            report.elapsed = time.perf_counter() - start
+            report.log_progress()
+
+    report.elapsed = time.perf_counter() - start
+    return report
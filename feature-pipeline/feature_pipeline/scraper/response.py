@@ -1,39 +1,31 @@
-import requests
-from feature_pipeline.core.settings import SETTINGS
+import httpx
+from feature_pipeline.scraper.client import scraper_client
 from feature_pipeline.utilities.utils import get_logger
 
 logger = get_logger(__name__)
 
 
-def get_url_data(url: str) -> requests.models.Response:
-    """Scrape data from a url using the scraperapi.com service.
+def get_url_data(url: str) -> httpx.Response:
+    """Scrape data from a url using the scraperapi.com service, failing over
+    to zenscraper when it is unavailable.
+
+    Successful responses are kept in the raw response cache, so a cache hit
+    is served without a request.
 
     Args:
         url (str): url to scrape
 
+    Raises:
+        ScrapeError: if the url could not be scraped by any provider
+
     Returns:
-        requests.models.Response: response object from scraperapi.com
+        httpx.Response: response object from the provider or the cache
     """
-    payload = {
-        "api_key": SETTINGS["WEB_SCRAPING_API_KEY"],
-        "url": url,
-        # "render_js": "false",
-    }
-    try:
-        r = requests.get(SETTINGS["WEB_SCRAPING_API"], params=payload)
-        return r
-    except requests.exceptions.RequestException as e:
-        logger.error(e)
-
-
-def alt_get_url_data(url: str) -> requests.models.Response:
-    headers = {"apikey": SETTINGS["ZENSCRAPER_API_KEY"]}
-
-    params = (("url", url),)
-
-    try:
-        r = requests.get(SETTINGS["ZENSCRAPER_API"], headers=headers, params=params)
-        logger.info(f"Request status: {r.status_code}")
-        return r
-    except requests.exceptions.RequestException as e:
-        logger.error(e)
+    return scraper_client.fetch(url, prefer="scraperapi")
+
+
+def alt_get_url_data(url: str) -> httpx.Response:
+    """Same as `get_url_data`, but trying zenscraper first."""
+    resp = scraper_client.fetch(url, prefer="zenscraper")
+    logger.info(f"Request status: {resp.status_code}")
+    return resp
@@ -0,0 +1,206 @@
+import atexit
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import httpx
+
+from feature_pipeline.core.settings import SETTINGS
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP/2 needs the `h2` package from the `httpx[http2]` extra
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# trace event emitted by httpcore whenever a new TCP connection is opened
+NEW_CONNECTION_EVENT = "connection.connect_tcp.started"
+
+
+@dataclass
+class ClientConfig:
+    """Connection pool and timeout configuration for a shared HTTP client."""
+
+    timeout: float = float(SETTINGS.get("HTTP_TIMEOUT", 30))
+    connect_timeout: float = float(SETTINGS.get("HTTP_CONNECT_TIMEOUT", 10))
+    max_connections: int = int(SETTINGS.get("HTTP_MAX_CONNECTIONS", 20))
+    max_keepalive_connections: int = int(SETTINGS.get("HTTP_MAX_KEEPALIVE", 10))
+    keepalive_expiry: float = float(SETTINGS.get("HTTP_KEEPALIVE_EXPIRY", 30))
+    http2: bool = HTTP2_AVAILABLE
+
+    def __post_init__(self) -> None:
+        if self.http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+            self.http2 = False
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+
+@dataclass
+class HostMetrics:
+    """Request and connection counters for a single host."""
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+
+@dataclass
+class ConnectionMetrics:
+    """Thread-safe per-host connection metrics for all shared clients."""
+
+    hosts: dict[str, HostMetrics] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _host(self, host: str) -> HostMetrics:
+        return self.hosts.setdefault(host, HostMetrics())
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self._host(host).requests += 1
+
+    def record_connection(self, host: str) -> None:
+        with self._lock:
+            self._host(host).new_connections += 1
+
+    def snapshot(self) -> dict[str, dict[str, int | float]]:
+        """Return a copy of the metrics keyed by host.
+
+        Returns:
+            dict[str, dict[str, int | float]]: requests, new and reused
+            connections and reuse rate for each host
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": m.requests,
+                    "new_connections": m.new_connections,
+                    "reused": m.reused,
+                    "reuse_rate": round(m.reuse_rate, 3),
+                }
+                for host, m in self.hosts.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hosts.clear()
+
+    def log_summary(self) -> None:
+        for host, m in self.snapshot().items():
+            logger.info(
+                f"{host}: {m['requests']} requests, {m['new_connections']} connections "
+                f"opened, {m['reuse_rate']:.0%} reused"
+            )
+
+
+metrics = ConnectionMetrics()
+
+_clients: dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _host(request: httpx.Request) -> str:
+    return urlsplit(str(request.url)).netloc
+
+
+def _on_request(request: httpx.Request) -> None:
+    host = _host(request)
+    metrics.record_request(host)
+
+    def trace(event_name: str, info: dict) -> None:
+        if event_name == NEW_CONNECTION_EVENT:
+            metrics.record_connection(host)
+
+    request.extensions["trace"] = trace
+
+
+async def _on_async_request(request: httpx.Request) -> None:
+    host = _host(request)
+    metrics.record_request(host)
+
+    async def trace(event_name: str, info: dict) -> None:
+        if event_name == NEW_CONNECTION_EVENT:
+            metrics.record_connection(host)
+
+    request.extensions["trace"] = trace
+
+
+def get_client(name: str = "default", config: ClientConfig | None = None) -> httpx.Client:
+    """Get the shared, pooled client for `name`, creating it on first use.
+
+    The config is only used when the client is first created.
+
+    Args:
+        name (str, optional): client name, e.g. "fpl" or "scraper". Defaults to "default".
+        config (ClientConfig | None, optional): pool and timeout configuration.
+
+    Returns:
+        httpx.Client: keep-alive client shared by every caller using `name`
+    """
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None or client.is_closed:
+            config = config or ClientConfig()
+            logger.info(f"Creating shared HTTP client: {name} (http2={config.http2})")
+            client = httpx.Client(
+                http2=config.http2,
+                limits=config.limits(),
+                timeout=config.timeouts(),
+                event_hooks={"request": [_on_request]},
+            )
+            _clients[name] = client
+        return client
+
+
+def create_async_client(config: ClientConfig | None = None) -> httpx.AsyncClient:
+    """Create a pooled async client that reports to the shared metrics.
+
+    Async clients are bound to an event loop, so they are not cached and
+    should be used as an async context manager.
+
+    Args:
+        config (ClientConfig | None, optional): pool and timeout configuration.
+
+    Returns:
+        httpx.AsyncClient: pooled async client
+    """
+    config = config or ClientConfig()
+    return httpx.AsyncClient(
+        http2=config.http2,
+        limits=config.limits(),
+        timeout=config.timeouts(),
+        event_hooks={"request": [_on_async_request]},
+    )
+
+
+def close_clients() -> None:
+    """Close every shared client and release its pooled connections."""
+    with _clients_lock:
+        for name, client in _clients.items():
+            if not client.is_closed:
+                client.close()
+                logger.info(f"Closed shared HTTP client: {name}")
+        _clients.clear()
+
+
+atexit.register(close_clients)
@@ -0,0 +1,190 @@
+# Shared storage backend, copied into each package because they are built
+# and deployed separately. Keep in sync with:
+#   feature-processing/processing/gcp/backends.py
+#   analytics/analysis/gcp/backends.py
+#   app-backend/app/gcp/backends.py
+# The copies differ only in their settings and logger imports, and app-backend
+# reads the APP_BACKEND_GCP_* settings.
+# tests/test_shared_modules.py fails when the copies drift apart.
+
+import threading
+from pathlib import Path
+from typing import IO
+
+from google.cloud import storage
+from google.oauth2 import service_account
+
+from feature_pipeline.core.settings import SETTINGS
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class GCSBackend:
+    """Google Cloud Storage backend with a client pool shared by all threads.
+
+    The service account credentials are parsed once per process. Each thread
+    lazily gets its own client and bucket handles, since clients are not safe
+    to share between threads, and bucket handles are created without the
+    `get_bucket` round-trip.
+
+    Args:
+        project (str): GCP project
+        json_creds_path (str): path to the service account json
+    """
+
+    def __init__(self, project: str, json_creds_path: str) -> None:
+        self.project = project
+        self.json_creds_path = json_creds_path
+        self._credentials = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_credentials(self) -> service_account.Credentials:
+        with self._lock:
+            if self._credentials is None:
+                credentials = service_account.Credentials
+                self._credentials = credentials.from_service_account_file(
+                    self.json_creds_path
+                )
+            return self._credentials
+
+    def client(self) -> storage.Client:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            logger.info(f"Creating GCS client for {threading.current_thread().name}")
+            client = storage.Client(
+                project=self.project, credentials=self._get_credentials()
+            )
+            self._local.client = client
+            self._local.buckets = {}
+        return client
+
+    def bucket(self, bucket_name: str) -> storage.Bucket:
+        client = self.client()
+        buckets = self._local.buckets
+        if bucket_name not in buckets:
+            buckets[bucket_name] = client.bucket(bucket_name)
+        return buckets[bucket_name]
+
+    def create_bucket(self, bucket_name: str) -> None:
+        self.client().create_bucket(bucket_name)
+
+    def exists(self, bucket_name: str, blob_name: str) -> bool:
+        return self.bucket(bucket_name).blob(blob_name).exists()
+
+    def version(self, bucket_name: str, blob_name: str) -> str | None:
+        """Generation of a blob, which changes on every overwrite, or None."""
+        blob = self.bucket(bucket_name).get_blob(blob_name)
+        if blob is None:
+            return None
+        return str(blob.generation or blob.etag)
+
+    def open(self, bucket_name: str, blob_name: str, mode: str = "rb") -> IO:
+        return self.bucket(bucket_name).blob(blob_name).open(mode)
+
+    def upload(
+        self, bucket_name: str, blob_name: str, data: str | bytes, content_type: str
+    ) -> None:
+        self.bucket(bucket_name).blob(blob_name).upload_from_string(data, content_type)
+
+    def delete(self, bucket_name: str, blob_name: str) -> None:
+        """Delete a blob if it exists."""
+        blob = self.bucket(bucket_name).get_blob(blob_name)
+        if blob is not None:
+            blob.delete()
+
+    def list(self, bucket_name: str) -> list[str]:
+        return [blob.name for blob in self.client().list_blobs(bucket_name)]
+
+
+class LocalBackend:
+    """Local directory backend laid out as `<root>/<bucket>/<blob>`.
+
+    It implements the same methods as GCSBackend, not the fsspec filesystem
+    interface. Blobs are plain files, so pandas can also read them from
+    `url()`, and the pipeline can run and be benchmarked offline.
+
+    Args:
+        root (Path): directory holding one folder per bucket
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def path(self, bucket_name: str, blob_name: str) -> Path:
+        return self.root / bucket_name / blob_name
+
+    def url(self, bucket_name: str, blob_name: str) -> str:
+        return self.path(bucket_name, blob_name).resolve().as_uri()
+
+    def bucket(self, bucket_name: str) -> Path:
+        return self.root / bucket_name
+
+    def create_bucket(self, bucket_name: str) -> None:
+        self.bucket(bucket_name).mkdir(parents=True, exist_ok=True)
+
+    def exists(self, bucket_name: str, blob_name: str) -> bool:
+        return self.path(bucket_name, blob_name).exists()
+
+    def version(self, bucket_name: str, blob_name: str) -> str | None:
+        """Modification time and size of a blob, or None if it doesn't exist."""
+        path = self.path(bucket_name, blob_name)
+        if not path.exists():
+            return None
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def open(self, bucket_name: str, blob_name: str, mode: str = "rb") -> IO:
+        path = self.path(bucket_name, blob_name)
+        if "w" in mode:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode)
+
+    def upload(
+        self, bucket_name: str, blob_name: str, data: str | bytes, content_type: str
+    ) -> None:
+        with self.open(bucket_name, blob_name, "wb") as f:
+            f.write(data.encode() if isinstance(data, str) else data)
+
+    def delete(self, bucket_name: str, blob_name: str) -> None:
+        """Delete a blob if it exists."""
+        self.path(bucket_name, blob_name).unlink(missing_ok=True)
+
+    def list(self, bucket_name: str) -> list[str]:
+        bucket = self.bucket(bucket_name)
+        return sorted(
+            path.relative_to(bucket).as_posix()
+            for path in bucket.rglob("*")
+            if path.is_file()
+        )
+
+
+StorageBackend = GCSBackend | LocalBackend
+
+_backend: StorageBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> StorageBackend:
+    """Get the process-wide storage backend, creating it on first use.
+
+    STORAGE_BACKEND selects "gcs" (default) or "local", which stores blobs
+    under LOCAL_STORAGE_DIR.
+
+    Returns:
+        StorageBackend: shared storage backend
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if SETTINGS.get("STORAGE_BACKEND", "gcs") == "local":
+                root = Path(SETTINGS.get("LOCAL_STORAGE_DIR", Path.cwd() / "storage"))
+                logger.info(f"Using local storage backend at {root}")
+                _backend = LocalBackend(root)
+            else:
+                _backend = GCSBackend(
+                    SETTINGS["GOOGLE_CLOUD_PROJECT"],
+                    SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"],
+                )
+        return _backend
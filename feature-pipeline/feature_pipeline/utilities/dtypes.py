@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from feature_pipeline.utilities.utils import get_logger
+
+logger = get_logger(__name__)
+
+ColumnKind = Literal["numeric", "datetime", "categorical", "string"]
+
+# smallest nullable integer dtype first
+INT_DTYPES = ["Int8", "Int16", "Int32", "Int64"]
+
+
+@dataclass(frozen=True)
+class Column:
+    """Declared type of a dataframe column.
+
+    Args:
+        kind (ColumnKind): numeric, datetime, categorical or string
+        dtype (str | None): target dtype, e.g. "Int16" or "float32". Numeric
+            columns without a dtype are downcast to the smallest nullable
+            integer dtype if every value is whole, otherwise to float32.
+    """
+
+    kind: ColumnKind
+    dtype: str | None = None
+
+
+Schema = dict[str, Column]
+
+
+def _smallest_int(values: pd.Series) -> str:
+    if values.isna().all():
+        return "Int8"
+    low, high = values.min(), values.max()
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype.lower())
+        if info.min <= low and high <= info.max:
+            return dtype
+    return "Int64"
+
+
+def convert_column(series: pd.Series, column: Column) -> pd.Series:
+    """Convert a single column to its declared type in one pass.
+
+    Args:
+        series (pd.Series): column to convert
+        column (Column): declared column type
+
+    Returns:
+        pd.Series: converted column
+    """
+    if column.kind == "datetime":
+        return pd.to_datetime(series, utc=True, errors="coerce")
+    if column.kind == "categorical":
+        return series.astype("category")
+    if column.kind == "string":
+        return series.astype("string")
+
+    values = pd.to_numeric(series, errors="coerce")
+    dtype = column.dtype
+    if dtype is None:
+        whole = values.dropna()
+        dtype = _smallest_int(values) if (whole % 1 == 0).all() else "float32"
+    if dtype.lower().startswith(("int", "uint")):
+        values = np.floor(values)
+    return values.astype(dtype)
+
+
+def memory_report(before: pd.Series, after: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+    """Per-column memory usage before and after conversion.
+
+    Args:
+        before (pd.Series): deep memory usage per column before conversion
+        after (pd.DataFrame): converted dataframe
+        schema (Schema): converted columns
+
+    Returns:
+        pd.DataFrame: dtype, bytes before and after, and saving per column
+    """
+    columns = [col for col in schema if col in after.columns]
+    report = pd.DataFrame(
+        {
+            "dtype": after[columns].dtypes.astype(str),
+            "bytes_before": before[columns],
+            "bytes_after": after[columns].memory_usage(deep=True, index=False),
+        }
+    )
+    report["saving_pct"] = (
+        100 * (1 - report["bytes_after"] / report["bytes_before"])
+    ).round(1)
+    return report
+
+
+def convert(df: pd.DataFrame, schema: Schema, report: bool = True) -> pd.DataFrame:
+    """Convert the columns declared in `schema`, one column at a time, in place.
+
+    Columns missing from the dataframe are skipped and columns that fail to
+    convert are left unchanged.
+
+    Args:
+        df (pd.DataFrame): dataframe to convert
+        schema (Schema): declared type per column
+        report (bool, optional): log a per-column memory report. Defaults to True.
+
+    Returns:
+        pd.DataFrame: dataframe with converted columns
+    """
+    present = [col for col in schema if col in df.columns]
+    before = df[present].memory_usage(deep=True, index=False) if report else None
+
+    for col in present:
+        try:
+            df[col] = convert_column(df[col], schema[col])
+        except (ValueError, TypeError) as e:
+            logger.error(f"Unable to convert column {col}: {e}")
+
+    if report and present:
+        mem = memory_report(before, df, {col: schema[col] for col in present})
+        logger.info(
+            f"Converted {len(present)} columns: "
+            f"{mem['bytes_before'].sum():,} -> {mem['bytes_after'].sum():,} bytes"
+            f"\n{mem.to_string()}"
+        )
+    return df
@@ -0,0 +1,42 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket rate limiter shared by concurrent requests.
+
+    Tokens are refilled continuously at `rate` per second up to `capacity`,
+    so short bursts of up to `capacity` requests are allowed before callers
+    are throttled to the steady rate.
+    """
+
+    rate: float = 5.0
+    capacity: int = 5
+    _tokens: float = field(init=False, repr=False)
+    _updated: float = field(init=False, repr=False)
+    _lock: asyncio.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.capacity < 1:
+            raise ValueError("rate must be > 0 and capacity must be >= 1")
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
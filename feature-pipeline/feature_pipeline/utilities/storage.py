@@ -3,6 +3,16 @@ from dataclasses import dataclass
 from typing import Any
 import pandas as pd
 import joblib
+from feature_pipeline.utilities.backends import StorageBackend, get_backend
+from feature_pipeline.utilities.formats import (
+    ARTIFACT_FORMAT,
+    PARQUET_CONTENT_TYPE,
+    Filters,
+    artifact_blob,
+    read_csv,
+    read_parquet,
+    to_parquet,
+)
 from feature_pipeline.utilities.utils import get_logger
 from feature_pipeline.core.settings import SETTINGS
 
@@ -16,6 +26,11 @@ class GCP:
     bucket_project: str = SETTINGS["GOOGLE_CLOUD_PROJECT"]
     json_creds_path: str = SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"]
 
+    @property
+    def backend(self) -> StorageBackend:
+        """Process-wide storage backend, shared by every GCP instance."""
+        return get_backend()
+
     def create_gcp_bucket(self, bucket_name: str) -> None:
         """Creates a GCP bucket.
 
@@ -24,70 +39,79 @@ class GCP:
         """
         try:
             logger.info("Creating GCP bucket")
-            storage_client = storage.Client.from_service_account_json(
-                json_credentials_path=self.json_creds_path, project=self.bucket_project
-            )
-            bucket = storage_client.create_bucket(bucket_name)
-            logger.info(f"GCP bucket {bucket.name} created")
+            self.backend.create_bucket(bucket_name)
+            logger.info(f"GCP bucket {bucket_name} created")
         except Exception as e:
             logger.error(f"Error creating GCP bucket: {e}")
 
     def get_gcp_bucket(self, bucket_name: str) -> storage.Bucket:
-        """Get the GCP bucket object.
+        """Get the GCP bucket object, cached per thread by the backend.
 
         Returns:
             storage.Bucket: GCP bucket object
         """
         try:
-            logger.info("Getting GCP bucket")
-            storage_client = storage.Client.from_service_account_json(
-                json_credentials_path=self.json_creds_path, project=self.bucket_project
-            )
-            bucket = storage_client.get_bucket(bucket_name)
-            logger.info("GCP bucket retrieved")
-            return bucket
+            return self.backend.bucket(bucket_name)
         except Exception as e:
             logger.error(f"Error getting GCP bucket: {e}")
 
     def write_blob_to_bucket(
-        self, bucket_name: str, blob_name: str, data: pd.DataFrame
+        self,
+        bucket_name: str,
+        blob_name: str,
+        data: pd.DataFrame,
+        fmt: str = ARTIFACT_FORMAT,
     ) -> None:
-        """Writes a file to the bucket.
+        """Writes a dataframe artifact to the bucket.
 
         Args:
-            blob_name (str): name of blob in bucket
-            model (dict[str, Any]): dictionary of model information
+            bucket_name (str): name of bucket
+            blob_name (str): name of blob in bucket, its suffix is replaced by `fmt`
+            data (pd.DataFrame): dataframe to write
+            fmt (str, optional): "parquet" or "csv". Defaults to ARTIFACT_FORMAT.
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
-        # if bucket is None:
-        #     self.create_gcp_bucket(bucket_name)
-        #     bucket = self.get_gcp_bucket(bucket_name)
-
+        blob_name = artifact_blob(blob_name, fmt)
         logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        blob.upload_from_string(data.to_csv(index=False), "text/csv")
+        if fmt == "parquet":
+            self.backend.upload(
+                bucket_name, blob_name, to_parquet(data), PARQUET_CONTENT_TYPE
+            )
+        else:
+            self.backend.upload(
+                bucket_name, blob_name, data.to_csv(index=False), "text/csv"
+            )
+        # a stale copy in the other format would shadow or outlive this one
+        stale = artifact_blob(blob_name, "csv" if fmt == "parquet" else "parquet")
+        self.backend.delete(bucket_name, stale)
 
     def read_blob_from_bucket(
-        self, bucket_name: str, blob_name: str
+        self,
+        bucket_name: str,
+        blob_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ) -> pd.DataFrame | None:
-        """Reads a file from the bucket.
+        """Reads a dataframe artifact from the bucket, preferring its parquet copy.
+
+        Writing an artifact removes its copy in the other format, so an older
+        twin never shadows the latest write.
 
         Args:
             blob_name (str): name of blob in bucket
+            columns (list[str] | None, optional): columns to load. Defaults to None.
+            filters (Filters | None, optional): predicates rows must satisfy,
+                pushed down to parquet row groups. Defaults to None.
 
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
-            return None
-
-        with blob.open("rb") as f:
-            return pd.read_pickle(f)
+        readers = {"parquet": read_parquet, "csv": read_csv}
+        for fmt, reader in readers.items():
+            blob = artifact_blob(blob_name, fmt)
+            if self.backend.exists(bucket_name, blob):
+                with self.backend.open(bucket_name, blob, "rb") as f:
+                    return reader(f, columns=columns, filters=filters)
+        return None
 
 
 gcp = GCP()
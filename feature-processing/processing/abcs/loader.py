@@ -2,8 +2,16 @@ from abc import ABC, abstractmethod
 
 import pandas as pd
 
+from processing.core.formats import Filters
+
 
 class DataLoader(ABC):
     @abstractmethod
-    def load(self, bucket: str, blob: str) -> pd.DataFrame:
+    def load(
+        self,
+        bucket: str,
+        blob: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
         pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 import pandas as pd
 
@@ -12,3 +13,9 @@ class Processor(ABC):
     @abstractmethod
     def transform(self, data: pd.DataFrame | list[pd.DataFrame]) -> pd.DataFrame:
         pass
+
+    def dependencies(self) -> dict[str, Any]:
+        """Versions of state the output depends on besides the input and the
+        processor's parameters, e.g. a reference table. Part of the stage cache
+        fingerprint."""
+        return {}
@@ -0,0 +1,118 @@
+# Shared artifact formats, copied into each package because they are built
+# and deployed separately. Keep in sync with:
+#   feature-pipeline/feature_pipeline/utilities/formats.py
+#   analytics/analysis/core/formats.py
+# The copies differ only in their settings import.
+# tests/test_shared_modules.py fails when the copies drift apart.
+
+import io
+import operator
+from pathlib import PurePosixPath
+from typing import Any, Iterable
+
+import pandas as pd
+
+from processing.core.settings import SETTINGS
+
+# "parquet" for typed columnar artifacts, "csv" to export plain text
+ARTIFACT_FORMAT = SETTINGS.get("ARTIFACT_FORMAT", "parquet")
+
+PARQUET_COMPRESSION = "zstd"
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+# rows per row group, the unit that predicate pushdown skips on read
+ROW_GROUP_SIZE = 100_000
+
+# pyarrow-style conjunction of predicates, e.g. [("season", "=", "2022-2023")]
+Filters = list[tuple[str, str, Any]]
+
+OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def artifact_blob(blob: str, fmt: str = ARTIFACT_FORMAT) -> str:
+    """Name of the blob an artifact is stored under for a given format.
+
+    Callers address artifacts by their historical `.csv` names, which map to a
+    `.parquet` twin when stored as parquet.
+
+    Args:
+        blob (str): blob name, e.g. "processed_shooting.csv"
+        fmt (str, optional): "parquet" or "csv". Defaults to ARTIFACT_FORMAT.
+
+    Returns:
+        str: blob name with the format's suffix
+    """
+    return str(PurePosixPath(blob).with_suffix(f".{fmt}"))
+
+
+def logical_blobs(names: Iterable[str]) -> list[str]:
+    """Collapse parquet and csv copies of an artifact into one `.csv` name."""
+    logical = (
+        artifact_blob(name, "csv") if name.endswith(".parquet") else name
+        for name in names
+    )
+    return list(dict.fromkeys(logical))
+
+
+def to_parquet(data: pd.DataFrame) -> bytes:
+    """Serialise a frame to compressed parquet with its pandas schema embedded."""
+    buffer = io.BytesIO()
+    data.to_parquet(
+        buffer,
+        index=False,
+        compression=PARQUET_COMPRESSION,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    return buffer.getvalue()
+
+
+def read_parquet(
+    source: Any, columns: list[str] | None = None, filters: Filters | None = None
+) -> pd.DataFrame:
+    """Read parquet, loading only `columns` and the row groups `filters` can match.
+
+    Args:
+        source (Any): path or binary file object
+        columns (list[str] | None, optional): columns to load. Defaults to None.
+        filters (Filters | None, optional): predicates rows must satisfy.
+            Defaults to None.
+
+    Returns:
+        pd.DataFrame: matching rows with their stored dtypes
+    """
+    return pd.read_parquet(source, columns=columns, filters=filters or None)
+
+
+def filter_frame(data: pd.DataFrame, filters: Filters | None) -> pd.DataFrame:
+    """Apply parquet-style filters in memory, for formats without pushdown."""
+    if not filters:
+        return data
+
+    mask = pd.Series(True, index=data.index)
+    for column, op, value in filters:
+        if op == "in":
+            mask &= data[column].isin(value)
+        elif op == "not in":
+            mask &= ~data[column].isin(value)
+        else:
+            mask &= OPERATORS[op](data[column], value)
+    return data.loc[mask].reset_index(drop=True)
+
+
+def read_csv(
+    source: Any, columns: list[str] | None = None, filters: Filters | None = None
+) -> pd.DataFrame:
+    """Read a csv artifact with the same projection and filtering as parquet."""
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys(columns + [col for col, _, _ in filters or []]))
+    data = filter_frame(pd.read_csv(source, usecols=usecols), filters)
+    return data[columns] if columns is not None else data
@@ -1,19 +1,13 @@
-import gcsfs
 import numpy as np
 import pandas as pd
 
-from processing.core.settings import SETTINGS
+from processing.core.formats import Filters, logical_blobs, read_csv
+from processing.gcp.backends import get_backend
 
 
 class GCS:
-    def __init__(self) -> None:
-        self.fs = gcsfs.GCSFileSystem(
-            project=SETTINGS["GOOGLE_CLOUD_PROJECT"],
-            token=SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"],
-        )
-        self.storage_options = {
-            "token": SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"]
-        }
+    """Bucket listing and `<bucket>/<blob>` path reads through the configured
+    storage backend, so they work against the local backend too."""
 
     def list_bucket(
         self,
@@ -21,25 +15,27 @@ class GCS:
         include: list[str] | None = None,
         exclude: list[str] | None = None,
     ) -> list[str]:
+        # top level blobs only, as listing a gcs directory returned
+        blobs = logical_blobs(
+            blob for blob in get_backend().list(bucket) if "/" not in blob
+        )
         if include:
-            ls = [
-                blob.split("/")[-1]
-                for blob in self.fs.ls(bucket)
-                if blob.split("/")[-1] in include
-            ]
+            ls = [blob for blob in blobs if blob in include]
         elif exclude:
-            ls = [
-                blob.split("/")[-1]
-                for blob in self.fs.ls(bucket)
-                if blob.split("/")[-1] not in exclude
-            ]
+            ls = [blob for blob in blobs if blob not in exclude]
         else:
-            ls = [blob.split("/")[-1] for blob in self.fs.ls(bucket)]
+            ls = blobs
         return ls
 
-    def read_csv(self, path: str) -> pd.DataFrame:
-        load = f"gs://{path}"
-        return pd.read_csv(load, storage_options=self.storage_options)
+    def read_csv(
+        self,
+        path: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        bucket, blob = path.split("/", 1)
+        with get_backend().open(bucket, blob, "rb") as f:
+            return read_csv(f, columns=columns, filters=filters)
 
 
 gcs = GCS()
@@ -1,16 +1,31 @@
 import pandas as pd
 
 from processing.abcs.loader import DataLoader
+from processing.core.formats import Filters
 from processing.gcp.files import gcs
 from processing.gcp.storage import gcp
 
 
 class GCPLoader(DataLoader):
-    def load(self, bucket: str, blob: str) -> pd.DataFrame:
-        return gcp.read_df_from_bucket(bucket_name=bucket, blob_name=blob)
+    def load(
+        self,
+        bucket: str,
+        blob: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        return gcp.read_df_from_bucket(
+            bucket_name=bucket, blob_name=blob, columns=columns, filters=filters
+        )
 
 
 class CSVLoader(DataLoader):
-    def load(self, bucket: str, blob: str) -> pd.DataFrame:
+    def load(
+        self,
+        bucket: str,
+        blob: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
         path = f"{bucket}/{blob}"
-        return gcs.read_csv(path)
+        return gcs.read_csv(path, columns=columns, filters=filters)
@@ -3,17 +3,25 @@ from typing import Literal
 import pandas as pd
 
 from processing.abcs.saver import DataSaver
+from processing.core.formats import ARTIFACT_FORMAT
 from processing.gcp.storage import gcp
 
 
 class GCPSaver(DataSaver):
+    def __init__(self, fmt: str = ARTIFACT_FORMAT) -> None:
+        self.fmt = fmt
+
     def save(self, bucket: str, blob: str, data: pd.DataFrame) -> pd.DataFrame:
-        gcp.write_df_to_bucket(bucket_name=bucket, blob_name=blob, data=data)
+        gcp.write_df_to_bucket(
+            bucket_name=bucket, blob_name=blob, data=data, fmt=self.fmt
+        )
 
 
-def save(save: Literal["yes", "no"]) -> GCPSaver | None:
+def save(
+    save: Literal["yes", "no"], fmt: str = ARTIFACT_FORMAT
+) -> GCPSaver | None:
     if save == "yes":
-        saver = GCPSaver()
+        saver = GCPSaver(fmt=fmt)
     else:
         saver = None
     return saver
@@ -5,7 +5,17 @@ import joblib
 import pandas as pd
 from google.cloud import storage
 
+from processing.core.formats import (
+    ARTIFACT_FORMAT,
+    PARQUET_CONTENT_TYPE,
+    Filters,
+    artifact_blob,
+    read_csv,
+    read_parquet,
+    to_parquet,
+)
 from processing.core.settings import SETTINGS
+from processing.gcp.backends import StorageBackend, get_backend
 from processing.utilities.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,20 +29,19 @@ class GCP:
     bucket_project: str = SETTINGS["GOOGLE_CLOUD_PROJECT"]
     json_creds_path: str = SETTINGS["GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH"]
 
+    @property
+    def backend(self) -> StorageBackend:
+        """Process-wide storage backend, shared by every GCP instance."""
+        return get_backend()
+
     def get_gcp_bucket(self, bucket_name: str) -> storage.Bucket:
-        """Get the GCP bucket object.
+        """Get the GCP bucket object, cached per thread by the backend.
 
         Returns:
             storage.Bucket: GCP bucket object
         """
         try:
-            logger.info("Getting GCP bucket")
-            storage_client = storage.Client.from_service_account_json(
-                json_credentials_path=self.json_creds_path, project=self.bucket_project
-            )
-            bucket = storage_client.get_bucket(bucket_name)
-            logger.info("GCP bucket retrieved")
-            return bucket
+            return self.backend.bucket(bucket_name)
         except Exception as e:
             logger.error(f"Error getting GCP bucket: {e}")
 
@@ -45,12 +54,8 @@ class GCP:
             blob_name (str): name of blob in bucket
             model (dict[str, Any]): dictionary of model information
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
         logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        with blob.open("wb") as f:
+        with self.backend.open(bucket_name, blob_name, "wb") as f:
             joblib.dump(model, f)
         logger.info(f"{model['model']} has been saved to {blob_name}")
 
@@ -65,34 +70,58 @@ class GCP:
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-
-        if not blob.exists():
+        if not self.backend.exists(bucket_name, blob_name):
             return None
 
-        with blob.open("rb") as f:
+        with self.backend.open(bucket_name, blob_name, "rb") as f:
             return pd.read_pickle(f)
 
     def read_df_from_bucket(
-        self, bucket_name: str, blob_name: str
+        self,
+        bucket_name: str,
+        blob_name: str,
+        columns: list[str] | None = None,
+        filters: Filters | None = None,
     ) -> pd.DataFrame | None:
-        """Reads a file from the bucket.
+        """Reads a dataframe artifact from the bucket.
+
+        The parquet copy of the artifact is preferred, falling back to csv for
+        artifacts written before the switch to parquet. Writing an artifact
+        removes its copy in the other format, so an older twin never shadows the
+        latest write.
 
         Args:
             blob_name (str): name of blob in bucket
+            columns (list[str] | None, optional): columns to load. Defaults to None.
+            filters (Filters | None, optional): predicates rows must satisfy,
+                pushed down to parquet row groups. Defaults to None.
 
         Returns:
             pd.DataFrame | None: dataframe of blob contents or None if blob does not exist
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        readers = {"parquet": read_parquet, "csv": read_csv}
+        for fmt, reader in readers.items():
+            blob = artifact_blob(blob_name, fmt)
+            if self.backend.exists(bucket_name, blob):
+                with self.backend.open(bucket_name, blob, "rb") as f:
+                    return reader(f, columns=columns, filters=filters)
+        return None
 
-        if not blob.exists():
-            return None
+    def artifact_version(self, bucket_name: str, blob_name: str) -> str | None:
+        """Version of the copy of an artifact `read_df_from_bucket` would read.
+
+        Args:
+            bucket_name (str): name of bucket
+            blob_name (str): name of blob in bucket
 
-        with blob.open("rb") as f:
-            return pd.read_csv(f)
+        Returns:
+            str | None: format and storage version, or None if blob does not exist
+        """
+        for fmt in ("parquet", "csv"):
+            version = self.backend.version(bucket_name, artifact_blob(blob_name, fmt))
+            if version is not None:
+                return f"{fmt}:{version}"
+        return None
 
     def list_blobs(self, bucket_name: str) -> list[str]:
         """List all blobs in the bucket.
@@ -100,28 +129,37 @@ class GCP:
         Returns:
             list[str]: list of blob names
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
         logger.info(f"Listing blobs in {bucket_name}")
-        return [blob.name for blob in bucket.list_blobs()]
+        return self.backend.list(bucket_name)
 
     def write_df_to_bucket(
-        self, bucket_name: str, blob_name: str, data: pd.DataFrame
+        self,
+        bucket_name: str,
+        blob_name: str,
+        data: pd.DataFrame,
+        fmt: str = ARTIFACT_FORMAT,
     ) -> None:
-        """Writes a file to the bucket.
+        """Writes a dataframe artifact to the bucket.
 
         Args:
             bucket_name (str): name of bucket
-            blob_name (str): name of new blob
+            blob_name (str): name of new blob, its suffix is replaced by `fmt`
             data (pd.DataFrame): dataframe to write to blob
+            fmt (str, optional): "parquet" or "csv". Defaults to ARTIFACT_FORMAT.
         """
-        bucket = self.get_gcp_bucket(bucket_name)
-
-        logger.info(f"Creating blob: {blob_name}")
-        blob = bucket.blob(blob_name)
-
-        logger.info(f"Uploading dataframe to {blob_name} as a .csv file")
-        blob.upload_from_string(data.to_csv(index=False), "text/csv")
+        blob_name = artifact_blob(blob_name, fmt)
+        logger.info(f"Uploading dataframe to {blob_name}")
+        if fmt == "parquet":
+            self.backend.upload(
+                bucket_name, blob_name, to_parquet(data), PARQUET_CONTENT_TYPE
+            )
+        else:
+            self.backend.upload(
+                bucket_name, blob_name, data.to_csv(index=False), "text/csv"
+            )
+        # a stale copy in the other format would shadow or outlive this one
+        stale = artifact_blob(blob_name, "csv" if fmt == "parquet" else "parquet")
+        self.backend.delete(bucket_name, stale)
 
 
 gcp = GCP()
@@ -0,0 +1,110 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+from processing.core.settings import ROOT, SETTINGS
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# table shipped with the package
+PACKAGED_TABLE = Path(__file__).parent / "countries.json"
+
+# refreshed copy, preferred over the packaged table when present
+CACHE_TABLE = (
+    Path(SETTINGS.get("REFERENCE_CACHE_DIR", ROOT / "data" / "reference"))
+    / "countries.json"
+)
+
+
+@dataclass(frozen=True)
+class CountryTable:
+    """FIFA country codes with the country name and continent of each.
+
+    Args:
+        version (str): version of the table
+        countries (dict[str, str]): country name by FIFA code
+        continents (dict[str, str]): continent by country name
+    """
+
+    version: str
+    countries: dict[str, str]
+    continents: dict[str, str]
+
+    @cached_property
+    def digest(self) -> str:
+        """Hash of the table contents, which changes with any edit to a row."""
+        doc = json.dumps([self.countries, self.continents], sort_keys=True)
+        return hashlib.sha256(doc.encode()).hexdigest()[:16]
+
+    @classmethod
+    def read(cls, path: Path) -> "CountryTable":
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+        rows = doc["countries"]
+        return cls(
+            version=doc["version"],
+            countries={row["code"]: row["country"] for row in rows},
+            continents={
+                row["country"]: row["continent"] for row in rows if row["continent"]
+            },
+        )
+
+
+@lru_cache(maxsize=1)
+def country_table() -> CountryTable:
+    """Country table for this process, read from disk once.
+
+    Returns:
+        CountryTable: refreshed table if one was cached, else the packaged one
+    """
+    path = CACHE_TABLE if CACHE_TABLE.exists() else PACKAGED_TABLE
+    table = CountryTable.read(path)
+    logger.info(f"Loaded country table {table.version} from {path}")
+    return table
+
+
+def refresh(path: Path = CACHE_TABLE) -> CountryTable:
+    """Re-download the FIFA code tables and cache them on disk.
+
+    Continents are kept from the packaged table where the country is known and
+    looked up with pycountry for new countries.
+
+    Args:
+        path (Path, optional): where to write the table. Defaults to CACHE_TABLE.
+
+    Returns:
+        CountryTable: refreshed table
+    """
+    from processing.src.processors.fbref import helpers
+
+    known = CountryTable.read(PACKAGED_TABLE).continents
+    rows = []
+    for code, country in helpers.get_fifa_codes().items():
+        continent = known.get(country)
+        if continent is None:
+            try:
+                continent = helpers.get_continent(country)
+            except LookupError:
+                logger.warning(f"No continent found for {country}")
+        rows.append({"code": code, "country": country, "continent": continent})
+
+    doc = {
+        "version": date.today().isoformat(),
+        "source": "https://en.wikipedia.org/wiki/List_of_FIFA_country_codes",
+        "countries": rows,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2, ensure_ascii=False)
+
+    logger.info(f"Cached {len(rows)} countries to {path}")
+    country_table.cache_clear()
+    return CountryTable.read(path)
+
+
+if __name__ == "__main__":
+    refresh()
@@ -0,0 +1,232 @@
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import pandas as pd
+
+from processing.gcp.buckets import Buckets
+from processing.gcp.loader import GCPLoader
+from processing.gcp.saver import GCPSaver
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+REGISTRY_BUCKET = Buckets.PROCESSED_TRANSFERMARKT
+REGISTRY_BLOB = "player_registry.csv"
+
+COLUMNS = {
+    "player_id": "Int32",
+    "player": "string",
+    "name_key": "string",
+    "birth_year": "Int16",
+    "tm_id": "Int64",
+    "fpl_id": "Int64",
+}
+
+# letters NFKD doesn't decompose into an ascii base letter
+TRANSLITERATIONS = str.maketrans(
+    {
+        "ø": "o",
+        "æ": "ae",
+        "œ": "oe",
+        "ß": "ss",
+        "ł": "l",
+        "đ": "d",
+        "ð": "d",
+        "þ": "th",
+        "ı": "i",
+    }
+)
+
+# birth years estimated from age and season can be a year out either way
+BIRTH_YEAR_TOLERANCE = (0, -1, 1)
+
+
+def name_key(name: str) -> str:
+    """Lowercase ascii form of a player name, e.g. "Ødegaard" -> "odegaard"."""
+    folded = unicodedata.normalize("NFKD", name.lower().translate(TRANSLITERATIONS))
+    ascii_name = folded.encode("ascii", "ignore").decode("ascii")
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", ascii_name).split())
+
+
+@dataclass
+class PlayerRegistry:
+    """Append-only registry of player identities across sources.
+
+    Players are keyed by normalized name and birth year, and by their
+    transfermarkt or FPL id once one has been seen. IDs are assigned in
+    registration order and never reused or renumbered.
+
+    Args:
+        players (pd.DataFrame): registered players, with the COLUMNS schema
+    """
+
+    players: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame(
+            {col: pd.Series(dtype=dtype) for col, dtype in COLUMNS.items()}
+        )
+    )
+    _by_name: dict[tuple[str, int], list[int]] = field(
+        default_factory=dict, repr=False
+    )
+    _by_source: dict[tuple[str, int], int] = field(default_factory=dict, repr=False)
+    _sources: dict[int, dict[str, int]] = field(default_factory=dict, repr=False)
+    _new: list[dict] = field(default_factory=list, repr=False)
+    _linked: dict[tuple[int, str], int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        for row in self.players.itertuples(index=False):
+            self._index(row._asdict())
+
+    def _index(self, row: dict) -> None:
+        player_id = int(row["player_id"])
+        if not pd.isna(row["birth_year"]):
+            key = (row["name_key"], int(row["birth_year"]))
+            self._by_name.setdefault(key, []).append(player_id)
+        for source in ("tm_id", "fpl_id"):
+            if not pd.isna(row[source]):
+                self._by_source[(source, int(row[source]))] = player_id
+                self._sources.setdefault(player_id, {})[source] = int(row[source])
+
+    @property
+    def next_id(self) -> int:
+        return len(self.players) + len(self._new) + 1
+
+    def find(
+        self, player: str, birth_year: int | None, source_ids: dict[str, int]
+    ) -> int | None:
+        """ID of a registered player, or None if the player is unknown.
+
+        A name and birth year match is ignored when the registered player has a
+        different id from the same source, since that is a namesake rather than
+        the same player.
+        """
+        for source, value in source_ids.items():
+            if (source, value) in self._by_source:
+                return self._by_source[(source, value)]
+        if birth_year is None:
+            return None
+        key = name_key(player)
+        for offset in BIRTH_YEAR_TOLERANCE:
+            for player_id in self._by_name.get((key, birth_year + offset), []):
+                known = self._sources.get(player_id, {})
+                if all(
+                    known.get(source, value) == value
+                    for source, value in source_ids.items()
+                ):
+                    return player_id
+        return None
+
+    def _register(
+        self, player: str, birth_year: int | None, source_ids: dict[str, int]
+    ) -> int:
+        player_id = self.find(player, birth_year, source_ids)
+        if player_id is None:
+            row = {
+                "player_id": self.next_id,
+                "player": player,
+                "name_key": name_key(player),
+                "birth_year": birth_year,
+                "tm_id": source_ids.get("tm_id"),
+                "fpl_id": source_ids.get("fpl_id"),
+            }
+            self._new.append(row)
+            self._index({k: pd.NA if v is None else v for k, v in row.items()})
+            return row["player_id"]
+
+        # link source ids seen for the first time to the known player
+        for source, value in source_ids.items():
+            if (source, value) not in self._by_source:
+                self._by_source[(source, value)] = player_id
+                self._sources.setdefault(player_id, {})[source] = value
+                self._linked[(player_id, source)] = value
+        return player_id
+
+    def assign(
+        self,
+        players: pd.Series,
+        birth_years: pd.Series,
+        tm_ids: pd.Series | None = None,
+        fpl_ids: pd.Series | None = None,
+    ) -> pd.Series:
+        """IDs of a column of players, registering players not seen before.
+
+        Each distinct player is looked up once and the IDs are mapped back onto
+        the rows.
+
+        Args:
+            players (pd.Series): player names
+            birth_years (pd.Series): birth year of each player
+            tm_ids (pd.Series | None, optional): transfermarkt ids.
+                Defaults to None.
+            fpl_ids (pd.Series | None, optional): FPL ids. Defaults to None.
+
+        Returns:
+            pd.Series: Int32 player ids, missing where the name is missing
+        """
+        keys = pd.DataFrame(
+            {
+                "player": players,
+                "birth_year": pd.to_numeric(birth_years, errors="coerce").astype(
+                    "Int16"
+                ),
+                "tm_id": tm_ids if tm_ids is not None else pd.NA,
+                "fpl_id": fpl_ids if fpl_ids is not None else pd.NA,
+            },
+            index=players.index,
+        )
+        keys[["tm_id", "fpl_id"]] = keys[["tm_id", "fpl_id"]].apply(
+            pd.to_numeric, errors="coerce"
+        )
+
+        unique = keys.dropna(subset=["player"]).drop_duplicates()
+        unique["player_id"] = [
+            self._register(
+                row.player,
+                None if pd.isna(row.birth_year) else int(row.birth_year),
+                {
+                    source: int(getattr(row, source))
+                    for source in ("tm_id", "fpl_id")
+                    if not pd.isna(getattr(row, source))
+                },
+            )
+            for row in unique.itertuples(index=False)
+        ]
+
+        ids = keys.merge(unique, on=list(keys.columns), how="left")["player_id"]
+        return pd.Series(ids.to_numpy(), index=players.index, name="player_id").astype(
+            "Int32"
+        )
+
+    def save(self) -> None:
+        """Store newly registered players and newly linked source ids.
+
+        Existing rows only ever gain source ids they were missing, so IDs stay
+        stable across runs.
+        """
+        if not self._new and not self._linked:
+            return
+        players = self.players.set_index("player_id")
+        for (player_id, source), value in self._linked.items():
+            if player_id in players.index and pd.isna(players.at[player_id, source]):
+                players.at[player_id, source] = value
+        new = pd.DataFrame(self._new, columns=list(COLUMNS)).astype(COLUMNS)
+        self.players = pd.concat(
+            [players.reset_index(), new], ignore_index=True
+        ).astype(COLUMNS)
+        logger.info(
+            f"Registered {len(new)} new players, linked {len(self._linked)} ids, "
+            f"{len(self.players)} total"
+        )
+        self._new, self._linked = [], {}
+        GCPSaver().save(REGISTRY_BUCKET, REGISTRY_BLOB, self.players)
+
+
+@lru_cache(maxsize=1)
+def player_registry() -> PlayerRegistry:
+    """Player registry for this process, loaded once."""
+    df = GCPLoader().load(REGISTRY_BUCKET, REGISTRY_BLOB)
+    if df is None:
+        return PlayerRegistry()
+    return PlayerRegistry(df.astype(COLUMNS))
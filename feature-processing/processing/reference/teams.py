@@ -0,0 +1,225 @@
+import difflib
+import hashlib
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from processing.gcp.buckets import Buckets
+from processing.gcp.files import gcs
+from processing.gcp.loader import GCPLoader
+from processing.gcp.saver import GCPSaver
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# affixes, renames and manual overrides shipped with the package
+PACKAGED_TABLE = Path(__file__).parent / "teams.json"
+
+# built index, stored next to the processed transfermarkt artifacts
+INDEX_BUCKET = Buckets.PROCESSED_TRANSFERMARKT
+INDEX_BLOB = "team_index.csv"
+
+FUZZY_CUTOFF = 0.75
+
+
+@lru_cache(maxsize=1)
+def team_table() -> dict:
+    with open(PACKAGED_TABLE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def team_table_digest() -> str:
+    """Hash of the packaged table contents, which changes with any edit."""
+    doc = json.dumps(team_table(), sort_keys=True)
+    return hashlib.sha256(doc.encode()).hexdigest()[:16]
+
+
+def normalize(name: str) -> str:
+    """Matching key of a team or league name.
+
+    Accents, punctuation and club affixes such as "FC" or "1899" are dropped,
+    so "1-fc-koln" and "Köln" share the key "koln".
+
+    Args:
+        name (str): team name or transfermarkt slug
+
+    Returns:
+        str: lowercase key
+    """
+    ascii_name = (
+        unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    )
+    tokens = re.sub(r"[^0-9a-z]+", " ", ascii_name.lower()).split()
+    affixes = set(team_table()["affixes"])
+    kept = [token for token in tokens if token not in affixes]
+    return " ".join(kept or tokens)
+
+
+@lru_cache(maxsize=1)
+def team_overrides() -> dict[str, dict[str, str]]:
+    """Manual overrides with normalized league keys, built once per process."""
+    return {
+        normalize(league): teams for league, teams in team_table()["overrides"].items()
+    }
+
+
+def canonical_name(name: str) -> str:
+    """fbref team name with the packaged renames applied."""
+    return team_table()["renames"].get(name, name)
+
+
+@dataclass
+class TeamIndex:
+    """Maps team names from any source to the canonical fbref name per league.
+
+    Names are resolved by a manual override, then the normalized key, then key
+    token containment and finally fuzzy matching of the keys. Resolved names
+    are kept in `aliases`, so each distinct name is matched only once.
+
+    Args:
+        teams (dict[str, list[str]]): canonical team names by league key
+        aliases (dict[str, dict[str, str]]): canonical name by source name, by
+            league key
+    """
+
+    teams: dict[str, list[str]] = field(default_factory=dict)
+    aliases: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    def _keys(self, league: str) -> dict[str, str]:
+        return {normalize(team): team for team in self.teams.get(league, [])}
+
+    def _match(self, name: str, league: str) -> str | None:
+        keys = self._keys(league)
+        key = normalize(name)
+
+        override = team_overrides().get(league, {}).get(key)
+        if override in keys.values():
+            return override
+        if key in keys:
+            return keys[key]
+
+        tokens = set(key.split())
+        contained = [
+            team
+            for team_key, team in keys.items()
+            if set(team_key.split()) <= tokens or tokens <= set(team_key.split())
+        ]
+        if len(contained) == 1:
+            return contained[0]
+
+        close = difflib.get_close_matches(key, keys, n=1, cutoff=FUZZY_CUTOFF)
+        return keys[close[0]] if close else None
+
+    def resolve(self, name: str, league: str) -> str:
+        """Canonical name of a team, or the name itself if nothing matches."""
+        league = normalize(league)
+        aliases = self.aliases.setdefault(league, {})
+        if name not in aliases:
+            match = self._match(name, league)
+            if match is None:
+                logger.warning(f"No {league} team matches {name}")
+                match = name
+            aliases[name] = match
+        return aliases[name]
+
+    def map(self, teams: pd.Series, league: str) -> pd.Series:
+        """Canonical name of every team in a column, one lookup per distinct name.
+
+        Args:
+            teams (pd.Series): team names
+            league (str): league of the teams, e.g. "premier_league"
+
+        Returns:
+            pd.Series: canonical team names
+        """
+        lookup = {name: self.resolve(name, league) for name in teams.dropna().unique()}
+        return teams.map(lookup)
+
+    def to_frame(self) -> pd.DataFrame:
+        rows = [
+            (league, team, team, True)
+            for league, teams in self.teams.items()
+            for team in teams
+        ]
+        rows += [
+            (league, alias, team, False)
+            for league, aliases in self.aliases.items()
+            for alias, team in aliases.items()
+        ]
+        return pd.DataFrame(rows, columns=["league", "alias", "team", "canonical"])
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TeamIndex":
+        index = cls()
+        for league, group in df.groupby("league", observed=True):
+            canonical = group["canonical"].astype(bool)
+            index.teams[league] = group.loc[canonical, "team"].tolist()
+            aliases = group.loc[~canonical]
+            index.aliases[league] = dict(zip(aliases["alias"], aliases["team"]))
+        return index
+
+
+def build_index(save: bool = True) -> TeamIndex:
+    """Build the team index from the processed fbref wages and the transfermarkt
+    valuations, resolving every transfermarkt team once.
+
+    Args:
+        save (bool, optional): persist the index with the processed
+            transfermarkt artifacts. Defaults to True.
+
+    Returns:
+        TeamIndex: team index
+    """
+    loader = GCPLoader()
+    index = TeamIndex()
+
+    for blob in gcs.list_bucket(Buckets.PROCESSED_FBREF):
+        if "wages" not in blob:
+            continue
+        league = normalize(blob.removeprefix("processed_").split("-wages")[0])
+        squads = loader.load(Buckets.PROCESSED_FBREF, blob, columns=["squad"])
+        teams = set(index.teams.get(league, [])) | set(squads["squad"].dropna())
+        index.teams[league] = sorted(teams)
+
+    for blob in gcs.list_bucket(Buckets.TRANSFERMARKT):
+        if "player" not in blob:
+            continue
+        valuations = loader.load(
+            Buckets.TRANSFERMARKT, blob, columns=["team", "league"]
+        )
+        pairs = valuations[["team", "league"]].dropna().drop_duplicates()
+        for team, league in pairs.itertuples(index=False):
+            index.resolve(team, league)
+
+    logger.info(
+        f"Indexed {sum(len(teams) for teams in index.teams.values())} teams "
+        f"in {len(index.teams)} leagues"
+    )
+    if save:
+        # rewriting an unchanged index would invalidate every cached stage using it
+        stored = loader.load(INDEX_BUCKET, INDEX_BLOB)
+        df = index.to_frame()
+        if stored is not None and stored.astype(str).equals(df.astype(str)):
+            logger.info("Team index unchanged")
+        else:
+            GCPSaver().save(INDEX_BUCKET, INDEX_BLOB, df)
+    return index
+
+
+@lru_cache(maxsize=1)
+def team_index() -> TeamIndex:
+    """Team index for this process, loaded once and built if missing."""
+    df = GCPLoader().load(INDEX_BUCKET, INDEX_BLOB)
+    if df is None:
+        return build_index()
+    return TeamIndex.from_frame(df)
+
+
+if __name__ == "__main__":
+    build_index()
@@ -1,7 +1,7 @@
 from rich import print
 
 from processing.gcp.buckets import Buckets
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import save
 from processing.src.pipeline.join import Bucket
 from processing.src.processors.utils.joiners import Concat
@@ -11,7 +11,7 @@ def main() -> None:
     saver = save("yes")
     bucket = Buckets.JOINED_WAGES_VALUES
 
-    joiner = Bucket(join_method=Concat(), loader=CSVLoader(), saver=saver)
+    joiner = Bucket(join_method=Concat(), loader=GCPLoader(), saver=saver)
     df = joiner.process(bucket=bucket, output_blob="top_5_league_values_wages.csv")
 
     print(df)
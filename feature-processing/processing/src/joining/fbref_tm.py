@@ -2,7 +2,7 @@ from typing import Literal
 
 from rich import print
 
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import save
 from processing.src.pipeline.join import ValueWage
 from processing.src.processors.utils import cleaners
@@ -15,7 +15,7 @@ def _join(
     saver = save(save_file)
     join = ValueWage(
         processors=[cleaners.Filter(not_like="_val")],
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=saver,
         join_method=MultiJoin(
             on=["player", "season", "squad"], how="inner", suffixes=("_val", "")
@@ -2,7 +2,7 @@ from rich import print
 
 from processing.gcp.blobs import Blobs
 from processing.gcp.buckets import Buckets
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import save
 from processing.src.pipeline.join import Bucket, Merge
 from processing.src.processors.utils import cleaners
@@ -15,8 +15,9 @@ def main() -> None:
         join_method=MultiJoin(
             on=["player", "season", "squad"], how="inner", suffixes=("", "_x")
         ),
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=save("no"),
+        stream=True,
     )
 
     stats_df = stats_joiner.process(
@@ -27,7 +28,7 @@ def main() -> None:
         join_method=MultiJoin(
             on=["player", "season", "squad"], how="inner", suffixes=("", "_x")
         ),
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=save("yes"),
     )
 
@@ -1,7 +1,7 @@
 from rich import print
 
 from processing.gcp.buckets import Buckets
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import save
 from processing.src.pipeline.join import Merge
 from processing.src.processors.utils.cleaners import Filter
@@ -22,7 +22,7 @@ def main() -> None:
         join_method=MultiJoin(
             on=["player", "season", "squad"], how="inner", suffixes=("", "_stats")
         ),
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=save("yes"),
         processors=[Filter(not_like="_stats")],
     )
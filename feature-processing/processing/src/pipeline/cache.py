@@ -0,0 +1,266 @@
+import hashlib
+import inspect
+import json
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from processing.abcs.loader import DataLoader
+from processing.abcs.processor import Processor
+from processing.core.settings import ROOT, SETTINGS
+from processing.gcp.storage import gcp
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# "no" recomputes every stage, still recording why in the manifest
+STAGE_CACHE = SETTINGS.get("STAGE_CACHE", "yes") == "yes"
+
+# last run of each stage, kept on the machine running the pipeline
+STAGE_MANIFEST = Path(
+    SETTINGS.get("STAGE_MANIFEST", ROOT / "data" / "stage_manifest.json")
+)
+
+BlobPath = tuple[str, str]
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module: str) -> str:
+    try:
+        source = inspect.getsource(sys.modules[module])
+    except (KeyError, OSError, TypeError):
+        return ""
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def _project_modules(module: str) -> set[str]:
+    """Modules of the same package `module` references, directly or through
+    each other, by importing them or names defined in them."""
+    package = module.split(".")[0]
+    seen, pending = set(), [module]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in sys.modules:
+            continue
+        seen.add(name)
+        for value in vars(sys.modules[name]).values():
+            if inspect.ismodule(value):
+                ref = value.__name__
+            else:
+                ref = getattr(value, "__module__", None)
+            if isinstance(ref, str) and ref.split(".")[0] == package:
+                pending.append(ref)
+    return seen
+
+
+@lru_cache(maxsize=None)
+def _source_digest(module: str) -> str:
+    digests = [
+        f"{name}:{_module_digest(name)}" for name in sorted(_project_modules(module))
+    ]
+    if not digests:
+        return ""
+    return hashlib.sha256("\n".join(digests).encode()).hexdigest()[:16]
+
+
+def describe(value: Any) -> Any:
+    """JSON description of a pipeline step, down to its parameters.
+
+    Objects are described by their class, a digest of the source of the module
+    the class is defined in and of every project module it imports, their
+    public attributes and, for processors, their `dependencies()`, so editing a
+    processor's code, the helpers it uses or its configuration changes the
+    description.
+
+    Only imports visible in module namespaces are followed. Code loaded
+    dynamically, e.g. with importlib, and third-party packages are not
+    tracked, so upgrading pandas or a similar dependency needs STAGE_CACHE=no.
+
+    Args:
+        value (Any): processor, joiner, saver or parameter value
+
+    Returns:
+        Any: JSON-serialisable description
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): describe(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted((describe(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [describe(item) for item in value]
+    if isinstance(value, type) or inspect.isroutine(value):
+        name = f"{value.__module__}.{value.__qualname__}"
+        return {"name": name, "code": _source_digest(value.__module__)}
+
+    cls = type(value)
+    description = {
+        "class": f"{cls.__module__}.{cls.__qualname__}",
+        "code": _source_digest(cls.__module__),
+    }
+    if hasattr(value, "__dict__"):
+        params = {k: v for k, v in vars(value).items() if not k.startswith("_")}
+        description["params"] = describe(params)
+    else:
+        description["params"] = repr(value)
+    if isinstance(value, Processor):
+        description["dependencies"] = describe(value.dependencies())
+    return description
+
+
+def fingerprint(value: Any) -> str:
+    """Stable digest of `describe(value)`."""
+    doc = json.dumps(describe(value), sort_keys=True, default=str)
+    return hashlib.sha256(doc.encode()).hexdigest()
+
+
+@dataclass
+class StageRun:
+    """Manifest entry for the last run of a stage."""
+
+    stage: str
+    fingerprint: str
+    steps: str
+    inputs: dict[str, str | None]
+    output_version: str | None
+    recomputed: bool
+    reason: str
+    run_at: str
+
+
+class StageCache:
+    """Skips pipeline stages whose inputs and processors haven't changed.
+
+    A stage is identified by its output blob. Its fingerprint combines the
+    storage version of every input blob with `fingerprint` of its processing
+    steps. When both match the last run and the stored output is the one that
+    run wrote, the output is loaded instead of recomputed. Every decision is
+    written to the manifest with the reason a stage was recomputed.
+
+    Args:
+        manifest (Path, optional): manifest file. Defaults to STAGE_MANIFEST.
+        enabled (bool, optional): reuse unchanged stages. Defaults to STAGE_CACHE.
+    """
+
+    def __init__(self, manifest: Path = STAGE_MANIFEST, enabled: bool = STAGE_CACHE):
+        self.manifest = Path(manifest)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._runs: dict[str, dict] | None = None
+        self.session: list[StageRun] = []
+
+    def _previous(self, stage: str) -> dict | None:
+        with self._lock:
+            if self._runs is None:
+                self._runs = {}
+                if self.manifest.exists():
+                    self._runs = json.loads(self.manifest.read_text())["stages"]
+            return self._runs.get(stage)
+
+    def _record(self, run: StageRun) -> None:
+        with self._lock:
+            self._runs[run.stage] = asdict(run)
+            self.session.append(run)
+            self.manifest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"stages": self._runs}, indent=2))
+            tmp.replace(self.manifest)
+
+    def _reason(
+        self,
+        previous: dict | None,
+        steps: str,
+        inputs: dict[str, str | None],
+        output_version: str | None,
+    ) -> str | None:
+        if not self.enabled:
+            return "stage cache disabled"
+        if previous is None:
+            return "no previous run"
+        if output_version is None:
+            return "output missing"
+        if output_version != previous["output_version"]:
+            return "output overwritten since last run"
+        changed = sorted(
+            path
+            for path in set(inputs) | set(previous["inputs"])
+            if inputs.get(path) != previous["inputs"].get(path)
+        )
+        if changed:
+            return f"inputs changed: {', '.join(changed)}"
+        if steps != previous["steps"]:
+            return "processors changed"
+        return None
+
+    def run(
+        self,
+        inputs: list[BlobPath],
+        steps: list[Any],
+        output: BlobPath,
+        compute: Callable[[], pd.DataFrame],
+        loader: DataLoader,
+    ) -> pd.DataFrame:
+        """Run a stage, or load its stored output if nothing changed.
+
+        Args:
+            inputs (list[BlobPath]): (bucket, blob) of every input
+            steps (list[Any]): processors, joiners and saver of the stage
+            output (BlobPath): (bucket, blob) the stage saves to
+            compute (Callable[[], pd.DataFrame]): runs and saves the stage
+            loader (DataLoader): loads the stored output
+
+        Returns:
+            pd.DataFrame: stage output
+        """
+        stage = "/".join(output)
+        versions = {
+            f"{bucket}/{blob}": gcp.artifact_version(bucket, blob)
+            for bucket, blob in inputs
+        }
+        steps_digest = fingerprint(steps)
+        previous = self._previous(stage)
+        reason = self._reason(
+            previous, steps_digest, versions, gcp.artifact_version(*output)
+        )
+
+        if reason is None:
+            logger.info(f"Reusing {stage}: inputs and processors unchanged")
+            df = loader.load(*output)
+        else:
+            logger.info(f"Recomputing {stage}: {reason}")
+            df = compute()
+            # steps may update their own dependencies, e.g. registering players
+            steps_digest = fingerprint(steps)
+
+        self._record(
+            StageRun(
+                stage=stage,
+                fingerprint=fingerprint([versions, steps_digest]),
+                steps=steps_digest,
+                inputs=versions,
+                output_version=gcp.artifact_version(*output),
+                recomputed=reason is not None,
+                reason=reason or "unchanged",
+                run_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            )
+        )
+        return df
+
+    def log_summary(self) -> None:
+        recomputed = [run for run in self.session if run.recomputed]
+        logger.info(
+            f"{len(recomputed)} of {len(self.session)} stages recomputed, "
+            f"manifest at {self.manifest}"
+        )
+        for run in recomputed:
+            logger.info(f"  {run.stage}: {run.reason}")
+
+
+stage_cache = StageCache()
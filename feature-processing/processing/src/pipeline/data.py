@@ -5,6 +5,7 @@ import pandas as pd
 from processing.abcs.loader import DataLoader
 from processing.abcs.processor import Processor
 from processing.abcs.saver import DataSaver
+from processing.src.pipeline.cache import StageCache, stage_cache
 from processing.utilities.logger import get_logger
 
 logging = get_logger(__name__)
@@ -16,10 +17,12 @@ class DataProcessor:
         processors: list[Processor],
         loader: DataLoader,
         saver: DataSaver | None = None,
+        cache: StageCache | None = stage_cache,
     ) -> None:
         self.processors = processors
         self.loader = loader
         self.saver = saver
+        self.cache = cache
 
     def process(
         self,
@@ -27,6 +30,27 @@ class DataProcessor:
         blob: str,
         output_bucket: str | None = None,
         output_blob: str | None = None,
+    ) -> pd.DataFrame:
+        """Process a blob, reusing the saved output if neither the blob nor the
+        processors changed since it was saved."""
+        args = (bucket, blob, output_bucket, output_blob)
+        # only saved outputs can be reused
+        if self.cache is None or not (self.saver and output_bucket and output_blob):
+            return self._process(*args)
+        return self.cache.run(
+            inputs=[(bucket, blob)],
+            steps=[*self.processors, self.saver],
+            output=(output_bucket, output_blob),
+            compute=lambda: self._process(*args),
+            loader=self.loader,
+        )
+
+    def _process(
+        self,
+        bucket: str,
+        blob: str,
+        output_bucket: str | None = None,
+        output_blob: str | None = None,
     ) -> pd.DataFrame:
         df = self.loader.load(bucket=bucket, blob=blob)
         logging.info(f"blob: \n{blob}")
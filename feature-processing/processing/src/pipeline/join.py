@@ -7,6 +7,9 @@ from processing.abcs.processor import Processor
 from processing.abcs.saver import DataSaver
 from processing.gcp.buckets import Buckets
 from processing.gcp.files import gcs
+from processing.src.pipeline.cache import StageCache, stage_cache
+from processing.src.pipeline.loading import LOAD_WORKERS, ConcurrentLoader
+from processing.src.processors.utils.joiners import Joiner
 from processing.utilities.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,11 +22,15 @@ class Merge:
         loader: DataLoader,
         saver: DataSaver | None = None,
         processors: list[Processor] | None = None,
+        max_workers: int = LOAD_WORKERS,
+        cache: StageCache | None = stage_cache,
     ) -> None:
         self.join_method = join_method
         self.loader = loader
         self.saver = saver
         self.processors = processors
+        self.cache = cache
+        self.loads = ConcurrentLoader(loader, max_workers=max_workers)
 
     def process(
         self,
@@ -32,17 +39,42 @@ class Merge:
         left_df: pd.DataFrame | None = None,
         right_df: pd.DataFrame | None = None,
         output_path: str | None = None,
+    ) -> pd.DataFrame:
+        """Join two frames or blobs. Joins of two blobs into a saved output are
+        skipped when neither blob nor the join changed since the last run."""
+        args = (left_path, right_path, left_df, right_df, output_path)
+        paths = [path for path in (left_path, right_path) if path is not None]
+        if self.cache is None or not (self.saver and output_path) or len(paths) < 2:
+            return self._process(*args)
+        return self.cache.run(
+            inputs=[(path.split("/")[0], path.split("/")[-1]) for path in paths],
+            steps=[self.join_method, *(self.processors or []), self.saver],
+            output=(output_path.split("/")[0], output_path.split("/")[-1]),
+            compute=lambda: self._process(*args),
+            loader=self.loader,
+        )
+
+    def _process(
+        self,
+        left_path: str | None = None,
+        right_path: str | None = None,
+        left_df: pd.DataFrame | None = None,
+        right_df: pd.DataFrame | None = None,
+        output_path: str | None = None,
     ) -> pd.DataFrame:
         logger.info(f"Joining {left_path} or {left_df} and {right_path} or {right_df}")
+        paths = {
+            side: (path.split("/")[0], path.split("/")[-1])
+            for side, path in (("left", left_path), ("right", right_path))
+            if path is not None
+        }
+        loaded = dict(zip(paths, self.loads.load(list(paths.values()))))
+
         if left_path is not None:
-            left_bucket = left_path.split("/")[0]
-            left_blob = left_path.split("/")[-1]
-            left_data = self.loader.load(left_bucket, left_blob)
+            left_data = loaded["left"]
 
         if right_path is not None:
-            right_bucket = right_path.split("/")[0]
-            right_blob = right_path.split("/")[-1]
-            right_data = self.loader.load(right_bucket, right_blob)
+            right_data = loaded["right"]
 
         if left_df is not None:
             left_data = left_df
@@ -76,17 +108,33 @@ class Merge:
 
 
 class Bucket:
+    """Joins every blob of a bucket.
+
+    Blobs are loaded through a bounded thread pool. With `stream`, each frame is
+    folded into the join as soon as it arrives rather than after all blobs are
+    loaded, which needs a pairwise `Joiner` as the join method. A saved join is
+    reused while the bucket's blobs and the join are unchanged.
+    """
+
     def __init__(
         self,
         join_method: Processor,
         loader: DataLoader,
         saver: DataSaver | None = None,
         processors: list[Processor] | None = None,
+        max_workers: int = LOAD_WORKERS,
+        stream: bool = False,
+        cache: StageCache | None = stage_cache,
     ) -> None:
+        if stream and not isinstance(join_method, Joiner):
+            raise TypeError("Streaming joins need a Joiner join method")
         self.processors = processors
         self.loader = loader
         self.saver = saver
         self.join_method = join_method
+        self.stream = stream
+        self.cache = cache
+        self.loads = ConcurrentLoader(loader, max_workers=max_workers)
 
     def process(
         self,
@@ -102,17 +150,27 @@ class Bucket:
         logger.info(f"Found {len(files)} files in {bucket}")
 
         if output_blob is not None:
-            dfs = [
-                self.loader.load(bucket, file)
-                for file in files
-                if output_blob not in file
-            ]
+            files = [file for file in files if output_blob not in file]
+        paths = [(bucket, file) for file in files]
+
+        if self.cache is None or not (self.saver and output_blob):
+            return self._join(paths, bucket, output_blob)
+        return self.cache.run(
+            inputs=paths,
+            steps=[self.join_method, *(self.processors or []), self.saver],
+            output=(bucket, output_blob),
+            compute=lambda: self._join(paths, bucket, output_blob),
+            loader=self.loader,
+        )
 
+    def _join(
+        self, paths: list[tuple[str, str]], bucket: str, output_blob: str | None
+    ) -> pd.DataFrame:
+        logger.info(f"Joining {len(paths)} dataframes")
+        if self.stream:
+            joined_df = reduce(self.join_method.combine, self.loads.iter_frames(paths))
         else:
-            dfs = [self.loader.load(bucket, file) for file in files]
-
-        logger.info(f"Joining {len(dfs)} dataframes")
-        joined_df = self.join_method.transform(dfs)
+            joined_df = self.join_method.transform(self.loads.load(paths))
 
         if self.processors is not None:
             logger.info(f"Applying {len(self.processors)} processors")
@@ -136,22 +194,40 @@ class ValueWage:
         loader: DataLoader,
         saver: DataSaver | None = None,
         processors: list[Processor] | None = None,
+        max_workers: int = LOAD_WORKERS,
+        cache: StageCache | None = stage_cache,
     ) -> None:
         self.processors = processors
         self.join_method = join_method
         self.loader = loader
         self.saver = saver
+        self.cache = cache
+        self.loads = ConcurrentLoader(loader, max_workers=max_workers)
 
     def process(self, val_blob: str, wage_blob: str) -> pd.DataFrame:
+        paths = [
+            (
+                Buckets.PROCESSED_TRANSFERMARKT,
+                f"processed_{val_blob}_player_valuations.csv",
+            ),
+            (Buckets.PROCESSED_FBREF, f"processed_{wage_blob}-wages.csv"),
+        ]
+        if self.cache is None or not self.saver:
+            return self._process(paths, val_blob, wage_blob)
+        return self.cache.run(
+            inputs=paths,
+            steps=[self.join_method, *(self.processors or []), self.saver],
+            output=(Buckets.JOINED_WAGES_VALUES, f"{val_blob}_wages_values.csv"),
+            compute=lambda: self._process(paths, val_blob, wage_blob),
+            loader=self.loader,
+        )
+
+    def _process(
+        self, paths: list[tuple[str, str]], val_blob: str, wage_blob: str
+    ) -> pd.DataFrame:
         logger.info(f"Joining {wage_blob} wages and valuations")
 
-        val_df = self.loader.load(
-            bucket=Buckets.PROCESSED_TRANSFERMARKT,
-            blob=f"processed_{val_blob}_player_valuations.csv",
-        )
-        wage_df = self.loader.load(
-            bucket=Buckets.PROCESSED_FBREF, blob=f"processed_{wage_blob}-wages.csv"
-        )
+        val_df, wage_df = self.loads.load(paths)
 
         joined_df = self.join_method.transform([val_df, wage_df])
 
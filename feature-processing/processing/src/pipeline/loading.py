@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import pandas as pd
+
+from processing.abcs.loader import DataLoader
+from processing.core.settings import SETTINGS
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# blobs downloaded and parsed at once
+LOAD_WORKERS = int(SETTINGS.get("LOAD_WORKERS", 8))
+
+
+@dataclass
+class BlobTiming:
+    bucket: str
+    blob: str
+    rows: int
+    elapsed: float
+
+
+@dataclass
+class LoadReport:
+    """Per-blob timings of a concurrent load."""
+
+    timings: list[BlobTiming] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def log_summary(self) -> None:
+        busy = sum(timing.elapsed for timing in self.timings)
+        logger.info(
+            f"Loaded {len(self.timings)} blobs in {self.elapsed:.2f}s "
+            f"({busy:.2f}s of loading)"
+        )
+        for timing in sorted(self.timings, key=lambda t: t.elapsed, reverse=True):
+            logger.info(
+                f"  {timing.bucket}/{timing.blob}: {timing.rows:,} rows "
+                f"in {timing.elapsed:.2f}s"
+            )
+
+
+@dataclass
+class ConcurrentLoader:
+    """Loads several blobs through a bounded thread pool.
+
+    Args:
+        loader (DataLoader): loader used for each blob
+        max_workers (int): blobs loaded at once
+    """
+
+    loader: DataLoader
+    max_workers: int = LOAD_WORKERS
+    report: LoadReport = field(default_factory=LoadReport)
+
+    def _load(self, bucket: str, blob: str) -> pd.DataFrame:
+        start = time.perf_counter()
+        df = self.loader.load(bucket=bucket, blob=blob)
+        timing = BlobTiming(bucket, blob, len(df), time.perf_counter() - start)
+        self.report.timings.append(timing)
+        return df
+
+    def iter_frames(self, paths: list[tuple[str, str]]) -> Iterator[pd.DataFrame]:
+        """Yield the frame of each (bucket, blob) pair in order, as soon as it
+        is loaded.
+
+        At most `max_workers` blobs are in flight, so only that many raw frames
+        are held besides the one the caller is consuming.
+
+        Args:
+            paths (list[tuple[str, str]]): (bucket, blob) pairs to load
+
+        Yields:
+            pd.DataFrame: loaded frames, in the order of `paths`
+        """
+        self.report = LoadReport()
+        start = time.perf_counter()
+        pending = iter(paths)
+        in_flight: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for bucket, blob in pending:
+                in_flight.append(pool.submit(self._load, bucket, blob))
+                if len(in_flight) >= self.max_workers:
+                    break
+
+            while in_flight:
+                df = in_flight.popleft().result()
+                next_path = next(pending, None)
+                if next_path is not None:
+                    in_flight.append(pool.submit(self._load, *next_path))
+                yield df
+
+        self.report.elapsed = time.perf_counter() - start
+        self.report.log_summary()
+
+    def load(self, paths: list[tuple[str, str]]) -> list[pd.DataFrame]:
+        """Load every (bucket, blob) pair, returning frames in the order of
+        `paths`."""
+        return list(self.iter_frames(paths))
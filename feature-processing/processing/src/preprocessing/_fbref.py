@@ -4,7 +4,7 @@ from rich import print
 
 from processing.abcs.processor import Processor
 from processing.gcp.buckets import Buckets
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import GCPSaver
 from processing.src.pipeline.data import DataProcessor
 from processing.src.processors.fbref import (
@@ -19,8 +19,7 @@ from processing.src.processors.utils import cleaners
 
 
 def run_stats(blob: str, output_blob: str, save: Literal["yes", "no"] = "no") -> None:
-    league = blob.split("-")[0]
-    dp = _base(add_processors=[rename_teams.Process(league=league)], save=save)
+    dp = _base(add_processors=[rename_teams.Process()], save=save)
     df = dp.process(
         bucket=Buckets.FBREF,
         blob=blob,
@@ -31,11 +30,9 @@ def run_stats(blob: str, output_blob: str, save: Literal["yes", "no"] = "no") ->
 
 
 def run_wages(blob: str, output_blob: str, save: Literal["yes", "no"] = "no") -> None:
-    league = blob.split("-")[0]
-    print(league)
     dp = _base(
         add_processors=[
-            rename_teams.Process(league=league),
+            rename_teams.Process(),
             cleaners.Drop(
                 features=["nation", "pos", "notes", "rk", "general_pos", "country"]
             ),
@@ -73,6 +70,6 @@ def _base(
 
     return DataProcessor(
         processors=processors,
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=saver,
     )
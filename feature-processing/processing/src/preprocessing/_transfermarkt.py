@@ -3,7 +3,7 @@ from typing import Literal
 from rich import print
 
 from processing.gcp.buckets import Buckets
-from processing.gcp.loader import CSVLoader
+from processing.gcp.loader import GCPLoader
 from processing.gcp.saver import GCPSaver
 from processing.src.pipeline.data import DataProcessor
 from processing.src.processors.transfermarkt import (
@@ -11,7 +11,6 @@ from processing.src.processors.transfermarkt import (
     foreign_pct,
     map_team_names,
     player_id,
-    rename_teams,
     signed_year,
     team_season,
 )
@@ -26,8 +25,6 @@ def run_players(
     else:
         saver = None
 
-    league = blob.split("_")[0]
-
     dp = DataProcessor(
         processors=[
             signed_year.Process(),
@@ -35,8 +32,7 @@ def run_players(
             player_id.Process(),
             cleaners.Rename(features={"team": "squad"}),
             filter_teams.Process(),
-            rename_teams.Process(),
-            map_team_names.Process(league=league),
+            map_team_names.Process(),
             cleaners.Drop(
                 features=[
                     "tm_id",
@@ -48,7 +44,7 @@ def run_players(
                 ]
             ),
         ],
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=saver,
     )
 
@@ -75,7 +71,7 @@ def run_teams(
             foreign_pct.Process(),
             cleaners.Rename(features={"team": "squad"}),
         ],
-        loader=CSVLoader(),
+        loader=GCPLoader(),
         saver=saver,
     )
 
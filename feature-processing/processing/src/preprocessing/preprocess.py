@@ -1,5 +1,7 @@
 from processing.gcp.buckets import Buckets
 from processing.gcp.files import gcs
+from processing.reference import teams
+from processing.src.pipeline.cache import stage_cache
 from processing.src.preprocessing import _fbref, _transfermarkt
 from processing.utilities.logger import get_logger
 
@@ -26,6 +28,10 @@ def main() -> None:
         logger.info(file)
         _fbref.run_stats(blob=file, output_blob=f"processed_{file}", save=save)
 
+    logger.info("Rebuilding team index from processed wages")
+    teams.build_index(save=save == "yes")
+    teams.team_index.cache_clear()
+
     logger.info("Preprocessing for transfermarkt player data")
 
     for file in transfermarkt_player:
@@ -41,6 +47,7 @@ def main() -> None:
         _transfermarkt.run_teams(blob=file, output_blob=f"processed_{file}", save=save)
 
     logger.info("Preprocessing complete")
+    stage_cache.log_summary()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 import pandas as pd
 
 from processing.abcs.processor import Processor
-from processing.src.processors.fbref import helpers
+from processing.src.processors.utils import derive
+
+AGE_EDGES = [20, 25, 30, 35, 40]
+AGE_RANGES = ["Under 20", "20-24", "25-29", "30-34", "35-39", "Over 40"]
 
 
 class Process(Processor):
@@ -9,5 +12,6 @@ class Process(Processor):
         super().__init__(None)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["age_range"] = df["age"].apply(helpers.get_age_range)
+        df["age_range"] = derive.bin_category(df["age"], AGE_EDGES, AGE_RANGES)
         return df
+
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from processing.src.processors.fbref import helpers
+from processing.src.processors.fbref.age_range import AGE_EDGES, AGE_RANGES
+from processing.src.processors.fbref.general_pos import POSITIONS
+from processing.src.processors.utils import derive
+
+
+def age_range(rows: int = 1_000_000) -> dict[str, float]:
+    """Time `helpers.get_age_range` against the vectorised age range."""
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.integers(15, 45, size=rows))
+    return derive.benchmark(
+        lambda age: derive.bin_category(age, AGE_EDGES, AGE_RANGES),
+        helpers.get_age_range,
+        values,
+    )
+
+
+def general_pos(rows: int = 1_000_000) -> dict[str, float]:
+    """Time `helpers.get_position` against the vectorised general position."""
+    rng = np.random.default_rng(0)
+    positions = ["DF", "MF", "FW", "GK", "DF,MF", "FW,MF", "MF,FW", np.nan]
+    values = pd.Series(rng.choice(np.array(positions, dtype=object), size=rows))
+    return derive.benchmark(
+        lambda pos: derive.prefix_category(pos, POSITIONS),
+        helpers.get_position,
+        values,
+    )
+
+
+if __name__ == "__main__":
+    age_range()
+    general_pos()
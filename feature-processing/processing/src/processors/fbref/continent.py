@@ -1,7 +1,8 @@
 import pandas as pd
 
 from processing.abcs.processor import Processor
-from processing.src.processors.fbref import helpers
+from processing.reference.continents import continent_lookup
+from processing.reference.countries import country_table
 
 
 class Process(Processor):
@@ -9,5 +10,8 @@ class Process(Processor):
         super().__init__(None)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["continent"] = df["country"].apply(helpers.get_continent)
+        df["continent"] = continent_lookup.map(df["country"])
         return df
+
+    def dependencies(self) -> dict[str, str]:
+        return {"countries": country_table().digest}
@@ -1,7 +1,7 @@
 import pandas as pd
 
 from processing.abcs.processor import Processor
-from processing.src.processors.fbref import helpers
+from processing.reference.countries import country_table
 
 
 class Process(Processor):
@@ -9,6 +9,8 @@ class Process(Processor):
         super().__init__(None)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        codes = helpers.get_fifa_codes()
-        df["country"] = df["nation"].map(codes)
+        df["country"] = df["nation"].map(country_table().countries)
         return df
+
+    def dependencies(self) -> dict[str, str]:
+        return {"countries": country_table().digest}
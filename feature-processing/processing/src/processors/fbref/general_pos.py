@@ -1,7 +1,10 @@
 import pandas as pd
 
 from processing.abcs.processor import Processor
-from processing.src.processors.fbref import helpers
+from processing.src.processors.utils import derive
+
+# general position by the first letter of the fbref position, e.g. "DF,MF"
+POSITIONS = {"D": "Defender", "M": "Midfielder", "F": "Forward", "G": "Goalkeeper"}
 
 
 class Process(Processor):
@@ -9,5 +12,6 @@ class Process(Processor):
         super().__init__(None)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["general_pos"] = df["pos"].apply(helpers.get_position)
+        df["general_pos"] = derive.prefix_category(df["pos"], POSITIONS)
         return df
+
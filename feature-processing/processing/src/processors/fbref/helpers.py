@@ -8,6 +8,9 @@ from bs4 import BeautifulSoup
 def get_fifa_codes() -> dict[str, str]:
     """Returns a dictionary of FIFA country codes and country names.
 
+    Downloads the tables from Wikipedia, so it is only used to refresh the
+    reference table in `processing.reference.countries`.
+
     Returns:
         dict[str, str]: dictionary of FIFA country codes and country names
     """
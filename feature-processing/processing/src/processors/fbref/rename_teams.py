@@ -1,26 +1,18 @@
 import pandas as pd
-from rich import print
 
 from processing.abcs.processor import Processor
+from processing.reference.teams import team_table, team_table_digest
 
 
 class Process(Processor):
-    def __init__(self, league: str) -> None:
+    """Rename fbref teams whose spelling differs between fbref tables."""
+
+    def __init__(self) -> None:
         super().__init__(None)
-        self.league = league
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        if self.league.lower() == "la":
-            replacements = {
-                "Betis": "Real Betis",
-                "Valladolid": "Real Valladolid",
-                "Málaga": "Malaga",
-                "Cádiz": "Cadiz",
-            }
-            df.loc[:, "squad"] = df["squad"].map(replacements).fillna(df["squad"])
-
-        if self.league.lower() == "bundesliga":
-            df.loc[:, "squad"] = df["squad"].replace("M'Gladbach", "Monchengladbach")
-
-        print(df["squad"].unique())
+        df.loc[:, "squad"] = df["squad"].replace(team_table()["renames"])
         return df
+
+    def dependencies(self) -> dict[str, str]:
+        return {"teams": team_table_digest()}
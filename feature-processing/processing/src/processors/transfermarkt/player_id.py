@@ -1,14 +1,31 @@
 import pandas as pd
 
 from processing.abcs.processor import Processor
-from processing.src.processors.transfermarkt import helpers
+from processing.gcp.storage import gcp
+from processing.reference.players import (
+    REGISTRY_BLOB,
+    REGISTRY_BUCKET,
+    player_registry,
+)
 
 
 class Process(Processor):
+    """Add the registry player id, registering players seen for the first time."""
+
     def __init__(self) -> None:
         super().__init__(None)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        id_map = helpers.generate_unique_id()
-        df.loc[:, "player_id"] = df["player"].map(id_map).astype("Int64")
+        registry = player_registry()
+        # transfermarkt lists age during the season, which starts in `season`
+        birth_year = pd.to_numeric(df["season"], errors="coerce") - pd.to_numeric(
+            df["age"], errors="coerce"
+        )
+        df.loc[:, "player_id"] = registry.assign(
+            df["player"], birth_year, tm_ids=df["tm_id"]
+        )
+        registry.save()
         return df
+
+    def dependencies(self) -> dict[str, str | None]:
+        return {"player_registry": gcp.artifact_version(REGISTRY_BUCKET, REGISTRY_BLOB)}
@@ -0,0 +1,119 @@
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from processing.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def prefix_category(
+    values: pd.Series, prefixes: dict[str, str], default: str = "Unknown"
+) -> pd.Series:
+    """Categorise strings by their prefix.
+
+    Prefixes are tried in order and the first match wins. Missing values and
+    strings matching no prefix get `default`. Each distinct string is matched
+    once, so the cost scales with the number of unique values.
+
+    Args:
+        values (pd.Series): strings to categorise
+        prefixes (dict[str, str]): category by prefix, e.g. {"D": "Defender"}
+        default (str, optional): category when no prefix matches.
+            Defaults to "Unknown".
+
+    Returns:
+        pd.Series: category column
+    """
+    codes, uniques = pd.factorize(values)
+    strings = pd.Series(uniques, dtype="string")
+    conditions = [
+        strings.str.startswith(prefix).fillna(False).to_numpy(dtype=bool)
+        for prefix in prefixes
+    ]
+    labels = list(prefixes.values())
+    categories = list(dict.fromkeys(labels + [default]))
+    derived = pd.Categorical(
+        np.select(conditions, labels, default=default), categories=categories
+    )
+
+    # missing values (code -1) take the default category
+    missing = categories.index(default)
+    codes = np.append(derived.codes, missing)[codes]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def bin_category(
+    values: pd.Series, edges: list[float], labels: list[str]
+) -> pd.Series:
+    """Bin numbers into ordered categories.
+
+    Bins include their lower edge, so with edges [20, 25] the value 20 falls in
+    the second bin. Values below the first edge fall in the first bin and values
+    from the last edge on fall in the last bin, so `labels` has one more entry
+    than `edges`. Missing or non-numeric values stay missing.
+
+    Args:
+        values (pd.Series): numbers, or strings of numbers
+        edges (list[float]): increasing bin edges
+        labels (list[str]): label of each bin, in order
+
+    Returns:
+        pd.Series: ordered category column
+    """
+    numbers = pd.to_numeric(values, errors="coerce")
+    return pd.cut(
+        numbers,
+        bins=[-np.inf, *edges, np.inf],
+        labels=labels,
+        right=False,
+        ordered=True,
+    )
+
+
+def benchmark(
+    derive: Callable[[pd.Series], pd.Series],
+    row_wise: Callable,
+    values: pd.Series,
+) -> dict[str, float]:
+    """Check a vectorised derivation against its row-wise original and time both.
+
+    Args:
+        derive (Callable[[pd.Series], pd.Series]): vectorised derivation
+        row_wise (Callable): original function applied to each value
+        values (pd.Series): input column
+
+    Raises:
+        AssertionError: if any row differs, including rows only one approach
+            leaves missing
+
+    Returns:
+        dict[str, float]: rows per second of each approach
+    """
+    start = time.perf_counter()
+    expected = values.apply(row_wise)
+    row_wise_rate = len(values) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    derived = derive(values)
+    vectorised_rate = len(values) / (time.perf_counter() - start)
+
+    # rows missing in both outputs agree, rows missing in only one don't
+    derived, expected = derived.astype(object), expected.astype(object)
+    mismatches = derived.ne(expected) & ~(derived.isna() & expected.isna())
+    if mismatches.any():
+        raise AssertionError(
+            f"{mismatches.sum()} rows differ, e.g. {values[mismatches].iloc[0]!r}"
+        )
+
+    logger.info(
+        f"{len(values):,} rows: row-wise {row_wise_rate:,.0f} rows/s, "
+        f"vectorised {vectorised_rate:,.0f} rows/s"
+    )
+    return {"row_wise": row_wise_rate, "vectorised": vectorised_rate}
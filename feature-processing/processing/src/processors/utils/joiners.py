@@ -1,3 +1,4 @@
+from abc import abstractmethod
 from functools import reduce
 from typing import Literal
 
@@ -6,7 +7,18 @@ import pandas as pd
 from processing.abcs.processor import Processor
 
 
-class MultiJoin(Processor):
+class Joiner(Processor):
+    """Joins frames pairwise, so they can be folded in as they are loaded."""
+
+    @abstractmethod
+    def combine(self, left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        pass
+
+    def transform(self, dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        return reduce(self.combine, dfs)
+
+
+class MultiJoin(Joiner):
     def __init__(
         self,
         on: list[str],
@@ -18,19 +30,17 @@ class MultiJoin(Processor):
         self.suffixes = suffixes
         self.how = how
 
-    def transform(self, dfs: list[pd.DataFrame]) -> pd.DataFrame:
-        return reduce(
-            lambda left, right: pd.merge(
-                left, right, on=self.on, how=self.how, suffixes=self.suffixes
-            ),
-            dfs,
-        )
+    def combine(self, left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        return pd.merge(left, right, on=self.on, how=self.how, suffixes=self.suffixes)
 
 
-class Concat(Processor):
+class Concat(Joiner):
     def __init__(self, axis: int = 0) -> None:
         super().__init__(None)
         self.axis = axis
 
+    def combine(self, left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        return pd.concat([left, right], axis=self.axis)
+
     def transform(self, dfs: list[pd.DataFrame]) -> pd.DataFrame:
         return pd.concat(dfs, axis=self.axis)
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processing.src.processors.fbref import helpers
+from processing.src.processors.fbref.age_range import AGE_EDGES, AGE_RANGES
+from processing.src.processors.fbref.general_pos import POSITIONS
+from processing.src.processors.utils import derive
+
+
+def age_range(ages: pd.Series) -> pd.Series:
+    return derive.bin_category(ages, AGE_EDGES, AGE_RANGES)
+
+
+def general_pos(positions: pd.Series) -> pd.Series:
+    return derive.prefix_category(positions, POSITIONS)
+
+
+def test_prefix_category_matches_get_position():
+    positions = pd.Series(
+        ["DF", "MF", "FW", "GK", "DF,MF", "FW,MF", "MF,FW", "GK", "", "X", np.nan],
+        index=range(10, 21),
+        name="pos",
+    )
+
+    derived = general_pos(positions)
+
+    assert derived.tolist() == positions.apply(helpers.get_position).tolist()
+    assert derived.index.equals(positions.index)
+    assert derived.name == "pos"
+
+
+def test_prefix_category_puts_default_last():
+    derived = general_pos(pd.Series(["FW", "DF"]))
+
+    assert list(derived.cat.categories) == [*POSITIONS.values(), "Unknown"]
+
+
+def test_prefix_category_first_prefix_wins():
+    derived = derive.prefix_category(
+        pd.Series(["DF", "D"]), {"DF": "Full", "D": "Short"}
+    )
+
+    assert derived.tolist() == ["Full", "Short"]
+
+
+@pytest.mark.parametrize("age", [*range(10, 50), 19.5, 24.99, 40.0])
+def test_bin_category_matches_get_age_range(age):
+    derived = age_range(pd.Series([age]))
+
+    assert derived.iloc[0] == helpers.get_age_range(age)
+
+
+def test_bin_category_is_ordered():
+    derived = age_range(pd.Series([42, 18]))
+
+    assert derived.cat.ordered
+    assert list(derived.cat.categories) == AGE_RANGES
+    assert derived.sort_values().tolist() == ["Under 20", "Over 40"]
+
+
+def test_bin_category_leaves_missing_ages_missing():
+    # get_age_range files a missing age under "Over 40"
+    assert helpers.get_age_range(np.nan) == "Over 40"
+
+    derived = age_range(pd.Series([np.nan, "unknown", "27"]))
+
+    assert derived.isna().tolist() == [True, True, False]
+    assert derived.iloc[2] == "25-29"
+
+
+def test_benchmark_accepts_matching_derivations():
+    positions = pd.Series(["DF", np.nan])
+
+    rates = derive.benchmark(general_pos, helpers.get_position, positions)
+
+    assert set(rates) == {"row_wise", "vectorised"}
+
+
+def test_benchmark_flags_rows_missing_from_one_output():
+    with pytest.raises(AssertionError, match="1 rows differ"):
+        derive.benchmark(age_range, helpers.get_age_range, pd.Series([25, np.nan]))
@@ -0,0 +1,62 @@
+"""The storage backends and artifact formats are copied into each package, since
+the packages are built and deployed separately. These tests fail as soon as a
+copy drifts from the others."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BACKENDS = [
+    "feature-processing/processing/gcp/backends.py",
+    "feature-pipeline/feature_pipeline/utilities/backends.py",
+    "analytics/analysis/gcp/backends.py",
+    "app-backend/app/gcp/backends.py",
+]
+
+FORMATS = [
+    "feature-processing/processing/core/formats.py",
+    "feature-pipeline/feature_pipeline/utilities/formats.py",
+    "analytics/analysis/core/formats.py",
+]
+
+# app-backend reads its own settings keys
+SETTINGS_KEYS = {
+    "APP_BACKEND_GCP_PROJECT": "GOOGLE_CLOUD_PROJECT",
+    "APP_BACKEND_GCP_SERVICE_ACCOUNT_JSON_PATH": "GOOGLE_CLOUD_SERVICE_ACCOUNT_JSON_PATH",
+}
+
+PACKAGE_IMPORT = re.compile(
+    r"^from (processing|feature_pipeline|analysis|app)\.[\w.]+ import", re.MULTILINE
+)
+
+
+def split_header(path: str) -> tuple[str, str]:
+    header, body = (ROOT / path).read_text().split("\n\n", 1)
+    return header, body
+
+
+def normalise(path: str) -> str:
+    _, body = split_header(path)
+    body = PACKAGE_IMPORT.sub("from <package> import", body)
+    for key, shared in SETTINGS_KEYS.items():
+        body = body.replace(key, shared)
+    return body
+
+
+@pytest.mark.parametrize("copies", [BACKENDS, FORMATS], ids=["backends", "formats"])
+def test_copies_match(copies: list[str]) -> None:
+    first, *rest = copies
+    for path in rest:
+        assert normalise(path) == normalise(first), f"{path} differs from {first}"
+
+
+@pytest.mark.parametrize("copies", [BACKENDS, FORMATS], ids=["backends", "formats"])
+def test_headers_name_other_copies(copies: list[str]) -> None:
+    for path in copies:
+        header, _ = split_header(path)
+        for other in copies:
+            if other != path:
+                assert other in header, f"{path} header does not name {other}"